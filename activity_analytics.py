@@ -0,0 +1,184 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+class ActivityAnalytics:
+    """Splits, best efforts, heart-rate zones and grade-adjusted pace for imported tracks, cached per activity"""
+    
+    # Bump when the analysis changes so cached results are recomputed
+    VERSION = 1
+    
+    SPLIT_METERS = 1000
+    BEST_EFFORTS = {'1k': 1000, '5k': 5000, '10k': 10000}
+    
+    # Grade-adjusted pace follows running energy cost, so it is only given for foot activities
+    GAP_ACTIVITIES = ['running', 'walking']
+    GRADE_LIMIT = 0.45
+    ELEVATION_SMOOTHING = 5
+    
+    # Activities shown as speed rather than pace
+    SPEED_ACTIVITIES = ['cycling']
+    
+    def __init__(self):
+        self.initialize_analytics_data()
+    
+    def initialize_analytics_data(self):
+        """Initialize per-activity cache"""
+        if 'activity_analytics' not in st.session_state:
+            st.session_state.activity_analytics = {'results': {}, 'version': 0, 'monthly': {}}
+    
+    def key(self, entry):
+        """Cache key for a workout entry"""
+        return entry.get('source_id') or f"{entry.get('date')}:{entry.get('timestamp')}:{entry.get('workout')}"
+    
+    def activities(self):
+        """Analysis of every workout with a track, oldest first; new activities are analyzed once and cached"""
+        cache = st.session_state.activity_analytics
+        results = []
+        for entry in st.session_state.get('workout_history', []):
+            if not entry.get('track') or not entry.get('distance'):
+                continue
+            key = self.key(entry)
+            result = cache['results'].get(key)
+            if result is None or result['version'] != self.VERSION:
+                result = cache['results'][key] = self.analyze(entry)
+                cache['version'] += 1
+            results.append(result)
+        return sorted(results, key=lambda r: (r['date'], r['timestamp']))
+    
+    def analyze(self, entry):
+        """Splits, best efforts, zones and grade-adjusted pace for one activity"""
+        track = entry['track']
+        times = np.array(track['time'], dtype=float)
+        distance = np.array(track['distance'], dtype=float)
+        
+        # Distance only ever grows; the first sample at each distance marks when it was reached
+        first = np.concatenate([[True], np.diff(distance) > 0])
+        reach_distance, reach_time = distance[first], times[first]
+        
+        return {
+            'version': self.VERSION,
+            'key': self.key(entry),
+            'workout': entry.get('workout'),
+            'date': entry['date'],
+            'timestamp': entry.get('timestamp', ''),
+            'activity': entry.get('activity') or str(entry.get('type', '')).lower(),
+            'distance': entry['distance'],
+            'moving_minutes': entry.get('duration', 0),
+            'pace': entry.get('pace'),
+            'gap': self.grade_adjusted_pace(entry, distance, track.get('ele')),
+            'elevation_gain': entry.get('elevation_gain', 0),
+            'splits': self.splits(reach_distance, reach_time),
+            'best_efforts': self.best_efforts(distance, times, reach_distance, reach_time),
+            'hr_zones': entry.get('hr_zones') or {},
+            'avg_hr': entry.get('avg_hr')
+        }
+    
+    def splits(self, distance, times):
+        """Seconds for each full kilometre, then the partial last one"""
+        if len(distance) < 2:
+            return []
+        boundaries = np.arange(self.SPLIT_METERS, distance[-1] + 1, self.SPLIT_METERS)
+        marks = np.concatenate([[0.0], np.interp(boundaries, distance, times)])
+        splits = [{'km': i + 1, 'meters': self.SPLIT_METERS, 'seconds': float(s)} for i, s in enumerate(np.diff(marks))]
+        
+        rest = distance[-1] - (boundaries[-1] if len(boundaries) else 0)
+        if rest >= 50:
+            splits.append({'km': len(splits) + 1, 'meters': float(rest), 'seconds': float(times[-1] - marks[-1])})
+        return splits
+    
+    def best_efforts(self, distance, times, reach_distance, reach_time):
+        """Fastest time over each target distance, sliding a window over the cumulative distance"""
+        efforts = {}
+        if len(reach_distance) < 2:
+            return efforts
+        
+        for name, meters in self.BEST_EFFORTS.items():
+            # Every sample is a candidate start; the finish is when start + target distance is first reached
+            starts = np.flatnonzero(distance + meters <= reach_distance[-1])
+            if not len(starts):
+                continue
+            finish = np.interp(distance[starts] + meters, reach_distance, reach_time)
+            durations = finish - times[starts]
+            best = int(np.argmin(durations))
+            efforts[name] = {'seconds': float(durations[best]), 'start_km': round(float(distance[starts[best]]) / 1000, 2)}
+        return efforts
+    
+    def grade_adjusted_pace(self, entry, distance, elevation):
+        """Pace on flat ground for the same effort (Minetti energy cost of running on a grade)"""
+        if entry.get('activity') not in self.GAP_ACTIVITIES or not entry.get('pace'):
+            return None
+        
+        elevation = np.array([np.nan if e is None else e for e in elevation or []], dtype=float)
+        known = np.isfinite(elevation)
+        if known.sum() < 2:
+            return entry['pace']
+        
+        elevation = np.interp(np.arange(len(elevation)), np.flatnonzero(known), elevation[known])
+        if len(elevation) > self.ELEVATION_SMOOTHING:
+            kernel = np.ones(self.ELEVATION_SMOOTHING) / self.ELEVATION_SMOOTHING
+            elevation = np.convolve(np.pad(elevation, self.ELEVATION_SMOOTHING // 2, mode='edge'), kernel, mode='valid')
+        
+        steps = np.diff(distance)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            grade = np.clip(np.where(steps > 0, np.diff(elevation) / steps, 0), -self.GRADE_LIMIT, self.GRADE_LIMIT)
+        cost = 155.4 * grade ** 5 - 30.4 * grade ** 4 - 43.3 * grade ** 3 + 46.3 * grade ** 2 + 19.5 * grade + 3.6
+        
+        # Flat-ground metres that would take the same energy
+        flat_km = float((steps * cost / 3.6).sum()) / 1000
+        return round(entry['pace'] * entry['distance'] / flat_km, 2) if flat_km > 0 else entry['pace']
+    
+    def monthly(self, activity):
+        """Distance, pace, grade-adjusted pace, best efforts and zone time per month for one activity type"""
+        results = [r for r in self.activities() if r['activity'] == activity]
+        cache = st.session_state.activity_analytics['monthly']
+        key = (activity, st.session_state.activity_analytics['version'], len(results))
+        if activity in cache and cache[activity][0] == key:
+            return cache[activity][1]
+        
+        rows = []
+        for r in results:
+            row = {
+                'month': r['date'][:7],
+                'distance': r['distance'],
+                'minutes': r['moving_minutes'],
+                'gap_minutes': (r['gap'] or r['pace'] or 0) * r['distance'],
+                'elevation_gain': r['elevation_gain'],
+                'zone_seconds': sum(r['hr_zones'].values()),
+                'hard_seconds': sum(v for k, v in r['hr_zones'].items() if k[:2] in ('Z4', 'Z5'))
+            }
+            for name in self.BEST_EFFORTS:
+                row[name] = r['best_efforts'].get(name, {}).get('seconds', np.nan)
+            rows.append(row)
+        
+        if not rows:
+            monthly = pd.DataFrame()
+        else:
+            frame = pd.DataFrame(rows)
+            aggregations = {'distance': 'sum', 'minutes': 'sum', 'gap_minutes': 'sum', 'elevation_gain': 'sum',
+                            'zone_seconds': 'sum', 'hard_seconds': 'sum', 'activities': ('distance', 'size')}
+            aggregations.update({name: 'min' for name in self.BEST_EFFORTS})
+            monthly = frame.groupby('month').agg(
+                **{column: (how if isinstance(how, tuple) else (column, how)) for column, how in aggregations.items()}
+            )
+            # Distance-weighted averages, so long activities count for more than short ones
+            monthly['pace'] = monthly['minutes'] / monthly['distance']
+            monthly['gap'] = monthly['gap_minutes'] / monthly['distance']
+            monthly['hard_share'] = np.where(monthly['zone_seconds'] > 0, monthly['hard_seconds'] / monthly['zone_seconds'].clip(lower=1), np.nan)
+        
+        cache[activity] = (key, monthly)
+        return monthly
+    
+    def format_duration(self, seconds):
+        """'m:ss' or 'h:mm:ss'"""
+        seconds = int(round(seconds))
+        hours, rest = divmod(seconds, 3600)
+        return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}"
+    
+    def format_pace(self, pace, activity):
+        """Pace as 'm:ss /km', or speed in km/h for activities measured by speed"""
+        if not pace:
+            return "—"
+        if activity in self.SPEED_ACTIVITIES:
+            return f"{60 / pace:.1f} km/h"
+        return f"{self.format_duration(pace * 60)} /km"
\ No newline at end of file
@@ -0,0 +1,137 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from datetime import date
+from daily_rollups import DailyRollups
+
+class ActivityCalendar:
+    """Year-at-a-glance calendar heatmaps of daily rollup metrics"""
+    
+    # label -> (rollup metric, unit, colorscale)
+    METRICS = {
+        'Workouts': ('workout_count', 'workouts', 'Greens'),
+        'Calories Burned': ('workout_calories', 'kcal', 'Oranges'),
+        'Active Minutes': ('workout_minutes', 'min', 'Greens'),
+        'Water': ('water', 'glasses', 'Blues'),
+        'Sleep': ('sleep_hours', 'hours', 'Purples')
+    }
+    
+    WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    # A calendar year spans at most 54 week columns
+    WEEKS = 54
+    
+    # Ordinal of 1970-01-01, the epoch of numpy datetime64 day counts
+    EPOCH = date(1970, 1, 1).toordinal()
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_calendar_data()
+    
+    def initialize_calendar_data(self):
+        """Initialize calendar figure cache"""
+        if 'activity_calendar' not in st.session_state:
+            st.session_state.activity_calendar = {}
+    
+    def years_shown(self, years):
+        """Calendar years covered, newest last; `years` of None means the whole history"""
+        first, _ = self.rollups.day_range()
+        last_year = date.fromordinal(self.rollups.today_ordinal()).year
+        first_year = date.fromordinal(first).year
+        if years:
+            first_year = max(first_year, last_year - years + 1)
+        return list(range(first_year, last_year + 1))
+    
+    def grid(self, metric, years=None):
+        """Values laid out as (year, weekday, week of year), NaN where there is no day or no data"""
+        self.rollups.sync()
+        shown = self.years_shown(years)
+        start = date(shown[0], 1, 1).toordinal()
+        end = self.rollups.today_ordinal()
+        
+        # Days with nothing logged stay NaN, so the heatmap leaves them blank rather than showing 0
+        values = self.rollups.series(metric, start, end, missing=np.nan)
+        
+        # Calendar position of every day, computed for the whole range at once
+        days = np.arange(start, end + 1) - self.EPOCH
+        day64 = days.astype('datetime64[D]')
+        year = day64.astype('datetime64[Y]').astype(int) + 1970
+        jan1 = day64.astype('datetime64[Y]').astype('datetime64[D]').astype(int)
+        weekday = (days + 3) % 7
+        week = (days - jan1 + (jan1 + 3) % 7) // 7
+        cell = ((year - shown[0]) * 7 + weekday) * self.WEEKS + week
+        
+        size = len(shown) * 7 * self.WEEKS
+        logged = ~np.isnan(values)
+        totals = np.bincount(cell, weights=np.where(logged, values, 0), minlength=size)
+        present = np.bincount(cell, weights=logged, minlength=size)
+        
+        dates = np.full(size, '', dtype=object)
+        dates[cell] = np.datetime_as_string(day64)
+        
+        shape = (len(shown), 7, self.WEEKS)
+        grid = np.where(present > 0, totals, np.nan).reshape(shape)
+        return shown, grid, dates.reshape(shape)
+    
+    def figure(self, label, years=None):
+        """Heatmap figure for a metric, cached until the data or the day changes"""
+        metric, unit, colorscale = self.METRICS[label]
+        key = (self.rollups.sync(), self.rollups.today_ordinal())
+        
+        cached = st.session_state.activity_calendar.get((label, years))
+        if cached and cached['key'] == key:
+            return cached['figure']
+        
+        shown, grid, dates = self.grid(metric, years)
+        peak = np.nanmax(grid) if np.isfinite(grid).any() else 1
+        
+        fig = make_subplots(rows=len(shown), cols=1, subplot_titles=[str(y) for y in shown],
+                            vertical_spacing=min(0.08, 0.3 / len(shown)))
+        
+        # Approximate first week of each month for the axis labels
+        month_ticks = [int(m * 30.44 / 7) for m in range(12)]
+        
+        for i, year in enumerate(shown):
+            fig.add_trace(go.Heatmap(
+                z=grid[i],
+                x=list(range(self.WEEKS)),
+                y=self.WEEKDAYS,
+                customdata=dates[i],
+                colorscale=colorscale,
+                zmin=0,
+                zmax=max(peak, 1e-9),
+                xgap=2,
+                ygap=2,
+                showscale=i == 0,
+                colorbar=dict(title=unit),
+                hovertemplate=f"%{{customdata}}<br>%{{z:.1f}} {unit}<extra></extra>"
+            ), row=i + 1, col=1)
+            
+            fig.update_xaxes(tickvals=month_ticks, ticktext=self.MONTHS, showgrid=False, row=i + 1, col=1)
+            fig.update_yaxes(autorange='reversed', showgrid=False, row=i + 1, col=1)
+        
+        fig.update_layout(
+            title=f"{label} by Day",
+            height=60 + 170 * len(shown),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white')
+        )
+        
+        st.session_state.activity_calendar[(label, years)] = {'key': key, 'figure': fig}
+        return fig
+    
+    def render(self):
+        """Render the metric and range pickers with the calendar"""
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            label = st.selectbox("Calendar Metric", list(self.METRICS), key="calendar_metric")
+        
+        with col2:
+            ranges = {'This Year': 1, 'Last 2 Years': 2, 'Last 3 Years': 3, 'All Time': None}
+            years = ranges[st.selectbox("Calendar Range", list(ranges), key="calendar_range")]
+        
+        st.plotly_chart(self.figure(label, years), use_container_width=True)
\ No newline at end of file
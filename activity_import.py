@@ -0,0 +1,389 @@
+import streamlit as st
+import numpy as np
+import struct
+import os
+import xml.etree.ElementTree as ET
+from array import array
+from datetime import datetime, timezone
+from day_tracker import DayTracker
+from calorie_engine import CalorieEngine
+
+class ActivityImporter:
+    """GPX, TCX and FIT activity files parsed point by point into workout summaries with downsampled tracks"""
+    
+    FORMATS = ['gpx', 'tcx', 'fit']
+    TRACK_COLUMNS = ['time', 'lat', 'lon', 'ele', 'hr', 'dist']
+    
+    EARTH_RADIUS = 6371008.8
+    
+    # Points kept per stored track, spread evenly over the activity
+    TRACK_POINTS = 500
+    
+    # Slower than this (m/s) counts as stopped; longer gaps between samples count as a pause
+    MOVING_SPEED = 0.5
+    MAX_GAP = 30
+    
+    # Samples averaged before summing climbs, so GPS noise does not add up to elevation gain
+    ELEVATION_SMOOTHING = 5
+    
+    # Lower bounds of heart-rate zones 1-5 as a share of maximum heart rate
+    HR_ZONES = [0.5, 0.6, 0.7, 0.8, 0.9]
+    ZONE_NAMES = ['Z1 Recovery', 'Z2 Endurance', 'Z3 Tempo', 'Z4 Threshold', 'Z5 Max']
+    
+    # Speeds (km/h) where Moderate, Hard and Very Hard begin, for the calorie estimate
+    SPEED_INTENSITY = {
+        'walking': [4.0, 5.5, 6.5],
+        'running': [8.0, 10.0, 12.0],
+        'cycling': [16.0, 20.0, 25.0],
+        'swimming': [2.0, 3.0, 4.0],
+        'rowing': [8.0, 10.0, 12.0]
+    }
+    
+    ACTIVITY_NAMES = {'walking': 'Walk', 'running': 'Run', 'cycling': 'Ride', 'swimming': 'Swim', 'rowing': 'Row'}
+    
+    # GPX/TCX element -> track column, filled while inside a track point
+    XML_FIELDS = {
+        'time': 'time', 'Time': 'time',
+        'ele': 'ele', 'AltitudeMeters': 'ele',
+        'LatitudeDegrees': 'lat', 'LongitudeDegrees': 'lon',
+        'hr': 'hr', 'Value': 'hr',
+        'DistanceMeters': 'dist'
+    }
+    
+    # FIT protocol: seconds from the Unix epoch to 1989-12-31 and degrees per semicircle
+    FIT_EPOCH = 631065600
+    SEMICIRCLES = 180 / 2 ** 31
+    FIT_RECORD = 20
+    FIT_SESSION = 18
+    FIT_SPORTS = {1: 'running', 2: 'cycling', 5: 'swimming', 11: 'walking', 15: 'rowing', 17: 'walking'}
+    
+    # FIT base type -> struct code, and the value each code uses for "no data"
+    FIT_TYPES = {0x00: 'B', 0x01: 'b', 0x02: 'B', 0x83: 'h', 0x84: 'H', 0x85: 'i', 0x86: 'I', 0x88: 'f',
+                 0x89: 'd', 0x0A: 'B', 0x8B: 'H', 0x8C: 'I', 0x0D: 'B', 0x8E: 'q', 0x8F: 'Q', 0x90: 'Q'}
+    FIT_INVALID = {'B': 0xFF, 'b': 0x7F, 'H': 0xFFFF, 'h': 0x7FFF, 'I': 0xFFFFFFFF, 'i': 0x7FFFFFFF}
+    
+    # Record fields: field number -> (column, scale, offset)
+    FIT_FIELDS = {
+        253: ('time', 1, 0),
+        0: ('lat', 1 / SEMICIRCLES, 0),
+        1: ('lon', 1 / SEMICIRCLES, 0),
+        2: ('ele', 5, 500),
+        78: ('ele', 5, 500),
+        3: ('hr', 1, 0),
+        5: ('dist', 100, 0)
+    }
+    
+    def import_files(self, files):
+        """Import uploaded files into the workout history; returns (added entries, skipped duplicates, errors)"""
+        history = st.session_state.setdefault('workout_history', [])
+        known = {w.get('source_id') for w in history if w.get('source_id')}
+        
+        added, skipped, errors = [], 0, []
+        for file in files:
+            try:
+                entry = self.import_file(file)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            if entry['source_id'] in known:
+                skipped += 1
+                continue
+            known.add(entry['source_id'])
+            history.append(entry)
+            added.append(entry)
+        
+        return added, skipped, errors
+    
+    def import_file(self, file):
+        """Parse one GPX, TCX or FIT file into a workout history entry"""
+        name = getattr(file, 'name', '') or ''
+        fmt = os.path.splitext(name)[1].lstrip('.').lower()
+        if fmt not in self.FORMATS:
+            raise ValueError(f"{name}: unsupported file type (use {', '.join(self.FORMATS).upper()})")
+        
+        try:
+            track, meta = self.parse_fit(file) if fmt == 'fit' else self.parse_xml(file)
+            return self.summarize(track, meta, fmt)
+        except (ValueError, ET.ParseError, struct.error, KeyError, IndexError) as e:
+            raise ValueError(f"{name}: could not read the file ({e})")
+    
+    def parse_xml(self, file):
+        """Stream GPX/TCX track points into column arrays without building the document tree"""
+        columns = {column: array('d') for column in self.TRACK_COLUMNS}
+        meta = {'name': None, 'sport': None, 'calories': 0}
+        point = None
+        segment = None
+        
+        for event, elem in ET.iterparse(file, events=('start', 'end')):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                if tag in ('trkpt', 'Trackpoint'):
+                    point = {'lat': elem.get('lat'), 'lon': elem.get('lon')}
+                elif tag in ('trkseg', 'Track'):
+                    segment = elem
+                elif tag == 'Activity':
+                    meta['sport'] = elem.get('Sport')
+                continue
+            
+            if point is not None:
+                if tag in ('trkpt', 'Trackpoint'):
+                    self.add_xml_point(columns, point)
+                    point = None
+                    # Points already read are dropped, so memory stays flat however long the track is
+                    segment.clear()
+                elif tag in self.XML_FIELDS:
+                    point[self.XML_FIELDS[tag]] = elem.text
+            elif tag == 'name' and meta['name'] is None:
+                meta['name'] = (elem.text or '').strip() or None
+            elif tag == 'type' and meta['sport'] is None:
+                meta['sport'] = elem.text
+            elif tag == 'Calories':
+                meta['calories'] += int(float(elem.text or 0))
+        
+        return {column: np.frombuffer(values, dtype=float) for column, values in columns.items()}, meta
+    
+    def add_xml_point(self, columns, point):
+        """Append one track point, NaN for anything it lacks"""
+        for column in self.TRACK_COLUMNS:
+            text = point.get(column)
+            if column == 'time':
+                value = self.parse_time(text) if text else np.nan
+            else:
+                try:
+                    value = float(text)
+                except (TypeError, ValueError):
+                    value = np.nan
+            columns[column].append(value)
+    
+    def parse_time(self, text):
+        """Unix seconds for an ISO 8601 time (UTC when no offset is given)"""
+        try:
+            moment = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+        except ValueError:
+            return np.nan
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment.timestamp()
+    
+    def parse_fit(self, file):
+        """Read FIT messages one at a time, collecting the raw bytes of record messages for a vectorized decode"""
+        header = file.read(12)
+        if len(header) < 12 or header[8:12] != b'.FIT':
+            raise ValueError("not a FIT file")
+        remaining = struct.unpack('<I', header[4:8])[0]
+        file.read(header[0] - 12)
+        
+        read = file.read
+        meta = {'name': None, 'sport': None, 'calories': 0}
+        definitions = {}
+        # One segment per record definition: (definition, raw bytes, message numbers, time offsets)
+        segments = []
+        message = 0
+        
+        while remaining > 0:
+            head = read(1)
+            if not head:
+                break
+            head = head[0]
+            remaining -= 1
+            
+            if head & 0x80:
+                # Compressed timestamp header: a 5-bit offset from the previous timestamp
+                definition = definitions[(head >> 5) & 0x03]
+                offset = head & 0x1F
+            elif head & 0x40:
+                fixed = read(5)
+                fields = read(3 * fixed[4])
+                remaining -= 5 + 3 * fixed[4]
+                developer = 0
+                if head & 0x20:
+                    count = read(1)[0]
+                    developer = sum(read(3 * count)[1::3])
+                    remaining -= 1 + 3 * count
+                definitions[head & 0x0F] = self.fit_definition(fixed, fields, developer)
+                continue
+            else:
+                definition = definitions[head & 0x0F]
+                offset = -1
+            
+            data = read(definition['size'])
+            remaining -= definition['size']
+            message += 1
+            
+            if definition['global'] == self.FIT_RECORD:
+                if definition['segment'] is None:
+                    definition['segment'] = (definition, bytearray(), array('q'), array('b'))
+                    segments.append(definition['segment'])
+                _, raw, messages, offsets = definition['segment']
+                raw.extend(data)
+                messages.append(message)
+                offsets.append(offset)
+            elif definition['global'] == self.FIT_SESSION:
+                values = dict(zip(definition['numbers'], struct.unpack(definition['format'], data)))
+                meta['sport'] = meta['sport'] or self.FIT_SPORTS.get(values.get(5))
+                if values.get(11) not in (None, 0xFFFF):
+                    meta['calories'] += values[11]
+        
+        return self.decode_fit_records(segments), meta
+    
+    def fit_definition(self, fixed, fields, developer):
+        """Struct layout and numpy dtype for a definition message"""
+        endian = '>' if fixed[1] else '<'
+        numbers, codes, dtype = [], [], []
+        for i in range(0, len(fields), 3):
+            number, size, base = fields[i], fields[i + 1], fields[i + 2]
+            code = self.FIT_TYPES.get(base)
+            if code is None or struct.calcsize(code) != size:
+                # Arrays and strings are skipped
+                code = f'{size}s'
+            numbers.append(number)
+            codes.append(code)
+            dtype.append((f'f{i // 3}', endian + code if not code.endswith('s') else f'V{size}'))
+        if developer:
+            dtype.append(('developer', f'V{developer}'))
+        
+        layout = endian + ''.join(codes) + (f'{developer}x' if developer else '')
+        return {
+            'global': struct.unpack(endian + 'H', fixed[2:4])[0],
+            'numbers': numbers,
+            'codes': codes,
+            'format': layout,
+            'dtype': np.dtype(dtype),
+            'size': struct.calcsize(layout),
+            'segment': None
+        }
+    
+    def decode_fit_records(self, segments):
+        """Decode the collected record messages into track columns in message order"""
+        parts = []
+        for definition, raw, messages, offsets in segments:
+            rows = np.frombuffer(bytes(raw), dtype=definition['dtype'])
+            part = {column: np.full(len(rows), np.nan) for column in self.TRACK_COLUMNS}
+            for i, (number, code) in enumerate(zip(definition['numbers'], definition['codes'])):
+                if number not in self.FIT_FIELDS or code not in self.FIT_INVALID:
+                    continue
+                column, scale, offset = self.FIT_FIELDS[number]
+                values = rows[f'f{i}']
+                decoded = np.where(values == self.FIT_INVALID[code], np.nan, values / scale - offset)
+                # Enhanced altitude wins over the plain field when both are present
+                part[column] = np.where(np.isnan(decoded), part[column], decoded)
+            part['message'] = np.frombuffer(messages, dtype=np.int64)
+            part['offset'] = np.frombuffer(offsets, dtype=np.int8)
+            parts.append(part)
+        
+        if not parts:
+            return {column: np.zeros(0) for column in self.TRACK_COLUMNS}
+        
+        order = np.argsort(np.concatenate([p['message'] for p in parts]), kind='stable')
+        track = {column: np.concatenate([p[column] for p in parts])[order] for column in self.TRACK_COLUMNS}
+        
+        # Compressed timestamps count on from the previous record's time
+        offsets = np.concatenate([p['offset'] for p in parts])[order]
+        for i in np.flatnonzero(offsets >= 0):
+            if i > 0 and np.isfinite(track['time'][i - 1]):
+                last = int(track['time'][i - 1])
+                stamp = (last & ~0x1F) + int(offsets[i])
+                if int(offsets[i]) < (last & 0x1F):
+                    stamp += 0x20
+                track['time'][i] = stamp
+        track['time'] = track['time'] + self.FIT_EPOCH
+        return track
+    
+    def haversine(self, lat1, lon1, lat2, lon2):
+        """Great-circle distance in metres between arrays of points"""
+        lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        return 2 * self.EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1)))
+    
+    def summarize(self, track, meta, fmt):
+        """Distance, pace, elevation gain, heart-rate zones and a downsampled track as a workout entry"""
+        valid = np.isfinite(track['time'])
+        order = np.argsort(track['time'][valid], kind='stable')
+        columns = {column: values[valid][order] for column, values in track.items()}
+        times = columns['time']
+        if len(times) < 2:
+            raise ValueError("the file has no timed track points")
+        
+        # Step distances from positions, or from the device's distance when there are none (indoor)
+        steps = np.zeros(len(times))
+        positioned = np.flatnonzero(np.isfinite(columns['lat']) & np.isfinite(columns['lon']))
+        if len(positioned) > 1:
+            steps[positioned[1:]] = self.haversine(columns['lat'][positioned[:-1]], columns['lon'][positioned[:-1]],
+                                                   columns['lat'][positioned[1:]], columns['lon'][positioned[1:]])
+        elif np.isfinite(columns['dist']).any():
+            device = np.fmax.accumulate(np.nan_to_num(columns['dist']))
+            steps[1:] = np.diff(device)
+        distance = np.cumsum(steps)
+        
+        gaps = np.diff(times, prepend=times[0])
+        counted = np.minimum(gaps, self.MAX_GAP)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            moving = steps / np.where(gaps > 0, gaps, np.inf) >= self.MOVING_SPEED
+        moving_seconds = float(counted[moving].sum()) if moving.any() else float(counted.sum())
+        km = distance[-1] / 1000
+        
+        elevation = columns['ele'][np.isfinite(columns['ele'])]
+        gain = 0.0
+        if len(elevation) > self.ELEVATION_SMOOTHING:
+            smoothed = np.convolve(elevation, np.ones(self.ELEVATION_SMOOTHING) / self.ELEVATION_SMOOTHING, mode='valid')
+            gain = float(np.clip(np.diff(smoothed), 0, None).sum())
+        
+        heart = np.isfinite(columns['hr']) & (columns['hr'] > 0)
+        avg_hr = max_hr = None
+        zones = [0] * len(self.ZONE_NAMES)
+        if heart.any() and counted[heart].sum() > 0:
+            avg_hr = int(round(np.average(columns['hr'][heart], weights=counted[heart])))
+            max_hr = int(columns['hr'][heart].max())
+            age = st.session_state.get('profile_data', {}).get('personal', {}).get('age') or 30
+            zone = np.digitize(columns['hr'][heart] / (208 - 0.7 * age), self.HR_ZONES)
+            zones = np.bincount(zone, weights=counted[heart], minlength=len(self.HR_ZONES) + 1)[1:].round().astype(int).tolist()
+        
+        engine = CalorieEngine()
+        minutes = max(1, int(round(moving_seconds / 60)))
+        speed = km / (moving_seconds / 3600) if moving_seconds else 0
+        activity = engine.activity(meta['sport'])
+        if activity not in self.SPEED_INTENSITY:
+            # No usable sport in the file, so go by speed
+            activity = 'cycling' if speed > 18 else 'running' if speed > 7 else 'walking'
+        intensity = engine.INTENSITIES[int(np.searchsorted(self.SPEED_INTENSITY[activity], speed, side='right'))]
+        
+        if meta['calories']:
+            calories, source = int(meta['calories']), 'device'
+        else:
+            calories, source = engine.estimate(activity, minutes, intensity, heart_rate=avg_hr), 'estimated'
+        
+        start = datetime.fromtimestamp(times[0], DayTracker().get_timezone())
+        part_of_day = 'Morning' if start.hour < 12 else 'Afternoon' if start.hour < 17 else 'Evening'
+        
+        keep = np.unique(np.linspace(0, len(times) - 1, min(len(times), self.TRACK_POINTS)).round().astype(int))
+        rounded = lambda values, digits: [None if not np.isfinite(v) else round(float(v), digits) for v in values[keep]]
+        
+        return {
+            'date': start.strftime('%Y-%m-%d'),
+            'timestamp': start.strftime('%H:%M'),
+            'workout': meta['name'] or f"{part_of_day} {self.ACTIVITY_NAMES[activity]}",
+            'type': activity.title(),
+            'activity': activity,
+            'duration': minutes,
+            'elapsed': int(round((times[-1] - times[0]) / 60)),
+            'distance': round(float(km), 2),
+            'pace': round(float(moving_seconds / 60 / km), 2) if km > 0 else None,
+            'elevation_gain': round(gain),
+            'avg_hr': avg_hr,
+            'max_hr': max_hr,
+            'hr_zones': dict(zip(self.ZONE_NAMES, zones)),
+            'intensity': intensity,
+            'calories': calories,
+            'calories_source': source,
+            'source': fmt,
+            'source_id': f"{fmt}:{int(times[0])}",
+            'track': {
+                'time': (times[keep] - times[0]).round().astype(int).tolist(),
+                'distance': distance[keep].round().astype(int).tolist(),
+                'lat': rounded(columns['lat'], 6),
+                'lon': rounded(columns['lon'], 6),
+                'ele': rounded(columns['ele'], 1),
+                'hr': rounded(columns['hr'], 0)
+            },
+            'completed': True
+        }
\ No newline at end of file
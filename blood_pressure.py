@@ -0,0 +1,175 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from daily_rollups import to_ordinal, from_ordinal
+from day_tracker import DayTracker
+
+class BloodPressure:
+    """Blood pressure readings with vectorized category thresholds"""
+    
+    # ACC/AHA 2017 guideline, checked from most to least severe: (category, systolic bound, diastolic bound,
+    # '>=' or '>' to compare with the bounds); either value over its bound is enough.
+    # Crisis is above 180/120, strict so fractional readings and averages just over it count.
+    THRESHOLDS = [
+        ('Hypertensive Crisis', 180, 120, '>'),
+        ('High (Stage 2)', 140, 90, '>='),
+        ('High (Stage 1)', 130, 80, '>='),
+        ('Elevated', 120, None, '>=')
+    ]
+    # Stamped on each reading; bump when THRESHOLDS change so stored readings are recategorized
+    CURRENT_VERSION = 2
+    DEFAULT_CATEGORY = 'Normal'
+    
+    CATEGORY_COLORS = {
+        'Normal': '#00FF87',
+        'Elevated': '#FFD700',
+        'High (Stage 1)': '#FFA500',
+        'High (Stage 2)': '#FF4444',
+        'Hypertensive Crisis': '#B00020'
+    }
+    
+    def __init__(self):
+        self.initialize_bp_data()
+    
+    def initialize_bp_data(self):
+        """Initialize blood pressure data"""
+        if 'blood_pressure_data' not in st.session_state:
+            st.session_state.blood_pressure_data = []
+    
+    def classify(self, systolic, diastolic):
+        """Categorize arrays of systolic/diastolic readings in one pass"""
+        systolic = np.asarray(systolic, dtype=float)
+        diastolic = np.asarray(diastolic, dtype=float)
+        
+        conditions = []
+        for _, sys_bound, dia_bound, compare in self.THRESHOLDS:
+            above = np.greater if compare == '>' else np.greater_equal
+            high_sys = above(systolic, sys_bound) if sys_bound is not None else np.zeros(systolic.shape, dtype=bool)
+            high_dia = above(diastolic, dia_bound) if dia_bound is not None else np.zeros(diastolic.shape, dtype=bool)
+            conditions.append(high_sys | high_dia)
+        
+        return np.select(conditions, [rule[0] for rule in self.THRESHOLDS], default=self.DEFAULT_CATEGORY)
+    
+    def get_category(self, systolic, diastolic):
+        """Get the current category for a single reading"""
+        return str(self.classify(systolic, diastolic))
+    
+    def log_reading(self, systolic, diastolic, when=None):
+        """Log a single reading"""
+        when = when or DayTracker().now()
+        self.import_readings([{
+            'date': when.strftime('%Y-%m-%d'),
+            'timestamp': when.strftime('%H:%M'),
+            'systolic': systolic,
+            'diastolic': diastolic
+        }])
+    
+    def import_readings(self, readings):
+        """Append a batch of readings, categorizing them all at once"""
+        readings = [dict(r) for r in readings if r.get('systolic') and r.get('diastolic')]
+        if not readings:
+            return 0
+        
+        categories = self.classify(
+            [r['systolic'] for r in readings],
+            [r['diastolic'] for r in readings]
+        )
+        
+        for reading, category in zip(readings, categories):
+            reading['category'] = str(category)
+            reading['category_version'] = self.CURRENT_VERSION
+        
+        st.session_state.blood_pressure_data.extend(readings)
+        return len(readings)
+    
+    def import_csv(self, file):
+        """Import readings from a CSV with date, systolic and diastolic columns"""
+        data = pd.read_csv(file)
+        data.columns = [c.strip().lower() for c in data.columns]
+        missing = {'date', 'systolic', 'diastolic'} - set(data.columns)
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+        
+        dates = pd.to_datetime(data['date'], errors='coerce')
+        valid = dates.notna()
+        readings = pd.DataFrame({
+            'date': dates[valid].dt.strftime('%Y-%m-%d'),
+            'timestamp': dates[valid].dt.strftime('%H:%M'),
+            'systolic': pd.to_numeric(data['systolic'][valid], errors='coerce'),
+            'diastolic': pd.to_numeric(data['diastolic'][valid], errors='coerce')
+        }).dropna()
+        
+        return self.import_readings(readings.to_dict('records'))
+    
+    def recategorize(self):
+        """Recompute stored categories made under older thresholds"""
+        readings = st.session_state.blood_pressure_data
+        stale = [i for i, r in enumerate(readings) if r.get('category_version') != self.CURRENT_VERSION]
+        if not stale:
+            return 0
+        
+        categories = self.classify(
+            [readings[i].get('systolic', 0) for i in stale],
+            [readings[i].get('diastolic', 0) for i in stale]
+        )
+        
+        for i, category in zip(stale, categories):
+            readings[i]['category'] = str(category)
+            readings[i]['category_version'] = self.CURRENT_VERSION
+        
+        return len(stale)
+    
+    def daily_averages(self):
+        """Average systolic and diastolic per day on a dense day axis"""
+        readings = st.session_state.blood_pressure_data
+        ordinals, systolic, diastolic = [], [], []
+        
+        for reading in readings:
+            try:
+                ordinals.append(to_ordinal(reading['date']))
+                systolic.append(float(reading['systolic']))
+                diastolic.append(float(reading['diastolic']))
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        if not ordinals:
+            return None
+        
+        ordinals = np.array(ordinals)
+        first = ordinals.min()
+        last = max(ordinals.max(), DayTracker().now().date().toordinal())
+        index = ordinals - first
+        
+        counts = np.bincount(index, minlength=last - first + 1)
+        return {
+            'first': first,
+            'counts': counts,
+            'systolic': np.bincount(index, weights=systolic, minlength=last - first + 1),
+            'diastolic': np.bincount(index, weights=diastolic, minlength=last - first + 1)
+        }
+    
+    def rolling_averages(self, window):
+        """Rolling N-day average readings and their categories, one row per day with data in range"""
+        daily = self.daily_averages()
+        if daily is None:
+            return pd.DataFrame(columns=['date', 'systolic', 'diastolic', 'category'])
+        
+        # Window sums from cumulative sums; days without readings simply add nothing
+        def rolling_sum(values):
+            cumulative = np.concatenate([np.zeros(window), np.cumsum(values)])
+            return cumulative[window:] - cumulative[:-window]
+        
+        counts = rolling_sum(daily['counts'])
+        has_data = counts > 0
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            systolic = rolling_sum(daily['systolic']) / counts
+            diastolic = rolling_sum(daily['diastolic']) / counts
+        
+        days = np.flatnonzero(has_data)
+        return pd.DataFrame({
+            'date': [from_ordinal(daily['first'] + d) for d in days],
+            'systolic': np.round(systolic[has_data], 1),
+            'diastolic': np.round(diastolic[has_data], 1),
+            'category': self.classify(systolic[has_data], diastolic[has_data])
+        })
\ No newline at end of file
@@ -0,0 +1,177 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import to_ordinal, from_ordinal
+from day_tracker import DayTracker
+
+class BodyLog:
+    """Weight and body-composition log with an exponentially smoothed trend"""
+    
+    MEASUREMENTS = ['weight', 'body_fat', 'waist']
+    
+    # Share of the gap between trend and a new reading closed per day
+    SMOOTHING = 0.1
+    
+    def __init__(self):
+        self.initialize_body_data()
+    
+    def initialize_body_data(self):
+        """Initialize body log data"""
+        if 'body_log' not in st.session_state:
+            st.session_state.body_log = []
+        
+        if 'body_trend' not in st.session_state:
+            st.session_state.body_trend = self.empty_trend()
+    
+    def empty_trend(self):
+        """Trend state with nothing processed yet"""
+        return {
+            'seen': 0,
+            'version': 0,
+            'series': {m: {'days': [], 'raw': [], 'counts': [], 'trend': []} for m in self.MEASUREMENTS}
+        }
+    
+    def log(self, weight=None, body_fat=None, waist=None, when=None, source=None):
+        """Log a set of body measurements (any of them may be left out)"""
+        when = when or DayTracker().now()
+        entry = {
+            'date': when.strftime('%Y-%m-%d'),
+            'timestamp': when.strftime('%H:%M'),
+            'weight': weight,
+            'body_fat': body_fat,
+            'waist': waist
+        }
+        if source:
+            entry['source'] = source
+        
+        st.session_state.body_log.append(entry)
+        self.sync()
+        
+        # The profile shows the weight as entered, not the day's average of readings
+        if weight and 'profile_data' in st.session_state:
+            st.session_state.profile_data['personal']['weight'] = weight
+        
+        return entry
+    
+    def record_profile_weight(self, weight):
+        """Log a weight saved from the profile form; a later save the same day corrects that reading"""
+        entries = [e for e in st.session_state.body_log if e.get('weight')]
+        last = entries[-1] if entries else None
+        
+        if last is not None and last.get('source') == 'profile' and last['date'] == DayTracker().today():
+            if abs(last['weight'] - weight) >= 0.05:
+                last['weight'] = weight
+                self.rebuild()
+        elif last is None or abs(last['weight'] - weight) >= 0.05:
+            self.log(weight=weight, source='profile')
+        
+        if 'profile_data' in st.session_state:
+            st.session_state.profile_data['personal']['weight'] = weight
+    
+    def sync(self):
+        """Fold new log entries into the trend and return the trend version"""
+        state = st.session_state.body_trend
+        entries = st.session_state.body_log
+        
+        if len(entries) < state['seen']:
+            state = self.rebuild()
+        
+        for entry in entries[state['seen']:]:
+            try:
+                ordinal = to_ordinal(entry['date'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            
+            for measurement in self.MEASUREMENTS:
+                value = entry.get(measurement)
+                if not value:
+                    continue
+                
+                series = state['series'][measurement]
+                if series['days'] and ordinal < series['days'][-1]:
+                    # Back-dated entry, so the smoothing has to be replayed in order
+                    state = self.rebuild()
+                    return state['version']
+                
+                self.add_point(series, ordinal, float(value))
+            
+            state['version'] += 1
+        
+        state['seen'] = len(entries)
+        return state['version']
+    
+    def rebuild(self):
+        """Recompute the trend from the whole log in date order"""
+        version = st.session_state.body_trend['version']
+        state = st.session_state.body_trend = self.empty_trend()
+        
+        rows = []
+        for entry in st.session_state.body_log:
+            try:
+                rows.append((to_ordinal(entry['date']), entry.get('timestamp', ''), entry))
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        for ordinal, _, entry in sorted(rows, key=lambda row: row[:2]):
+            for measurement in self.MEASUREMENTS:
+                if entry.get(measurement):
+                    self.add_point(state['series'][measurement], ordinal, float(entry[measurement]))
+        
+        state['seen'] = len(st.session_state.body_log)
+        state['version'] = version + 1
+        return state
+    
+    def add_point(self, series, ordinal, value):
+        """Add one reading to a measurement's daily series and advance its trend"""
+        if series['days'] and series['days'][-1] == ordinal:
+            # Another reading on the same day: average it in and redo that day's step
+            count = series['counts'][-1] + 1
+            series['raw'][-1] += (value - series['raw'][-1]) / count
+            series['counts'][-1] = count
+            series['trend'][-1] = self.step(series, len(series['days']) - 1)
+            return
+        
+        series['days'].append(ordinal)
+        series['raw'].append(value)
+        series['counts'].append(1)
+        series['trend'].append(0.0)
+        series['trend'][-1] = self.step(series, len(series['days']) - 1)
+    
+    def step(self, series, i):
+        """Trend value at point i from the trend at point i-1"""
+        if i == 0:
+            return series['raw'][0]
+        
+        # Longer gaps between readings let the trend move further towards the new value
+        gap = series['days'][i] - series['days'][i - 1]
+        weight = 1 - (1 - self.SMOOTHING) ** gap
+        return series['trend'][i - 1] + weight * (series['raw'][i] - series['trend'][i - 1])
+    
+    def history(self, measurement='weight', days=None):
+        """Readings and trend for a measurement as (dates, raw, trend)"""
+        self.sync()
+        series = st.session_state.body_trend['series'][measurement]
+        day_array = np.array(series['days'], dtype=int)
+        raw = np.array(series['raw'])
+        trend = np.array(series['trend'])
+        
+        if days is not None and len(day_array):
+            keep = day_array > DayTracker().now().date().toordinal() - days
+            day_array, raw, trend = day_array[keep], raw[keep], trend[keep]
+        
+        return [from_ordinal(d) for d in day_array], raw, trend
+    
+    def latest(self, measurement='weight'):
+        """Most recent reading of a measurement, if any"""
+        self.sync()
+        raw = st.session_state.body_trend['series'][measurement]['raw']
+        return raw[-1] if raw else None
+    
+    def latest_trend(self, measurement='weight'):
+        """Current smoothed value of a measurement, if any"""
+        self.sync()
+        trend = st.session_state.body_trend['series'][measurement]['trend']
+        return trend[-1] if trend else None
+    
+    def version(self):
+        """Version that changes whenever the trend does"""
+        return self.sync()
\ No newline at end of file
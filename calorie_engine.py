@@ -0,0 +1,222 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import DailyRollups, to_ordinal
+from body_log import BodyLog
+from day_tracker import DayTracker
+from personal_records import PersonalRecords
+
+class CalorieEngine:
+    """Calories burned from MET values per activity and intensity, body weight and heart rate when known"""
+    
+    # Bump when the tables or formulas change so logged workouts are re-estimated
+    MODEL_VERSION = 1
+    
+    INTENSITIES = ['Light', 'Moderate', 'Hard', 'Very Hard']
+    
+    # activity -> MET at each intensity (Compendium of Physical Activities)
+    ACTIVITIES = {
+        'walking': [2.8, 3.5, 4.3, 5.0],
+        'running': [6.0, 8.3, 10.5, 12.8],
+        'cycling': [4.0, 6.8, 8.0, 10.0],
+        'rowing': [4.8, 7.0, 8.5, 12.0],
+        'swimming': [5.8, 7.0, 8.3, 10.0],
+        'hiit': [4.3, 6.0, 8.0, 10.0],
+        'cardio': [4.0, 5.5, 7.3, 9.0],
+        'strength': [3.5, 5.0, 6.0, 7.0],
+        'core': [2.8, 3.8, 5.0, 6.0],
+        'yoga': [2.3, 2.8, 4.0, 5.0],
+        'mobility': [2.3, 2.5, 3.0, 3.5],
+        'general': [3.5, 4.8, 6.5, 8.0]
+    }
+    
+    # Keywords looked for in a workout's type and name, first match wins
+    KEYWORDS = [
+        ('crunch', 'core'), ('walk', 'walking'), ('hik', 'walking'), ('run', 'running'), ('jog', 'running'),
+        ('cycl', 'cycling'), ('bik', 'cycling'), ('ride', 'cycling'), ('rowing', 'rowing'),
+        ('swim', 'swimming'), ('hiit', 'hiit'), ('interval', 'hiit'), ('circuit', 'hiit'),
+        ('fat burn', 'hiit'), ('yoga', 'yoga'), ('stretch', 'mobility'), ('mobility', 'mobility'),
+        ('flexib', 'mobility'), ('recovery', 'mobility'), ('core', 'core'), ('abs', 'core'),
+        ('strength', 'strength'), ('weight', 'strength'), ('upper', 'strength'), ('lower', 'strength'),
+        ('full body', 'strength'), ('legs', 'strength'), ('cardio', 'cardio'), ('endurance', 'cardio')
+    ]
+    
+    # Catalog movement pattern -> activity (other patterns are strength work, locomotion goes by name)
+    PATTERNS = {
+        'plyometric': 'hiit',
+        'anti_extension': 'core',
+        'rotation': 'core',
+        'flexion': 'core',
+        'mobility': 'mobility'
+    }
+    
+    # Keytel et al. (2005) heart-rate model: (intercept, heart rate, weight, age) in kJ/min
+    KEYTEL = {
+        'male': (-55.0969, 0.6309, 0.1988, 0.2017),
+        'female': (-20.4022, 0.4472, -0.1263, 0.074)
+    }
+    
+    # The heart-rate model is only fitted for exercising heart rates
+    MIN_HEART_RATE = 90
+    
+    # Logged calories from these sources are kept as they are
+    KEEP_SOURCES = ['manual', 'device']
+    
+    def __init__(self):
+        self.body_log = BodyLog()
+        self.initialize_calorie_data()
+    
+    def initialize_calorie_data(self):
+        """Initialize re-estimation state"""
+        if 'calorie_model' not in st.session_state:
+            st.session_state.calorie_model = {'key': None, 'reestimated': 0}
+    
+    def activity(self, text, pattern=None):
+        """Activity for a workout type or name, or for a catalog exercise's movement pattern"""
+        if pattern and pattern != 'locomotion':
+            return self.PATTERNS.get(pattern, 'strength')
+        
+        text = (text or '').lower()
+        for keyword, activity in self.KEYWORDS:
+            if keyword in text:
+                return activity
+        return 'cardio' if pattern else 'general'
+    
+    def intensity_level(self, intensity):
+        """Position on the Light..Very Hard scale (0-3) for a label or a 1-10 rating; Moderate if unknown"""
+        if intensity in self.INTENSITIES:
+            return float(self.INTENSITIES.index(intensity))
+        if isinstance(intensity, (int, float)) and not isinstance(intensity, bool):
+            # 1 = Light, 4 = Moderate, 7 = Hard, 10 = Very Hard
+            return float(np.clip((intensity - 1) / 3, 0, 3))
+        return 1.0
+    
+    def met(self, activity, intensity=None):
+        """MET value for an activity at an intensity"""
+        return float(self.mets([activity], [self.intensity_level(intensity)])[0])
+    
+    def mets(self, activities, levels):
+        """MET values for arrays of activities and intensity levels, interpolated between the table columns"""
+        names = list(self.ACTIVITIES)
+        table = np.array(list(self.ACTIVITIES.values()))
+        rows = np.array([names.index(a) if a in self.ACTIVITIES else names.index('general') for a in activities], dtype=int)
+        levels = np.clip(np.asarray(levels, dtype=float), 0, len(self.INTENSITIES) - 1)
+        
+        low = np.floor(levels).astype(int)
+        high = np.minimum(low + 1, len(self.INTENSITIES) - 1)
+        share = levels - low
+        return table[rows, low] * (1 - share) + table[rows, high] * share
+    
+    def profile(self):
+        """Current weight (smoothed), age and sex from the body log and profile"""
+        personal = st.session_state.get('profile_data', {}).get('personal', {})
+        weight = self.body_log.latest_trend('weight') or personal.get('weight') or 70
+        sex = str(personal.get('gender', '')).lower()
+        return float(weight), float(personal.get('age') or 30), sex if sex in self.KEYTEL else None
+    
+    def weights_on(self, ordinals):
+        """Trend weight in effect on each day ordinal (the first reading before the log starts)"""
+        dates, _, trend = self.body_log.history('weight')
+        if not len(trend):
+            return np.full(len(ordinals), self.profile()[0])
+        
+        days = np.array([to_ordinal(d) for d in dates])
+        index = np.searchsorted(days, np.asarray(ordinals), side='right') - 1
+        return trend[np.maximum(index, 0)]
+    
+    def estimate_many(self, activities, minutes, levels, weights, heart_rates=None, age=None, sex=None):
+        """Calories for arrays of workouts; heart rates (NaN when unknown) switch to the Keytel model"""
+        minutes = np.asarray(minutes, dtype=float)
+        weights = np.broadcast_to(np.asarray(weights, dtype=float), minutes.shape)
+        
+        # ACSM: kcal/min = MET x 3.5 ml O2/kg/min x kg / 200
+        calories = self.mets(activities, levels) * 3.5 * weights / 200 * minutes
+        
+        if heart_rates is not None and age is not None:
+            heart_rates = np.asarray(heart_rates, dtype=float)
+            models = [self.KEYTEL[sex]] if sex else list(self.KEYTEL.values())
+            
+            # Without a known sex, average the two models
+            per_minute = np.mean([(a + b * heart_rates + c * weights + d * age) / 4.184 for a, b, c, d in models], axis=0)
+            usable = (heart_rates >= self.MIN_HEART_RATE) & (per_minute > 0)
+            calories = np.where(usable, per_minute * minutes, calories)
+        
+        return np.maximum(calories, 0)
+    
+    def estimate(self, activity, minutes, intensity=None, heart_rate=None, weight=None):
+        """Calories for one workout; the activity may be a key or any workout type/name"""
+        if activity not in self.ACTIVITIES:
+            activity = self.activity(activity)
+        
+        current, age, sex = self.profile()
+        calories = self.estimate_many(
+            [activity], [minutes], [self.intensity_level(intensity)], weight or current,
+            heart_rates=[np.nan if heart_rate is None else heart_rate], age=age, sex=sex
+        )
+        return int(round(calories[0]))
+    
+    def estimate_entries(self, entries):
+        """Calories for a batch of workout history entries (by 'activity', else type/name), each at the weight logged around its date"""
+        if not entries:
+            return np.zeros(0)
+        
+        _, age, sex = self.profile()
+        today = DayTracker().now().date().toordinal()
+        
+        # Many entries share a type/name, so classify each distinct text once
+        activities = {}
+        names, minutes, levels, ordinals, heart_rates = [], [], [], [], []
+        for entry in entries:
+            if entry.get('activity') in self.ACTIVITIES:
+                names.append(entry['activity'])
+            else:
+                text = ' '.join(str(entry.get(k) or '') for k in ('type', 'workout', 'name'))
+                if text not in activities:
+                    activities[text] = self.activity(text)
+                names.append(activities[text])
+            minutes.append(entry.get('duration') or 0)
+            levels.append(self.intensity_level(entry.get('intensity')))
+            heart_rates.append(entry.get('avg_hr') or np.nan)
+            try:
+                ordinals.append(to_ordinal(entry['date']))
+            except (KeyError, TypeError, ValueError):
+                ordinals.append(today)
+        
+        return self.estimate_many(names, minutes, levels, self.weights_on(ordinals),
+                                  heart_rates=heart_rates, age=age, sex=sex)
+    
+    def model_key(self):
+        """Everything the estimates depend on besides the entries themselves"""
+        _, age, sex = self.profile()
+        return (self.MODEL_VERSION, self.body_log.version(), age, sex)
+    
+    def sync(self):
+        """Re-estimate logged workouts when the model, the weight log or the profile changed"""
+        state = st.session_state.calorie_model
+        key = self.model_key()
+        if state['key'] == key:
+            return 0
+        
+        state['key'] = key
+        return self.reestimate_history()
+    
+    def reestimate_history(self):
+        """Rewrite the calories of every workout not logged by hand or by a device; returns how many changed"""
+        history = st.session_state.get('workout_history', [])
+        entries = [w for w in history if w.get('calories_source') not in self.KEEP_SOURCES and w.get('duration')]
+        if not entries:
+            return 0
+        
+        changed = 0
+        for entry, calories in zip(entries, self.estimate_entries(entries).round().astype(int).tolist()):
+            if entry.get('calories') != calories:
+                entry['calories'] = calories
+                changed += 1
+        
+        if changed:
+            # Calories were edited in place, so rebuild the rollups, calorie records and trends that read them
+            DailyRollups().invalidate('workout_history')
+            PersonalRecords().refold('most_calories')
+            st.session_state.pop('trend_signals', None)
+            st.session_state.calorie_model['reestimated'] += changed
+        
+        return changed
\ No newline at end of file
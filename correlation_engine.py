@@ -0,0 +1,153 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import DailyRollups
+
+class CorrelationEngine:
+    """Lagged correlations between daily series from every tracker, aligned on one day axis"""
+    
+    # metric -> display label
+    SERIES = {
+        'sleep_hours': 'Sleep Hours',
+        'sleep_quality': 'Sleep Quality',
+        'water': 'Water Intake',
+        'calories_in': 'Calories Eaten',
+        'protein': 'Protein',
+        'workout_minutes': 'Workout Minutes',
+        'workout_calories': 'Workout Calories',
+        'mood_score': 'Mood',
+        'stress_level': 'Stress'
+    }
+    
+    # Nutrition totals are only meaningful on days something was logged
+    NEEDS_LOG = {
+        'calories_in': 'meal_count',
+        'protein': 'meal_count'
+    }
+    
+    # Metrics that come from the same log entries and correlate trivially
+    SAME_SOURCE = [
+        {'sleep_hours', 'sleep_quality'},
+        {'calories_in', 'protein'},
+        {'workout_minutes', 'workout_calories'}
+    ]
+    
+    MAX_LAG = 3
+    MIN_PAIRS = 14
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_correlation_data()
+    
+    def initialize_correlation_data(self):
+        """Initialize correlation cache"""
+        if 'correlation_cache' not in st.session_state:
+            st.session_state.correlation_cache = {}
+    
+    def aligned_matrix(self, days=None):
+        """Daily values of every series as a (days, series) matrix, NaN where nothing was logged"""
+        first, last = self.rollups.day_range()
+        start = first if days is None else max(first, last - days + 1)
+        
+        columns = []
+        for metric in self.SERIES:
+            values = self.rollups.series(metric, start, last)
+            if metric in self.NEEDS_LOG:
+                logged = self.rollups.series(self.NEEDS_LOG[metric], start, last) > 0
+                values = np.where(logged, values, np.nan)
+            columns.append(values)
+        
+        return np.column_stack(columns)
+    
+    def get_correlations(self, days=None):
+        """Correlation matrices for lags 0..MAX_LAG, cached per data version and window"""
+        version = self.rollups.sync()
+        cache = st.session_state.correlation_cache
+        
+        cached = cache.get(days)
+        if cached and cached['version'] == version:
+            return cached['result']
+        
+        result = self.lagged_correlations(self.aligned_matrix(days))
+        cache[days] = {'version': version, 'result': result}
+        return result
+    
+    def lagged_correlations(self, matrix):
+        """Pairwise-complete Pearson correlations of day t against day t+lag
+        
+        Returns 'r' and 'n' arrays shaped (lags, series, series) where [lag, i, j]
+        relates series i on a day to series j `lag` days later.
+        """
+        mask = ~np.isnan(matrix)
+        values = np.where(mask, matrix, 0.0)
+        lags = min(self.MAX_LAG, max(len(matrix) - 1, 0)) + 1
+        size = matrix.shape[1]
+        
+        r = np.full((self.MAX_LAG + 1, size, size), np.nan)
+        n = np.zeros((self.MAX_LAG + 1, size, size))
+        
+        for lag in range(lags):
+            a, a_mask = values[:len(values) - lag], mask[:len(mask) - lag]
+            b, b_mask = values[lag:], mask[lag:]
+            
+            # Every sum is taken only over days where both series were logged
+            count = a_mask.T.astype(float) @ b_mask
+            sum_a = a.T @ b_mask
+            sum_b = a_mask.T.astype(float) @ b
+            sum_aa = (a * a).T @ b_mask
+            sum_bb = a_mask.T.astype(float) @ (b * b)
+            sum_ab = a.T @ b
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cov = sum_ab - sum_a * sum_b / count
+                var_a = sum_aa - sum_a ** 2 / count
+                var_b = sum_bb - sum_b ** 2 / count
+                corr = cov / np.sqrt(var_a * var_b)
+            
+            corr[(count < self.MIN_PAIRS) | (var_a <= 1e-9) | (var_b <= 1e-9)] = np.nan
+            r[lag] = np.clip(corr, -1, 1)
+            n[lag] = count
+        
+        return {'r': r, 'n': n, 'metrics': list(self.SERIES)}
+    
+    def get_insights(self, days=None, top=5, threshold=0.2):
+        """Strongest cross-domain relationships as plain-language insights"""
+        result = self.get_correlations(days)
+        metrics = result['metrics']
+        r = result['r'].copy()
+        
+        # Drop self and same-source pairs on the same day, and a series against its own future
+        for i, a in enumerate(metrics):
+            for j, b in enumerate(metrics):
+                if i == j:
+                    r[:, i, j] = np.nan
+                elif any({a, b} <= group for group in self.SAME_SOURCE):
+                    r[0, i, j] = np.nan
+        
+        # Same-day correlations are symmetric, so only keep one half
+        r[0][np.tril_indices(len(metrics))] = np.nan
+        
+        strength = np.nan_to_num(np.abs(r), nan=0)
+        order = np.argsort(strength, axis=None)[::-1]
+        
+        insights = []
+        for flat in order[:top]:
+            lag, i, j = np.unravel_index(flat, r.shape)
+            if strength[lag, i, j] < threshold:
+                break
+            
+            direction = 'higher' if r[lag, i, j] > 0 else 'lower'
+            a, b = self.SERIES[metrics[i]], self.SERIES[metrics[j]]
+            if lag == 0:
+                text = f"On days with higher {a.lower()}, {b.lower()} tends to be {direction}"
+            else:
+                when = 'the next day' if lag == 1 else f"{lag} days later"
+                text = f"After days with higher {a.lower()}, {b.lower()} tends to be {direction} {when}"
+            
+            insights.append({
+                'text': text,
+                'r': float(r[lag, i, j]),
+                'lag': int(lag),
+                'days': int(result['n'][lag, i, j])
+            })
+        
+        return insights
\ No newline at end of file
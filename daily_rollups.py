@@ -0,0 +1,336 @@
+import streamlit as st
+import numpy as np
+from datetime import date
+from day_tracker import DayTracker
+from hydration import HydrationModel
+
+# Numeric scale for logged moods (0 = worst, 5 = best)
+MOOD_VALUES = {
+    'happy': 5,
+    'energized': 4,
+    'neutral': 3,
+    'tired': 2,
+    'sad': 1,
+    'angry': 0
+}
+
+def to_ordinal(day):
+    """Convert a 'YYYY-MM-DD' string or date to a day ordinal"""
+    if isinstance(day, str):
+        return date.fromisoformat(day[:10]).toordinal()
+    return day.toordinal()
+
+def from_ordinal(ordinal):
+    """Convert a day ordinal back to a 'YYYY-MM-DD' string"""
+    return date.fromordinal(int(ordinal)).strftime('%Y-%m-%d')
+
+class DailyRollups:
+    """Per-day metric arrays on a shared day-ordinal axis, built incrementally from the session logs"""
+    
+    # metric -> (session state source, field or extractor, aggregation)
+    # 'sum' adds values, 'mean' averages them, 'last' keeps the latest, 'count' counts entries
+    METRICS = {
+        'sleep_hours': ('sleep_history', 'hours', 'last'),
+        'sleep_quality': ('sleep_history', 'quality', 'last'),
+        'water': ('daily_counters', 'water', 'last'),
+        'mood_score': ('mood_history', lambda m: MOOD_VALUES.get(m.get('mood'), 3), 'mean'),
+        'stress_level': ('stress_history', 'level', 'mean'),
+        'workout_count': ('workout_history', None, 'count'),
+        'workout_minutes': ('workout_history', 'duration', 'sum'),
+        'workout_calories': ('workout_history', 'calories', 'sum'),
+        'workout_water_ml': ('workout_history', lambda w: HydrationModel().workout_water_ml(w), 'sum'),
+        'calories_in': ('nutrition_logs', 'calories', 'sum'),
+        'protein': ('nutrition_logs', 'protein', 'sum'),
+        'carbs': ('nutrition_logs', 'carbs', 'sum'),
+        'fat': ('nutrition_logs', 'fat', 'sum'),
+        'meal_count': ('nutrition_logs', None, 'count')
+    }
+    
+    def __init__(self):
+        self.initialize_rollup_data()
+    
+    def initialize_rollup_data(self):
+        """Initialize rollup storage"""
+        if 'daily_rollups' not in st.session_state:
+            st.session_state.daily_rollups = {
+                'origin': None,
+                'length': 0,
+                'values': {metric: np.zeros(0) for metric in self.METRICS},
+                'counts': {metric: np.zeros(0) for metric in self.METRICS},
+                'day_version': np.zeros(0, dtype=np.int64),
+                'seen': {},
+                'version': 0,
+                # Cumulative sums per metric, valid for the first prefix_valid days
+                'prefix': {metric: np.zeros(1) for metric in self.METRICS},
+                'logged_prefix': {metric: np.zeros(1, dtype=np.int64) for metric in self.METRICS},
+                'prefix_valid': {metric: 0 for metric in self.METRICS}
+            }
+    
+    @property
+    def store(self):
+        return st.session_state.daily_rollups
+    
+    def sources(self):
+        """Get the metrics fed by each source"""
+        sources = {}
+        for metric, (source, _, _) in self.METRICS.items():
+            sources.setdefault(source, []).append(metric)
+        return sources
+    
+    def sync(self):
+        """Fold any new log entries into the daily arrays and return the data version"""
+        for source, metrics in self.sources().items():
+            if source == 'daily_counters':
+                self.sync_counters(metrics)
+                continue
+            
+            entries = st.session_state.get(source, [])
+            seen = self.store['seen'].get(source, 0)
+            
+            if len(entries) < seen:
+                # Entries were removed, so rebuild this source from scratch
+                self.reset_metrics(metrics)
+                seen = 0
+            
+            if len(entries) > seen:
+                self.add_entries(entries[seen:], metrics)
+                self.store['seen'][source] = len(entries)
+        
+        return self.store['version']
+    
+    def sync_counters(self, metrics):
+        """Copy day tracker counters that changed since the last sync"""
+        counters = st.session_state.get('daily_counters', {})
+        dirty = st.session_state.setdefault('dirty_counter_days', set())
+        
+        if not self.store['seen'].get('daily_counters'):
+            # First sync (or a forced rebuild) picks up every stored day
+            dirty.update(counters)
+            self.store['seen']['daily_counters'] = 1
+        
+        if not dirty:
+            return
+        
+        entries = [dict(counters[day], date=day) for day in sorted(dirty) if day in counters]
+        dirty.clear()
+        self.add_entries(entries, metrics)
+    
+    def invalidate(self, source):
+        """Force a full rebuild of a source, e.g. after entries were edited in place"""
+        self.store['seen'][source] = 0
+        self.reset_metrics(self.sources().get(source, []))
+    
+    def reset_metrics(self, metrics):
+        """Zero out the arrays of the given metrics"""
+        for metric in metrics:
+            self.store['values'][metric][:] = 0
+            self.store['counts'][metric][:] = 0
+            self.store['prefix_valid'][metric] = 0
+        
+        self.store['version'] += 1
+        self.store['day_version'][:] = self.store['version']
+    
+    def add_entries(self, entries, metrics):
+        """Aggregate a batch of entries into their days"""
+        rows = []
+        for entry in entries:
+            try:
+                rows.append((to_ordinal(entry['date']), entry))
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        if not rows:
+            return
+        
+        ordinals = np.array([ordinal for ordinal, _ in rows])
+        self.ensure_range(ordinals.min(), ordinals.max())
+        index = ordinals - self.store['origin']
+        
+        for metric in metrics:
+            _, field, how = self.METRICS[metric]
+            values = self.store['values'][metric]
+            counts = self.store['counts'][metric]
+            
+            # Cumulative sums from the earliest touched day onwards are stale now
+            self.store['prefix_valid'][metric] = min(self.store['prefix_valid'][metric], int(index.min()))
+            
+            if how == 'count':
+                np.add.at(counts, index, 1)
+                continue
+            
+            extracted = np.array([self.extract(entry, field) for _, entry in rows], dtype=float)
+            valid = ~np.isnan(extracted)
+            
+            if how == 'last':
+                # Later entries overwrite earlier ones for the same day
+                values[index[valid]] = extracted[valid]
+                counts[index[valid]] = 1
+            else:
+                np.add.at(values, index[valid], extracted[valid])
+                np.add.at(counts, index[valid], 1)
+        
+        self.store['version'] += 1
+        self.store['day_version'][np.unique(index)] = self.store['version']
+    
+    def extract(self, entry, field):
+        """Pull a numeric value out of a log entry"""
+        value = field(entry) if callable(field) else entry.get(field)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return np.nan
+    
+    def ensure_range(self, first, last):
+        """Grow the day axis so it covers first..last"""
+        store = self.store
+        first, last = int(first), int(last)
+        
+        if store['origin'] is None:
+            store['origin'] = first
+        
+        origin = min(store['origin'], first)
+        prepend = store['origin'] - origin
+        length = max(store['origin'] + store['length'] - 1, last) - origin + 1
+        if prepend == 0 and length <= store['length']:
+            return
+        
+        capacity = len(store['day_version'])
+        if prepend or length > capacity:
+            # Double the capacity so appending new days stays amortized O(1)
+            new_capacity = max(length, capacity * 2, 64)
+            for key in ('values', 'counts'):
+                for metric, array in store[key].items():
+                    grown = np.zeros(new_capacity)
+                    grown[prepend:prepend + store['length']] = array[:store['length']]
+                    store[key][metric] = grown
+            
+            grown = np.zeros(new_capacity, dtype=np.int64)
+            grown[prepend:prepend + store['length']] = store['day_version'][:store['length']]
+            store['day_version'] = grown
+        
+        if prepend:
+            # Every cumulative sum shifts when days are added in front
+            for metric in store['prefix_valid']:
+                store['prefix_valid'][metric] = 0
+        
+        store['origin'] = origin
+        store['length'] = length
+    
+    def today_ordinal(self):
+        """Today's ordinal in the user's timezone"""
+        return DayTracker().now().date().toordinal()
+    
+    def day_range(self):
+        """First and last ordinal covered by the store (last is at least today)"""
+        store = self.store
+        today = self.today_ordinal()
+        if store['origin'] is None:
+            return today, today
+        return store['origin'], max(today, store['origin'] + store['length'] - 1)
+    
+    def series(self, metric, start=None, end=None, missing=None):
+        """Get a metric's daily values for start..end ordinals (inclusive)
+        
+        Days without data are `missing`, by default 0 for 'sum'/'count' metrics and NaN for 'mean'/'last'.
+        """
+        first, last = self.day_range()
+        start = first if start is None else int(start)
+        end = last if end is None else int(end)
+        
+        _, _, how = self.METRICS[metric]
+        if missing is None:
+            missing = 0.0 if how in ('sum', 'count') else np.nan
+        result = np.full(max(0, end - start + 1), missing)
+        if self.store['origin'] is None or len(result) == 0:
+            return result
+        
+        # Overlap between the requested window and the stored span
+        lo = max(start, self.store['origin'])
+        hi = min(end, self.store['origin'] + self.store['length'] - 1)
+        if lo > hi:
+            return result
+        
+        src = slice(lo - self.store['origin'], hi - self.store['origin'] + 1)
+        dst = slice(lo - start, hi - start + 1)
+        values = self.store['values'][metric][src]
+        counts = self.store['counts'][metric][src]
+        
+        if how == 'count':
+            result[dst] = np.where(counts > 0, counts, missing)
+        elif how == 'sum':
+            result[dst] = np.where(counts > 0, values, missing)
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[dst] = np.where(counts > 0, values / np.where(counts > 0, counts, 1), missing)
+        
+        return result
+    
+    def prefix(self, metric):
+        """Cumulative daily values and logged-day counts, extended from the first stale day on demand
+        
+        prefix[i] covers the first i stored days, so appending a day only computes that day.
+        """
+        store = self.store
+        length = store['length']
+        valid = store['prefix_valid'][metric]
+        values = store['prefix'][metric]
+        logged = store['logged_prefix'][metric]
+        
+        if valid >= length:
+            return values, logged
+        
+        if len(values) < length + 1:
+            # Double the capacity so appending new days stays amortized O(1)
+            capacity = max(length + 1, 2 * len(values))
+            values = np.concatenate([values, np.zeros(capacity - len(values))])
+            logged = np.concatenate([logged, np.zeros(capacity - len(logged), dtype=np.int64)])
+            store['prefix'][metric] = values
+            store['logged_prefix'][metric] = logged
+        
+        _, _, how = self.METRICS[metric]
+        counts = store['counts'][metric][valid:length]
+        if how == 'count':
+            daily = counts
+        elif how == 'sum':
+            daily = store['values'][metric][valid:length]
+        else:
+            daily = np.where(counts > 0, store['values'][metric][valid:length] / np.maximum(counts, 1), 0)
+        
+        values[valid + 1:length + 1] = values[valid] + np.cumsum(daily)
+        logged[valid + 1:length + 1] = logged[valid] + np.cumsum(counts > 0)
+        store['prefix_valid'][metric] = length
+        return values, logged
+    
+    def window(self, metric, start, end):
+        """Sum of daily values and number of days with data over start..end ordinals (inclusive)
+        
+        For 'mean'/'last' metrics the sum is over the daily values, so divide by the days for an average.
+        """
+        if self.store['origin'] is None:
+            return 0.0, 0
+        
+        values, logged = self.prefix(metric)
+        length = self.store['length']
+        lo = min(max(int(start) - self.store['origin'], 0), length)
+        hi = min(max(int(end) - self.store['origin'] + 1, 0), length)
+        if hi <= lo:
+            return 0.0, 0
+        return float(values[hi] - values[lo]), int(logged[hi] - logged[lo])
+    
+    def rolling(self, metric, days, end=None):
+        """Sum and days with data over the `days` days ending on `end` (default today)"""
+        end = self.today_ordinal() if end is None else int(end)
+        return self.window(metric, end - days + 1, end)
+    
+    def changed_since(self, version, start, end):
+        """Indices (relative to start) of days in start..end changed after a data version"""
+        changed = np.zeros(max(0, end - start + 1), dtype=bool)
+        if self.store['origin'] is None:
+            return np.flatnonzero(changed)
+        
+        lo = max(start, self.store['origin'])
+        hi = min(end, self.store['origin'] + self.store['length'] - 1)
+        if lo <= hi:
+            src = slice(lo - self.store['origin'], hi - self.store['origin'] + 1)
+            changed[lo - start:hi - start + 1] = self.store['day_version'][src] > version
+        
+        return np.flatnonzero(changed)
\ No newline at end of file
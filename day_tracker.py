@@ -0,0 +1,96 @@
+import streamlit as st
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+class DayTracker:
+    """Day-indexed store for counters that reset at the user's local midnight"""
+    
+    # Value each counter starts from on a fresh day
+    DAILY_COUNTERS = {
+        'water': 0,
+        'energy_level': 50
+    }
+    
+    def __init__(self):
+        self.initialize_day_data()
+        self.rollover()
+    
+    def initialize_day_data(self):
+        """Initialize day tracking data"""
+        defaults = {
+            'daily_counters': {},
+            'current_day': None
+        }
+        
+        for key, value in defaults.items():
+            if key not in st.session_state:
+                st.session_state[key] = value
+    
+    def get_timezone(self):
+        """Get the user's timezone from the profile, falling back to UTC"""
+        name = 'UTC'
+        if 'profile_data' in st.session_state:
+            name = st.session_state.profile_data.get('personal', {}).get('timezone') or 'UTC'
+        
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return ZoneInfo('UTC')
+    
+    def now(self):
+        """Current time in the user's timezone"""
+        return datetime.now(self.get_timezone())
+    
+    def today(self):
+        """Today's date key in the user's timezone"""
+        return self.now().strftime('%Y-%m-%d')
+    
+    def rollover(self):
+        """Start a new day's counters once local midnight has passed"""
+        today = self.today()
+        
+        if st.session_state.current_day == today:
+            return
+        
+        # Previous days stay in the store untouched as history
+        st.session_state.daily_counters.setdefault(today, dict(self.DAILY_COUNTERS))
+        st.session_state.current_day = today
+    
+    def get_day(self, day=None):
+        """Get all counters for a day (defaults to today)"""
+        day = day or self.today()
+        counters = dict(self.DAILY_COUNTERS)
+        counters.update(st.session_state.daily_counters.get(day, {}))
+        return counters
+    
+    def get(self, counter, day=None):
+        """Get a single counter value for a day (defaults to today)"""
+        return self.get_day(day)[counter]
+    
+    def set(self, counter, value, day=None):
+        """Set a counter value for a day (defaults to today)"""
+        day = day or self.today()
+        counters = st.session_state.daily_counters.setdefault(day, dict(self.DAILY_COUNTERS))
+        counters[counter] = value
+        
+        # Let the daily rollups know this day needs refreshing
+        st.session_state.setdefault('dirty_counter_days', set()).add(day)
+        return value
+    
+    def add(self, counter, amount, day=None, limit=None):
+        """Add to a counter, optionally capping it at a limit"""
+        value = self.get(counter, day) + amount
+        if limit is not None:
+            value = min(limit, value)
+        return self.set(counter, value, day)
+    
+    def history(self, counter, days=7):
+        """Get (date, value) pairs for a counter over the last N days, oldest first"""
+        today = self.now().date()
+        history = []
+        
+        for i in range(days - 1, -1, -1):
+            day = (today - timedelta(days=i)).strftime('%Y-%m-%d')
+            history.append((day, self.get(counter, day)))
+        
+        return history
\ No newline at end of file
@@ -0,0 +1,369 @@
+import streamlit as st
+
+class ExerciseCatalog:
+    """Exercise catalog expanded from base movements, with bitset indexes for faceted queries"""
+    
+    LEVELS = ['beginner', 'intermediate', 'advanced', 'athlete']
+    
+    # Facets that get an inverted index; each maps a value to a bitset of exercise ids
+    FACETS = ['category', 'muscle', 'equipment', 'pattern', 'level', 'impact', 'contraindication', 'base', 'token']
+    
+    # Movement pattern -> injuries it aggravates, implements that can load its bodyweight
+    # versions, setup variations (name, level change), single-limb name and tempo variations
+    STRENGTH_EXECUTIONS = [('Tempo', 1), ('Pause', 1), ('1.5-Rep', 1)]
+    PATTERNS = {
+        'squat': {'contraindications': ['knee'], 'loads': ['Dumbbells', 'Kettlebell'],
+                  'setups': [('Box', -1), ('Heels-Elevated', 0), ('Wide-Stance', 0), ('Narrow-Stance', 0)],
+                  'executions': STRENGTH_EXECUTIONS},
+        'lunge': {'contraindications': ['knee', 'hip'], 'loads': ['Dumbbells', 'Kettlebell'],
+                  'setups': [('Reverse', 0), ('Walking', 0), ('Lateral', 0), ('Deficit', 1)],
+                  'executions': STRENGTH_EXECUTIONS},
+        'hinge': {'contraindications': ['back'], 'loads': ['Dumbbells', 'Kettlebell'],
+                  'setups': [('Staggered-Stance', 0), ('Deficit', 1)], 'unilateral': 'Single-Leg',
+                  'executions': STRENGTH_EXECUTIONS},
+        'bridge': {'contraindications': [], 'loads': ['Dumbbells', 'Resistance Bands'],
+                   'setups': [('Feet-Elevated', 1), ('Marching', 0)], 'unilateral': 'Single-Leg',
+                   'executions': STRENGTH_EXECUTIONS},
+        'horizontal_push': {'contraindications': ['shoulder', 'wrist'], 'loads': [],
+                            'setups': [('Incline', -1), ('Decline', 1), ('Wide-Grip', 0), ('Close-Grip', 0)],
+                            'executions': STRENGTH_EXECUTIONS},
+        'vertical_push': {'contraindications': ['shoulder', 'neck'], 'loads': [],
+                          'setups': [('Seated', 0), ('Half-Kneeling', 0)], 'unilateral': 'Single-Arm',
+                          'executions': STRENGTH_EXECUTIONS},
+        'horizontal_pull': {'contraindications': ['elbow'], 'loads': [],
+                            'setups': [('Wide-Grip', 0), ('Underhand', 0)], 'unilateral': 'Single-Arm',
+                            'executions': STRENGTH_EXECUTIONS},
+        'vertical_pull': {'contraindications': ['shoulder', 'elbow'], 'loads': [],
+                          'setups': [('Neutral-Grip', 0), ('Wide-Grip', 1)],
+                          'executions': [('Negative', -1), ('Tempo', 1), ('Pause', 1)]},
+        'isolation': {'contraindications': ['elbow'], 'loads': [],
+                      'setups': [('Seated', 0), ('Standing', 0)], 'unilateral': 'Single-Arm',
+                      'executions': STRENGTH_EXECUTIONS},
+        'dip': {'contraindications': ['shoulder', 'elbow', 'wrist'], 'loads': [],
+                'setups': [('Bent-Knee', -1), ('Feet-Elevated', 1)], 'executions': STRENGTH_EXECUTIONS},
+        'carry': {'contraindications': ['back'], 'loads': [],
+                  'setups': [], 'unilateral': 'Single-Arm', 'executions': []},
+        'plyometric': {'contraindications': [], 'loads': [],
+                       'setups': [], 'executions': [('Low-Impact', -1), ('Speed', 1)]},
+        'locomotion': {'contraindications': [], 'loads': [],
+                       'setups': [], 'executions': [('Easy', -1), ('Tempo', 1)]},
+        'anti_extension': {'contraindications': ['wrist'], 'loads': [],
+                           'setups': [('Long-Lever', 1)], 'executions': [('Slow', 0)]},
+        'rotation': {'contraindications': ['back'], 'loads': [],
+                     'setups': [('Feet-Elevated', 1)], 'executions': [('Slow', 0)]},
+        'flexion': {'contraindications': ['back', 'shoulder'], 'loads': [],
+                    'setups': [('Straight-Leg', 1)], 'executions': [('Slow', 0)]},
+        'mobility': {'contraindications': [], 'loads': [], 'setups': [], 'executions': []}
+    }
+    
+    # Single-limb variations need an implement you can hold in one hand
+    ONE_HANDED = ['', 'Dumbbells', 'Kettlebell', 'Resistance Bands']
+    
+    # Implement -> name prefix for variants that add an implement to the base movement
+    IMPLEMENT_NAMES = {
+        'Dumbbells': 'Dumbbell',
+        'Barbell': 'Barbell',
+        'Kettlebell': 'Kettlebell',
+        'Resistance Bands': 'Band'
+    }
+    
+    def __init__(self):
+        self.exercises = []
+        self.index = {facet: {} for facet in self.FACETS}
+        
+        for entry in sorted(self.expand_all(), key=lambda e: e.pop('order')):
+            self.add(entry)
+        
+        self.all = (1 << len(self.exercises)) - 1
+    
+    def load_base_exercises(self):
+        """Base movements that the catalog expands into variations
+        
+        'equipment' lists alternatives (any one of them will do); an empty list means bodyweight.
+        'setups' and 'unilateral' override the pattern's variations; 'fixed' skips them entirely.
+        """
+        return {
+            'cardio': [
+                {'name': 'Running', 'calories_per_min': 10, 'muscles': ['Legs', 'Core'], 'equipment': [], 'pattern': 'locomotion',
+                 'impact': 'high', 'level': 'beginner', 'instructions': 'Keep an easy, conversational pace'},
+                {'name': 'Cycling', 'calories_per_min': 8, 'muscles': ['Legs', 'Glutes'], 'equipment': ['Bike'], 'pattern': 'locomotion',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Steady cadence, moderate resistance'},
+                {'name': 'Jump Rope', 'calories_per_min': 12, 'muscles': ['Full Body'], 'equipment': ['Jump Rope'], 'pattern': 'plyometric',
+                 'impact': 'high', 'level': 'intermediate', 'instructions': 'Small jumps, turn the rope from the wrists'},
+                {'name': 'Brisk Walking', 'calories_per_min': 5, 'muscles': ['Legs'], 'equipment': [], 'pattern': 'locomotion',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Walk fast enough to raise your breathing'},
+                {'name': 'Burpees', 'calories_per_min': 12, 'muscles': ['Full Body'], 'equipment': [], 'pattern': 'plyometric',
+                 'impact': 'high', 'level': 'intermediate', 'instructions': 'Start standing, drop to push-up position, jump back up'},
+                {'name': 'Mountain Climbers', 'calories_per_min': 10, 'muscles': ['Core', 'Shoulders'], 'equipment': [], 'pattern': 'plyometric',
+                 'impact': 'high', 'level': 'beginner', 'instructions': 'Alternate bringing knees to chest rapidly'},
+                {'name': 'Jumping Jacks', 'calories_per_min': 8, 'muscles': ['Full Body'], 'equipment': [], 'pattern': 'plyometric',
+                 'impact': 'high', 'level': 'beginner', 'instructions': 'Land softly on the balls of your feet'},
+                {'name': 'Jump Squats', 'calories_per_min': 10, 'muscles': ['Legs', 'Glutes'], 'equipment': [], 'pattern': 'plyometric',
+                 'impact': 'high', 'level': 'intermediate', 'instructions': 'Squat down then explode upward into a jump'},
+                {'name': 'Rowing Machine', 'calories_per_min': 9, 'muscles': ['Back', 'Legs'], 'equipment': ['Rowing Machine'], 'pattern': 'locomotion',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Drive with the legs, then pull with the arms'}
+            ],
+            'strength': [
+                {'name': 'Squats', 'calories_per_min': 5, 'muscles': ['Legs', 'Glutes'], 'equipment': [], 'pattern': 'squat',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Sit back and down, knees tracking over toes'},
+                {'name': 'Push-ups', 'calories_per_min': 4, 'muscles': ['Chest', 'Arms'], 'equipment': [], 'pattern': 'horizontal_push',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Keep a straight line from head to heels'},
+                {'name': 'Pull-ups', 'calories_per_min': 6, 'muscles': ['Back', 'Arms'], 'equipment': ['Pull-up Bar'], 'pattern': 'vertical_pull',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Pull until your chin clears the bar'},
+                {'name': 'Chin-ups', 'calories_per_min': 6, 'muscles': ['Back', 'Arms'], 'equipment': ['Pull-up Bar'], 'pattern': 'vertical_pull',
+                 'setups': [], 'impact': 'low', 'level': 'intermediate', 'instructions': 'Palms facing you, pull your chest toward the bar'},
+                {'name': 'Lunges', 'calories_per_min': 5, 'muscles': ['Legs', 'Glutes'], 'equipment': [], 'pattern': 'lunge',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Step forward and lower the back knee toward the floor'},
+                {'name': 'Bulgarian Split Squats', 'calories_per_min': 6, 'muscles': ['Legs', 'Glutes'], 'equipment': [], 'pattern': 'lunge',
+                 'setups': [('Deficit', 1)], 'impact': 'low', 'level': 'intermediate',
+                 'instructions': 'Rear foot on a bench, lower straight down over the front foot'},
+                {'name': 'Step-ups', 'calories_per_min': 6, 'muscles': ['Legs', 'Glutes'], 'equipment': [], 'pattern': 'lunge',
+                 'setups': [('Lateral', 0), ('Crossover', 1)], 'impact': 'low', 'level': 'beginner',
+                 'instructions': 'Step onto a sturdy box and drive through the front heel'},
+                {'name': 'Glute Bridges', 'calories_per_min': 4, 'muscles': ['Glutes', 'Core'], 'equipment': [], 'pattern': 'bridge',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Drive through the heels and squeeze at the top'},
+                {'name': 'Hip Thrusts', 'calories_per_min': 5, 'muscles': ['Glutes', 'Legs'], 'equipment': ['Barbell', 'Dumbbells'], 'pattern': 'bridge',
+                 'setups': [], 'impact': 'low', 'level': 'intermediate', 'instructions': 'Shoulders on a bench, drive the hips to full extension'},
+                {'name': 'Bodyweight Rows', 'calories_per_min': 5, 'muscles': ['Back', 'Arms'], 'equipment': [], 'pattern': 'horizontal_pull',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Row your chest to a sturdy table edge or bar'},
+                {'name': 'Tricep Dips', 'calories_per_min': 4, 'muscles': ['Arms', 'Chest'], 'equipment': [], 'pattern': 'dip',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Lower from a chair until elbows reach 90 degrees'},
+                {'name': 'Pike Push-ups', 'calories_per_min': 5, 'muscles': ['Shoulders', 'Arms'], 'equipment': [], 'pattern': 'vertical_push',
+                 'setups': [('Feet-Elevated', 1)], 'unilateral': '', 'impact': 'low', 'level': 'intermediate',
+                 'instructions': 'Hips high, lower the head between the hands'},
+                {'name': 'Dumbbell Rows', 'calories_per_min': 5, 'muscles': ['Back', 'Arms'], 'equipment': ['Dumbbells'], 'pattern': 'horizontal_pull',
+                 'setups': [('Chest-Supported', -1), ('Underhand', 0)], 'impact': 'low', 'level': 'beginner',
+                 'instructions': 'Pull the dumbbell to your hip, back flat'},
+                {'name': 'Shoulder Press', 'calories_per_min': 5, 'muscles': ['Shoulders', 'Arms'], 'equipment': ['Dumbbells', 'Barbell'], 'pattern': 'vertical_push',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Press overhead without arching the lower back'},
+                {'name': 'Lateral Raises', 'calories_per_min': 3, 'muscles': ['Shoulders'], 'equipment': ['Dumbbells', 'Resistance Bands'], 'pattern': 'isolation',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Raise the arms to shoulder height, elbows soft'},
+                {'name': 'Bicep Curls', 'calories_per_min': 3, 'muscles': ['Arms'], 'equipment': ['Dumbbells', 'Barbell', 'Resistance Bands'], 'pattern': 'isolation',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Keep the elbows pinned to your sides'},
+                {'name': 'Overhead Tricep Extensions', 'calories_per_min': 3, 'muscles': ['Arms'], 'equipment': ['Dumbbells', 'Resistance Bands'], 'pattern': 'isolation',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Lower behind the head, elbows pointing up'},
+                {'name': 'Front Squats', 'calories_per_min': 7, 'muscles': ['Legs', 'Glutes', 'Core'], 'equipment': ['Barbell', 'Kettlebell', 'Dumbbells'], 'pattern': 'squat',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Elbows high, weight racked on the front of the shoulders'},
+                {'name': 'Goblet Squats', 'calories_per_min': 6, 'muscles': ['Legs', 'Glutes'], 'equipment': ['Dumbbells', 'Kettlebell'], 'pattern': 'squat',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Hold the weight at your chest and squat deep'},
+                {'name': 'Romanian Deadlifts', 'calories_per_min': 6, 'muscles': ['Back', 'Glutes', 'Legs'], 'equipment': ['Dumbbells', 'Barbell', 'Kettlebell'], 'pattern': 'hinge',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Hinge at the hips with a slight knee bend'},
+                {'name': 'Deadlifts', 'calories_per_min': 7, 'muscles': ['Back', 'Glutes', 'Legs'], 'equipment': ['Barbell', 'Kettlebell'], 'pattern': 'hinge',
+                 'unilateral': '', 'impact': 'low', 'level': 'intermediate', 'instructions': 'Push the floor away, bar close to the shins'},
+                {'name': 'Sumo Deadlifts', 'calories_per_min': 7, 'muscles': ['Legs', 'Glutes', 'Back'], 'equipment': ['Barbell', 'Kettlebell', 'Dumbbells'], 'pattern': 'hinge',
+                 'setups': [('Deficit', 1)], 'unilateral': '', 'impact': 'low', 'level': 'intermediate',
+                 'instructions': 'Wide stance, toes out, push the knees over the feet'},
+                {'name': 'Chest Fly', 'calories_per_min': 3, 'muscles': ['Chest'], 'equipment': ['Dumbbells', 'Resistance Bands'], 'pattern': 'isolation',
+                 'setups': [('Incline', 0), ('Decline', 0)], 'unilateral': '', 'impact': 'low', 'level': 'beginner',
+                 'instructions': 'Open the arms wide with a soft bend in the elbows'},
+                {'name': 'Push Press', 'calories_per_min': 7, 'muscles': ['Shoulders', 'Arms', 'Legs'], 'equipment': ['Barbell', 'Dumbbells', 'Kettlebell'], 'pattern': 'vertical_push',
+                 'setups': [], 'impact': 'low', 'level': 'intermediate', 'instructions': 'Dip the knees and drive the weight overhead'},
+                {'name': 'Calf Raises', 'calories_per_min': 3, 'muscles': ['Legs'], 'equipment': [], 'pattern': 'isolation',
+                 'setups': [('Seated', 0), ('Deficit', 1)], 'unilateral': 'Single-Leg', 'impact': 'low', 'level': 'beginner',
+                 'instructions': 'Rise onto the balls of the feet and lower slowly'},
+                {'name': 'Face Pulls', 'calories_per_min': 3, 'muscles': ['Shoulders', 'Back'], 'equipment': ['Resistance Bands'], 'pattern': 'horizontal_pull',
+                 'setups': [], 'unilateral': '', 'impact': 'low', 'level': 'beginner', 'instructions': 'Pull the band toward your forehead, elbows high'},
+                {'name': 'Bench Press', 'calories_per_min': 6, 'muscles': ['Chest', 'Arms'], 'equipment': ['Barbell', 'Dumbbells'], 'pattern': 'horizontal_push',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Lower the bar to mid-chest, press back up'},
+                {'name': 'Barbell Squats', 'calories_per_min': 7, 'muscles': ['Legs', 'Glutes'], 'equipment': ['Barbell'], 'pattern': 'squat',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Brace the core and squat to parallel'},
+                {'name': 'Kettlebell Swings', 'calories_per_min': 9, 'muscles': ['Glutes', 'Back', 'Legs'], 'equipment': ['Kettlebell'], 'pattern': 'hinge',
+                 'fixed': True, 'impact': 'low', 'level': 'intermediate', 'instructions': 'Snap the hips forward, arms just guide the bell'},
+                {'name': "Farmer's Carry", 'calories_per_min': 6, 'muscles': ['Full Body', 'Core'], 'equipment': ['Dumbbells', 'Kettlebell'], 'pattern': 'carry',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Walk tall with heavy weights at your sides'},
+                {'name': 'Band Pull-Aparts', 'calories_per_min': 3, 'muscles': ['Back', 'Shoulders'], 'equipment': ['Resistance Bands'], 'pattern': 'horizontal_pull',
+                 'fixed': True, 'impact': 'low', 'level': 'beginner', 'instructions': 'Pull the band apart at chest height'}
+            ],
+            'core': [
+                {'name': 'Plank', 'calories_per_min': 3, 'muscles': ['Core'], 'equipment': [], 'pattern': 'anti_extension', 'hold': True,
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Hold a straight line on forearms and toes'},
+                {'name': 'Side Plank', 'calories_per_min': 3, 'muscles': ['Core'], 'equipment': [], 'pattern': 'anti_extension', 'hold': True,
+                 'setups': [], 'impact': 'low', 'level': 'beginner', 'instructions': 'Stack the feet and lift the hips'},
+                {'name': 'Dead Bug', 'calories_per_min': 3, 'muscles': ['Core'], 'equipment': [], 'pattern': 'anti_extension',
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Lower opposite arm and leg, back flat on the floor'},
+                {'name': 'Bicycle Crunches', 'calories_per_min': 4, 'muscles': ['Core'], 'equipment': [], 'pattern': 'rotation',
+                 'setups': [], 'impact': 'low', 'level': 'beginner', 'instructions': 'Elbow to opposite knee, slow and controlled'},
+                {'name': 'Russian Twists', 'calories_per_min': 4, 'muscles': ['Core'], 'equipment': [], 'pattern': 'rotation',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Lean back slightly and rotate side to side'},
+                {'name': 'Hanging Knee Raises', 'calories_per_min': 4, 'muscles': ['Core', 'Arms'], 'equipment': ['Pull-up Bar'], 'pattern': 'flexion',
+                 'impact': 'low', 'level': 'intermediate', 'instructions': 'Raise the knees without swinging'}
+            ],
+            'flexibility': [
+                {'name': 'Yoga Flow', 'calories_per_min': 3, 'muscles': ['Full Body'], 'equipment': [], 'pattern': 'mobility', 'hold': True,
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Move slowly through sun salutations'},
+                {'name': 'Hip Mobility', 'calories_per_min': 2, 'muscles': ['Glutes', 'Legs'], 'equipment': [], 'pattern': 'mobility', 'hold': True,
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Hip circles, 90/90 switches and deep lunges'},
+                {'name': 'Thoracic Stretch', 'calories_per_min': 2, 'muscles': ['Back', 'Shoulders'], 'equipment': [], 'pattern': 'mobility', 'hold': True,
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Open the upper back with rotations on all fours'},
+                {'name': 'Hamstring Stretch', 'calories_per_min': 2, 'muscles': ['Legs'], 'equipment': [], 'pattern': 'mobility', 'hold': True,
+                 'impact': 'low', 'level': 'beginner', 'instructions': 'Hinge forward with a long spine, no bouncing'}
+            ]
+        }
+    
+    def expand_all(self):
+        """Every variation of every base movement, with a sort order that puts plain versions first"""
+        entries = []
+        base_number = 0
+        for category, exercises in self.load_base_exercises().items():
+            for base in exercises:
+                entries.extend(self.expand(base, category, base_number))
+                base_number += 1
+        return entries
+    
+    def expand(self, base, category, base_number):
+        """Variations of one base movement: implement x single-limb x setup x tempo"""
+        pattern = self.PATTERNS[base['pattern']]
+        
+        # The base's own alternatives first, then implements that can load a bodyweight movement
+        implements = list(base['equipment']) or ['']
+        if not base['equipment']:
+            implements += pattern['loads']
+        
+        if base.get('fixed'):
+            setups, sides, executions = [None], [None], [None]
+        else:
+            setups = [None] + base.get('setups', pattern['setups'])
+            sides = [None]
+            unilateral = base.get('unilateral', pattern.get('unilateral'))
+            if unilateral:
+                sides.append((unilateral, 1))
+            executions = [None] + pattern['executions']
+        
+        level = self.LEVELS.index(base['level'])
+        multiple = len(base['equipment']) > 1
+        
+        entries = []
+        for implement_number, implement in enumerate(implements):
+            # Name the implement when it isn't already implied by the base name
+            added = implement and (multiple or not base['equipment'])
+            prefix = self.IMPLEMENT_NAMES.get(implement, implement) if added else ''
+            
+            for side in sides:
+                if side and implement not in self.ONE_HANDED:
+                    continue
+                for setup in setups:
+                    for execution in executions:
+                        modifiers = [m for m in (side, setup, execution) if m]
+                        name = ' '.join([prefix] + [m[0] for m in modifiers] + [base['name']]).strip()
+                        
+                        impact = base['impact']
+                        if execution and execution[0] == 'Low-Impact':
+                            impact = 'low'
+                        
+                        contraindications = set(pattern['contraindications'])
+                        if impact == 'high':
+                            contraindications.update(['knee', 'ankle'])
+                        
+                        entries.append({
+                            'name': name,
+                            'base': base['name'],
+                            'category': category,
+                            'pattern': base['pattern'],
+                            'muscles': base['muscles'],
+                            'equipment': [implement] if implement else [],
+                            'level': self.LEVELS[max(0, min(len(self.LEVELS) - 1, level + sum(m[1] for m in modifiers)))],
+                            'impact': impact,
+                            'contraindications': sorted(contraindications),
+                            'calories_per_min': base['calories_per_min'],
+                            'instructions': base['instructions'],
+                            'hold': base.get('hold', False),
+                            'order': (len(modifiers), base_number, implement_number)
+                        })
+        return entries
+    
+    def add(self, entry):
+        """Append an exercise and set its bit in every index it belongs to"""
+        entry['id'] = len(self.exercises)
+        self.exercises.append(entry)
+        bit = 1 << entry['id']
+        
+        values = {
+            'category': [entry['category']],
+            'muscle': entry['muscles'],
+            'equipment': entry['equipment'] or ['Bodyweight'],
+            'pattern': [entry['pattern']],
+            'level': [entry['level']],
+            'impact': [entry['impact']],
+            'contraindication': entry['contraindications'],
+            'base': [entry['base']],
+            'token': self.tokens(entry['name'])
+        }
+        for facet, facet_values in values.items():
+            index = self.index[facet]
+            for value in facet_values:
+                index[value] = index.get(value, 0) | bit
+    
+    def tokens(self, text):
+        """Lowercase search words of a name"""
+        return [t for t in text.lower().replace('-', ' ').replace("'", '').split() if t]
+    
+    def values(self, facet):
+        """Indexed values of a facet"""
+        if facet == 'level':
+            return [level for level in self.LEVELS if level in self.index['level']]
+        return sorted(self.index[facet])
+    
+    def mask(self, facet, values):
+        """Bitset of exercises having any of the values"""
+        if isinstance(values, str):
+            values = [values]
+        index = self.index[facet]
+        bits = 0
+        for value in values:
+            bits |= index.get(value, 0)
+        return bits
+    
+    def query(self, exclude=None, text=None, **filters):
+        """Bitset matching every given facet (any value within a facet), minus excluded values
+        
+        e.g. query(muscle=['Legs', 'Glutes'], equipment=['Bodyweight', 'Dumbbells'],
+                   exclude={'contraindication': ['knee']})
+        """
+        bits = self.all
+        for facet, values in filters.items():
+            if values is not None:
+                bits &= self.mask(facet, values)
+        for facet, values in (exclude or {}).items():
+            bits &= ~self.mask(facet, values)
+        if text:
+            bits &= self.search(text)
+        return bits
+    
+    def search(self, text):
+        """Bitset of exercises whose name has a word starting with every search word"""
+        bits = self.all
+        vocabulary = self.index['token']
+        for word in self.tokens(text):
+            matches = 0
+            for token, token_bits in vocabulary.items():
+                if token.startswith(word):
+                    matches |= token_bits
+            bits &= matches
+        return bits
+    
+    def levels_up_to(self, level):
+        """Levels at or below the given one"""
+        return self.LEVELS[:self.LEVELS.index(level) + 1]
+    
+    def ids(self, bits, limit=None):
+        """Exercise ids in a bitset, lowest first"""
+        ids = []
+        while bits and (limit is None or len(ids) < limit):
+            low = bits & -bits
+            ids.append(low.bit_length() - 1)
+            bits ^= low
+        return ids
+    
+    def entries(self, bits, offset=0, limit=None):
+        """Exercises in a bitset, lowest id first"""
+        ids = self.ids(bits, None if limit is None else offset + limit)
+        return [self.exercises[i] for i in ids[offset:]]
+    
+    def count(self, bits):
+        """Number of exercises in a bitset"""
+        return bits.bit_count()
+
+@st.cache_resource
+def load_exercise_catalog():
+    """Catalog shared by every session; it never changes while the app runs"""
+    return ExerciseCatalog()
\ No newline at end of file
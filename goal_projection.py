@@ -0,0 +1,176 @@
+import streamlit as st
+import numpy as np
+from datetime import date, timedelta
+from body_log import BodyLog
+from daily_rollups import DailyRollups, to_ordinal, from_ordinal
+from day_tracker import DayTracker
+
+class GoalProjection:
+    """Monte-Carlo projection of the weight trend towards the target weight"""
+    
+    SIMULATIONS = 4000
+    KCAL_PER_KG = 7700
+    
+    # Expenditure falls by roughly this much per kg lost (and rises per kg gained)
+    ADAPTATION_KCAL_PER_KG = 22
+    
+    # Day-to-day fluctuation of the underlying trend, kg per sqrt(day)
+    DAILY_NOISE_KG = 0.05
+    
+    # Days of history used for the weight slope and the intake average
+    FIT_DAYS = 42
+    MAX_STEPS = 120
+    MAX_HORIZON_DAYS = 730
+    
+    TIMELINE_DAYS = {
+        '1_month': 30,
+        '3_months': 91,
+        '6_months': 182,
+        '1_year': 365
+    }
+    
+    def __init__(self):
+        self.initialize_projection_data()
+    
+    def initialize_projection_data(self):
+        """Initialize projection cache"""
+        if 'goal_projection' not in st.session_state:
+            st.session_state.goal_projection = {'key': None, 'result': None}
+    
+    def project(self, tdee):
+        """Projection for the current goal, cached until the logs or the goal change"""
+        body_log = BodyLog()
+        goals = st.session_state.get('profile_data', {}).get('goals', {})
+        key = (body_log.version(), DailyRollups().sync(), goals.get('target_weight'),
+               self.target_date().toordinal(), round(tdee), DayTracker().today())
+        
+        cache = st.session_state.goal_projection
+        if cache['key'] != key:
+            cache['result'] = self.simulate(tdee)
+            cache['key'] = key
+        return cache['result']
+    
+    def start(self):
+        """Start date and weight of the goal: the goal's start date or the first logged weight"""
+        goals = st.session_state.get('profile_data', {}).get('goals', {})
+        dates, weights, trend = BodyLog().history('weight')
+        if not dates:
+            return None, None
+        
+        start_date = goals.get('start_date') or dates[0]
+        index = max(0, np.searchsorted(np.array(dates), start_date, side='right') - 1)
+        return dates[index], float(trend[index])
+    
+    def target_date(self):
+        """Target date from the goal, or from the goal timeline when none was set"""
+        goals = st.session_state.get('profile_data', {}).get('goals', {})
+        if goals.get('target_date'):
+            try:
+                return date.fromisoformat(str(goals['target_date'])[:10])
+            except ValueError:
+                pass
+        
+        start_date, _ = self.start()
+        start = date.fromisoformat(start_date) if start_date else DayTracker().now().date()
+        target = start + timedelta(days=self.TIMELINE_DAYS.get(goals.get('timeline'), 91))
+        return max(target, DayTracker().now().date() + timedelta(days=7))
+    
+    def observed_rate(self):
+        """Weight trend slope (kg/day) and its standard error from recent readings"""
+        dates, weights, _ = BodyLog().history('weight', days=self.FIT_DAYS)
+        if len(dates) < 4:
+            return None, None
+        
+        x = np.array([to_ordinal(d) for d in dates], dtype=float)
+        if x.max() - x.min() < 7:
+            return None, None
+        
+        x -= x.mean()
+        slope = (x * (weights - weights.mean())).sum() / (x ** 2).sum()
+        residuals = weights - weights.mean() - slope * x
+        stderr = np.sqrt((residuals ** 2).sum() / max(len(x) - 2, 1) / (x ** 2).sum())
+        return slope, stderr
+    
+    def energy_rate(self, tdee):
+        """Weight change implied by logged intake vs expenditure (kg/day) and its standard error"""
+        rollups = DailyRollups()
+        rollups.sync()
+        today = rollups.today_ordinal()
+        start = today - self.FIT_DAYS
+        
+        # Today is usually incomplete, so it is left out
+        intake = rollups.series('calories_in', start, today - 1)
+        logged = rollups.series('meal_count', start, today - 1) > 0
+        if logged.sum() < 7:
+            return None, None
+        
+        # The expenditure estimate already covers the usual training load
+        balance = intake[logged] - tdee
+        rate = balance.mean() / self.KCAL_PER_KG
+        
+        # Day-to-day spread of the balance plus ~10% uncertainty in the expenditure estimate
+        stderr = np.sqrt(balance.var() / logged.sum() + (0.1 * tdee) ** 2) / self.KCAL_PER_KG
+        return rate, stderr
+    
+    def simulate(self, tdee):
+        """Run the simulations and summarise them"""
+        goals = st.session_state.get('profile_data', {}).get('goals', {})
+        target_weight = goals.get('target_weight')
+        current = BodyLog().latest_trend('weight')
+        if current is None or target_weight is None:
+            return None
+        
+        # Blend the observed trend with the energy-balance estimate by their precision
+        estimates = [e for e in (self.observed_rate(), self.energy_rate(tdee)) if e[0] is not None]
+        if not estimates:
+            return None
+        
+        rates = np.array([rate for rate, _ in estimates])
+        precision = 1 / np.maximum(np.array([se for _, se in estimates]) ** 2, 1e-8)
+        rate = (rates * precision).sum() / precision.sum()
+        rate_se = np.sqrt(1 / precision.sum())
+        
+        today = DayTracker().now().date()
+        horizon = min(max((self.target_date() - today).days, 1), self.MAX_HORIZON_DAYS)
+        step = max(1, -(-horizon // self.MAX_STEPS))
+        steps = -(-horizon // step)
+        
+        # Each simulation draws its own underlying rate, then walks with daily noise
+        rng = np.random.default_rng()
+        path_rate = rng.normal(rate, rate_se, self.SIMULATIONS).astype(np.float32)
+        noise = rng.standard_normal((steps, self.SIMULATIONS), dtype=np.float32) * np.float32(self.DAILY_NOISE_KG * np.sqrt(step))
+        adaptation = np.float32(self.ADAPTATION_KCAL_PER_KG / self.KCAL_PER_KG * step)
+        
+        paths = np.empty((steps + 1, self.SIMULATIONS), dtype=np.float32)
+        paths[0] = current
+        for i in range(steps):
+            # Expenditure adapts to the weight already lost or gained
+            paths[i + 1] = paths[i] + path_rate * step + adaptation * (current - paths[i]) + noise[i]
+        
+        losing = target_weight < current
+        reached = paths <= target_weight if losing else paths >= target_weight
+        hit = reached.any(axis=0)
+        first_hit = np.where(hit, reached.argmax(axis=0), -1)
+        
+        days = np.minimum(np.arange(steps + 1) * step, horizon)
+        bands = np.percentile(paths, [10, 50, 90], axis=1)
+        
+        hit_days = days[first_hit[hit]]
+        start_date, start_weight = self.start()
+        
+        return {
+            'probability': float(hit.mean()),
+            'target_weight': target_weight,
+            'target_date': self.target_date().strftime('%Y-%m-%d'),
+            'current_weight': float(current),
+            'start_date': start_date,
+            'start_weight': start_weight,
+            'rate_per_week': float(rate * 7),
+            'required_per_week': float((target_weight - current) / horizon * 7),
+            'expected_date': from_ordinal(today.toordinal() + int(np.sort(hit_days)[self.SIMULATIONS // 2]))
+                             if len(hit_days) > self.SIMULATIONS // 2 else None,
+            'dates': [from_ordinal(today.toordinal() + int(d)) for d in days],
+            'p10': bands[0],
+            'p50': bands[1],
+            'p90': bands[2]
+        }
\ No newline at end of file
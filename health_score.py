@@ -0,0 +1,153 @@
+import streamlit as st
+import numpy as np
+import warnings
+from daily_rollups import DailyRollups, from_ordinal
+from hydration import HydrationModel
+
+class HealthScore:
+    """Composite daily health score kept up to date one day at a time"""
+    
+    COMPONENTS = ['sleep', 'water', 'mood', 'stress', 'activity']
+    
+    # Relative weight of each component in the overall score
+    WEIGHTS = np.array([0.25, 0.2, 0.2, 0.15, 0.2])
+    
+    ACTIVITY_TARGET_MINUTES = 30
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_score_data()
+    
+    def initialize_score_data(self):
+        """Initialize health score storage"""
+        if 'health_scores' not in st.session_state:
+            st.session_state.health_scores = {
+                'origin': None,
+                'components': np.zeros((0, len(self.COMPONENTS))),
+                'overall': np.zeros(0),
+                'version': -1,
+                'inputs': None
+            }
+    
+    def sync(self):
+        """Recompute only the days whose logs changed since the last sync"""
+        version = self.rollups.sync()
+        state = st.session_state.health_scores
+        first, last = self.rollups.day_range()
+        
+        # Profile targets feed every day's score, so a change means a full rebuild
+        inputs = (self.sleep_target(), HydrationModel().profile_inputs())
+        if inputs != state['inputs']:
+            state['version'] = -1
+            state['inputs'] = inputs
+        
+        added = np.zeros(0, dtype=int)
+        if state['origin'] != first or len(state['overall']) != last - first + 1:
+            added = self.realign(first, last)
+        
+        changed = np.union1d(self.rollups.changed_since(state['version'], first, last), added)
+        if len(changed):
+            components = self.calculate_components(first + changed)
+            state['components'][changed] = components
+            state['overall'][changed] = self.combine(components)
+        
+        state['version'] = version
+    
+    def realign(self, first, last):
+        """Move stored scores onto the rollup day axis and return the indices of new days"""
+        state = st.session_state.health_scores
+        length = last - first + 1
+        components = np.full((length, len(self.COMPONENTS)), np.nan)
+        overall = np.full(length, np.nan)
+        is_new = np.ones(length, dtype=bool)
+        
+        # Keep the days already computed
+        if state['origin'] is not None and len(state['overall']):
+            offset = state['origin'] - first
+            lo, hi = max(0, offset), min(length, offset + len(state['overall']))
+            if lo < hi:
+                components[lo:hi] = state['components'][lo - offset:hi - offset]
+                overall[lo:hi] = state['overall'][lo - offset:hi - offset]
+                is_new[lo:hi] = False
+        
+        state['origin'] = first
+        state['components'] = components
+        state['overall'] = overall
+        return np.flatnonzero(is_new)
+    
+    def calculate_components(self, ordinals):
+        """Score each component 0-100 for the given days (NaN when nothing was logged)"""
+        start, end = int(ordinals.min()), int(ordinals.max())
+        index = ordinals - start
+        series = lambda metric: self.rollups.series(metric, start, end)[index]
+        
+        # Sleep: duration against target, blended with quality when logged
+        hours = series('sleep_hours')
+        target = self.sleep_target()
+        duration_score = np.clip(hours / target, 0, 1) * 100 - np.clip(hours - target - 1.5, 0, None) * 10
+        quality = series('sleep_quality')
+        sleep = np.where(np.isnan(quality), duration_score, 0.7 * duration_score + 3 * quality)
+        
+        # Water: glasses against that day's adaptive target
+        hydration = HydrationModel()
+        weight, climate, minimum = hydration.profile_inputs()
+        water_target = hydration.target_glasses(series('workout_water_ml'), weight, climate, minimum)
+        water = np.clip(series('water') / water_target, 0, 1) * 100
+        
+        # Mood on a 0-5 scale, stress on a 1-10 scale (lower is better)
+        mood = series('mood_score') * 20
+        stress = (10 - series('stress_level')) / 9 * 100
+        
+        activity = np.clip(series('workout_minutes') / self.ACTIVITY_TARGET_MINUTES, 0, 1) * 100
+        
+        return np.clip(np.column_stack([sleep, water, mood, stress, activity]), 0, 100)
+    
+    def combine(self, components):
+        """Weighted average of the components that were logged"""
+        weights = np.where(np.isnan(components), 0, self.WEIGHTS)
+        total = weights.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            overall = np.nansum(components * weights, axis=1) / total
+        return np.where(total > 0, overall, np.nan)
+    
+    def sleep_target(self):
+        """Sleep target in hours from the profile"""
+        lifestyle = st.session_state.get('profile_data', {}).get('lifestyle', {})
+        return float(lifestyle.get('sleep_target', 8))
+    
+    def trend(self, days=7):
+        """Daily scores for the last N days as (dates, components, overall)"""
+        self.sync()
+        state = st.session_state.health_scores
+        window = slice(-days, None)
+        
+        ordinals = np.arange(state['origin'], state['origin'] + len(state['overall']))[window]
+        dates = [from_ordinal(o) for o in ordinals]
+        components = {name: state['components'][window, i] for i, name in enumerate(self.COMPONENTS)}
+        return dates, components, state['overall'][window]
+    
+    def weekly(self, weeks=4):
+        """Average scores per 7-day block for the last N weeks, oldest first"""
+        self.sync()
+        state = st.session_state.health_scores
+        days = weeks * 7
+        
+        # Pad the front so a short history still splits into whole weeks
+        components = state['components'][-days:]
+        components = np.vstack([np.full((days - len(components), len(self.COMPONENTS)), np.nan), components])
+        overall = np.concatenate([np.full(days - len(state['overall'][-days:]), np.nan), state['overall'][-days:]])
+        
+        with warnings.catch_warnings():
+            # Weeks with nothing logged average to NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            weekly = np.nanmean(components.reshape(weeks, 7, -1), axis=1)
+            weekly_overall = np.nanmean(overall.reshape(weeks, 7), axis=1)
+        
+        return {name: weekly[:, i] for i, name in enumerate(self.COMPONENTS)}, weekly_overall
+    
+    def today(self):
+        """Today's component and overall scores"""
+        _, components, overall = self.trend(1)
+        scores = {name: values[0] for name, values in components.items()}
+        scores['overall'] = overall[0]
+        return scores
\ No newline at end of file
@@ -0,0 +1,104 @@
+import streamlit as st
+import numpy as np
+from day_tracker import DayTracker
+
+class HydrationModel:
+    """Daily water target adjusted for body weight, workouts and climate"""
+    
+    GLASS_ML = 250
+    BASE_ML_PER_KG = 35
+    
+    # Extra water per day for the user's local climate
+    CLIMATE_TABLE = {
+        'Temperate': 0,
+        'Cold': 0,
+        'Hot': 500,
+        'Hot & Humid': 750,
+        'High Altitude': 500
+    }
+    
+    # Named intensities used by the workout loggers, on a 1-10 scale
+    INTENSITY_LEVELS = {
+        'Light': 3,
+        'Moderate': 5,
+        'Hard': 7,
+        'Very Hard': 9
+    }
+    
+    def __init__(self):
+        self.initialize_hydration_data()
+    
+    def initialize_hydration_data(self):
+        """Initialize hydration data"""
+        if 'hydration_targets' not in st.session_state:
+            st.session_state.hydration_targets = {}
+    
+    def get_target(self, day=None):
+        """Get the water target in glasses for a day (defaults to today)"""
+        return self.get_breakdown(day)['target']
+    
+    def get_breakdown(self, day=None):
+        """Get the water target for a day along with what it is made of"""
+        day = day or DayTracker().today()
+        weight, climate, minimum = self.profile_inputs()
+        logged_workouts = len(st.session_state.get('workout_history', []))
+        
+        # Only recompute when something the model depends on has changed
+        cache_key = (weight, climate, minimum, logged_workouts)
+        cached = st.session_state.hydration_targets.get(day)
+        if cached and cached['key'] == cache_key:
+            return cached['breakdown']
+        
+        breakdown = self.calculate_target(day, weight, climate, minimum)
+        st.session_state.hydration_targets[day] = {'key': cache_key, 'breakdown': breakdown}
+        return breakdown
+    
+    def profile_inputs(self):
+        """Get body weight, climate and minimum glasses from the profile"""
+        profile = st.session_state.get('profile_data', {})
+        weight = profile.get('personal', {}).get('weight', 70)
+        climate = profile.get('lifestyle', {}).get('climate', 'Temperate')
+        minimum = profile.get('nutrition', {}).get('water_target', 8)
+        return weight, climate, minimum
+    
+    def calculate_target(self, day, weight, climate, minimum):
+        """Calculate the water target for a day"""
+        base_ml = weight * self.BASE_ML_PER_KG
+        
+        workout_ml = 0
+        for workout in st.session_state.get('workout_history', []):
+            if workout.get('date') == day:
+                workout_ml += self.workout_water_ml(workout)
+        
+        climate_ml = self.CLIMATE_TABLE.get(climate, 0)
+        target = self.target_glasses(workout_ml, weight, climate, minimum)
+        
+        return {
+            'target': int(target),
+            'base': round(base_ml / self.GLASS_ML, 1),
+            'workout': round(workout_ml / self.GLASS_ML, 1),
+            'climate': round(climate_ml / self.GLASS_ML, 1),
+            'minimum': minimum
+        }
+    
+    def target_glasses(self, workout_ml, weight, climate, minimum):
+        """Convert water needs to a glass target (also works on an array of days)"""
+        total_ml = weight * self.BASE_ML_PER_KG + workout_ml + self.CLIMATE_TABLE.get(climate, 0)
+        return np.maximum(minimum, np.round(total_ml / self.GLASS_ML))
+    
+    def workout_water_ml(self, workout):
+        """Estimate sweat losses for a workout from its duration and intensity"""
+        duration = workout.get('duration', 0) or 0
+        level = self.intensity_level(workout.get('intensity'))
+        
+        # Roughly 0.35 L/hour for easy sessions up to 1 L/hour for very hard ones
+        litres_per_hour = 0.28 + 0.072 * level
+        return duration / 60 * litres_per_hour * 1000
+    
+    def intensity_level(self, intensity):
+        """Convert a logged intensity to a 1-10 scale"""
+        if isinstance(intensity, str):
+            return self.INTENSITY_LEVELS.get(intensity, 5)
+        if isinstance(intensity, (int, float)):
+            return min(max(intensity, 1), 10)
+        return 5
\ No newline at end of file
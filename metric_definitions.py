@@ -0,0 +1,125 @@
+import streamlit as st
+import numpy as np
+from datetime import date
+from daily_rollups import DailyRollups
+
+class MetricQueries:
+    """Named metrics declared as source, filter, aggregate and window, evaluated over the daily rollups"""
+    
+    # name -> definition
+    #   source: a DailyRollups metric
+    #   aggregate: 'sum' of the daily values, 'mean' per day with data, 'days' with data
+    #              (or passing the filter), 'max' or 'min'
+    #   filter: optional (operator, value) test applied to each day's value
+    #   window: default window - a number of days ending today, 'today', 'week' or 'month'
+    DEFINITIONS = {
+        'workouts': {'source': 'workout_count', 'aggregate': 'sum', 'window': 7},
+        'workout_days': {'source': 'workout_count', 'aggregate': 'days', 'window': 7},
+        'calories_burned': {'source': 'workout_calories', 'aggregate': 'sum', 'window': 'today'},
+        'active_minutes': {'source': 'workout_minutes', 'aggregate': 'sum', 'window': 'week'},
+        'meals': {'source': 'meal_count', 'aggregate': 'sum', 'window': 'today'},
+        'meal_days': {'source': 'meal_count', 'aggregate': 'days', 'window': 7},
+        'calories_in': {'source': 'calories_in', 'aggregate': 'sum', 'window': 'today'},
+        'protein': {'source': 'protein', 'aggregate': 'sum', 'window': 'today'},
+        'carbs': {'source': 'carbs', 'aggregate': 'sum', 'window': 'today'},
+        'fat': {'source': 'fat', 'aggregate': 'sum', 'window': 'today'},
+        'avg_calories_in': {'source': 'calories_in', 'aggregate': 'mean', 'window': 30},
+        'avg_protein': {'source': 'protein', 'aggregate': 'mean', 'window': 30},
+        'avg_sleep': {'source': 'sleep_hours', 'aggregate': 'mean', 'window': 7},
+        'nights_7h': {'source': 'sleep_hours', 'aggregate': 'days', 'filter': ('>=', 7), 'window': 7},
+        'avg_mood': {'source': 'mood_score', 'aggregate': 'mean', 'window': 7},
+        'mood_days': {'source': 'mood_score', 'aggregate': 'days', 'window': 'today'}
+    }
+    
+    OPERATORS = {
+        '>=': np.greater_equal,
+        '>': np.greater,
+        '<=': np.less_equal,
+        '<': np.less,
+        '==': np.equal
+    }
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_metric_cache()
+    
+    def initialize_metric_cache(self):
+        """Initialize the shared result cache"""
+        if 'metric_cache' not in st.session_state:
+            st.session_state.metric_cache = {'version': None, 'today': None, 'values': {}}
+    
+    def get(self, name, window=None):
+        """Value of a named metric over its default window or the one given"""
+        definition = self.DEFINITIONS[name]
+        window = definition['window'] if window is None else window
+        return self.evaluate(name, definition, window)
+    
+    def query(self, source, aggregate, window, filter=None):
+        """Value of an ad-hoc metric definition"""
+        definition = {'source': source, 'aggregate': aggregate, 'filter': filter}
+        return self.evaluate(('query', source, aggregate, filter), definition, window)
+    
+    def evaluate(self, key, definition, window):
+        """Cached result per (metric, window), dropped when the data or the day changes"""
+        cache = st.session_state.metric_cache
+        version = self.rollups.sync()
+        today = self.rollups.today_ordinal()
+        if cache['version'] != version or cache['today'] != today:
+            cache.update(version=version, today=today, values={})
+        
+        start, end = self.resolve_window(window, today)
+        cache_key = (key, start, end)
+        if cache_key not in cache['values']:
+            cache['values'][cache_key] = self.compile(definition)(start, end)
+        return cache['values'][cache_key]
+    
+    def resolve_window(self, window, today):
+        """Start and end ordinals for a window: (start, end), days back, 'today', 'week' or 'month'"""
+        if isinstance(window, tuple):
+            return int(window[0]), int(window[1])
+        if window == 'today':
+            return today, today
+        
+        day = date.fromordinal(today)
+        if window == 'week':
+            return today - day.weekday(), today
+        if window == 'month':
+            return today - day.day + 1, today
+        return today - int(window) + 1, today
+    
+    def compile(self, definition):
+        """Turn a definition into a function of (start, end) over the rollup arrays"""
+        source = definition['source']
+        aggregate = definition['aggregate']
+        condition = definition.get('filter')
+        rollups = self.rollups
+        
+        if condition is None and aggregate in ('sum', 'mean', 'days'):
+            # Plain sums and counts come straight from the cumulative sums
+            def evaluate(start, end):
+                total, days = rollups.window(source, start, end)
+                if aggregate == 'sum':
+                    return total
+                if aggregate == 'days':
+                    return days
+                return total / days if days else None
+            return evaluate
+        
+        compare = self.OPERATORS[condition[0]] if condition else None
+        
+        def evaluate(start, end):
+            values = rollups.series(source, start, end)
+            values = values[~np.isnan(values)]
+            if compare is not None:
+                values = values[compare(values, condition[1])]
+            
+            if aggregate == 'days':
+                return len(values)
+            if aggregate == 'sum':
+                return float(values.sum())
+            if not len(values):
+                return None
+            if aggregate == 'mean':
+                return float(values.mean())
+            return float(values.max() if aggregate == 'max' else values.min())
+        return evaluate
\ No newline at end of file
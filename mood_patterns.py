@@ -0,0 +1,201 @@
+import streamlit as st
+import numpy as np
+import re
+from datetime import date
+from daily_rollups import DailyRollups, MOOD_VALUES, to_ordinal
+
+class MoodPatterns:
+    """Day-of-week, time-of-day and trigger patterns across the full mood and stress history"""
+    
+    WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    
+    # (label, first hour) of each part of the day
+    TIME_OF_DAY = [('Night', 0), ('Morning', 5), ('Afternoon', 12), ('Evening', 17), ('Night', 22)]
+    DAY_PARTS = ['Morning', 'Afternoon', 'Evening', 'Night']
+    
+    # Minimum number of paired days before a correlation is reported
+    MIN_PAIRS = 7
+    
+    STOP_WORDS = {
+        'the', 'and', 'with', 'that', 'this', 'have', 'from', 'feel', 'feeling',
+        'really', 'very', 'just', 'been', 'about', 'because', 'today', 'some'
+    }
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_pattern_data()
+    
+    def initialize_pattern_data(self):
+        """Initialize pattern cache"""
+        if 'mood_patterns' not in st.session_state:
+            st.session_state.mood_patterns = {'version': None, 'patterns': None}
+    
+    def get_patterns(self):
+        """Get all patterns, recomputing only when the logs have changed"""
+        version = self.rollups.sync()
+        cache = st.session_state.mood_patterns
+        
+        if cache['version'] != version:
+            cache['patterns'] = self.calculate_patterns()
+            cache['version'] = version
+        
+        return cache['patterns']
+    
+    def calculate_patterns(self):
+        """Mine every pattern from the full history"""
+        moods = self.log_arrays(st.session_state.get('mood_history', []), lambda m: MOOD_VALUES.get(m.get('mood'), 3))
+        stress = self.log_arrays(st.session_state.get('stress_history', []), lambda s: s.get('level'))
+        
+        return {
+            'mood_by_weekday': self.group_mean(moods['weekday'], moods['value'], 7),
+            'stress_by_weekday': self.group_mean(stress['weekday'], stress['value'], 7),
+            'mood_by_time': self.group_mean(moods['day_part'], moods['value'], len(self.DAY_PARTS)),
+            'stress_by_time': self.group_mean(stress['day_part'], stress['value'], len(self.DAY_PARTS)),
+            'mood_reasons': self.keyword_counts(m.get('reason') for m in st.session_state.get('mood_history', [])),
+            'stress_causes': self.keyword_counts(s.get('causes') for s in st.session_state.get('stress_history', [])),
+            'stress_symptoms': self.term_counts(
+                symptom for s in st.session_state.get('stress_history', []) for symptom in (s.get('symptoms') or [])
+            ),
+            'correlations': self.lagged_correlations(),
+            'entries': {'mood': len(moods['value']), 'stress': len(stress['value'])}
+        }
+    
+    def log_arrays(self, entries, value_of):
+        """Convert log entries to weekday, part-of-day and value arrays"""
+        weekdays, day_parts, values = [], [], []
+        bounds = np.array([hour for _, hour in self.TIME_OF_DAY])
+        labels = [self.DAY_PARTS.index(label) for label, _ in self.TIME_OF_DAY]
+        
+        for entry in entries:
+            value = value_of(entry)
+            if not isinstance(value, (int, float)):
+                continue
+            try:
+                ordinal = to_ordinal(entry['date'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            
+            hour = self.entry_hour(entry)
+            weekdays.append(date.fromordinal(ordinal).weekday())
+            day_parts.append(-1 if hour is None else labels[np.searchsorted(bounds, hour, side='right') - 1])
+            values.append(float(value))
+        
+        return {
+            'weekday': np.array(weekdays, dtype=int),
+            'day_part': np.array(day_parts, dtype=int),
+            'value': np.array(values)
+        }
+    
+    def entry_hour(self, entry):
+        """Hour an entry was logged at, if known"""
+        timestamp = entry.get('timestamp') or entry.get('time') or ''
+        try:
+            return int(str(timestamp).split(':')[0])
+        except ValueError:
+            return None
+    
+    def group_mean(self, groups, values, size):
+        """Mean and count of values per group (NaN for empty groups)"""
+        valid = groups >= 0
+        counts = np.bincount(groups[valid], minlength=size)
+        sums = np.bincount(groups[valid], weights=values[valid], minlength=size)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        
+        return {'mean': means, 'count': counts}
+    
+    def keyword_counts(self, texts, top=8):
+        """Most frequent keywords in free-text reasons"""
+        words = []
+        for text in texts:
+            if not text:
+                continue
+            words.extend(w for w in re.findall(r"[a-z']+", str(text).lower()) if len(w) > 2 and w not in self.STOP_WORDS)
+        
+        return self.term_counts(words, top)
+    
+    def term_counts(self, terms, top=8):
+        """Most frequent terms as (term, count) pairs"""
+        terms = np.array(list(terms), dtype=object)
+        if len(terms) == 0:
+            return []
+        
+        unique, counts = np.unique(terms.astype(str), return_counts=True)
+        order = np.argsort(-counts, kind='stable')[:top]
+        return [(str(unique[i]), int(counts[i])) for i in order]
+    
+    def lagged_correlations(self):
+        """Correlate each day's mood and stress with the previous day's sleep and workouts"""
+        first, last = self.rollups.day_range()
+        if last - first < self.MIN_PAIRS:
+            return {}
+        
+        # Outcome on day d against the driver on day d-1
+        outcomes = {
+            'mood': self.rollups.series('mood_score', first + 1, last),
+            'stress': self.rollups.series('stress_level', first + 1, last)
+        }
+        drivers = {
+            'sleep_hours': self.rollups.series('sleep_hours', first, last - 1),
+            'workout_minutes': self.rollups.series('workout_minutes', first, last - 1)
+        }
+        
+        correlations = {}
+        for outcome, y in outcomes.items():
+            for driver, x in drivers.items():
+                correlations[(outcome, driver)] = self.pearson(x, y)
+            
+            # Average outcome the day after a workout compared with the day after a rest day
+            trained = drivers['workout_minutes'] > 0
+            logged = ~np.isnan(y)
+            after_workout = y[trained & logged]
+            after_rest = y[~trained & logged]
+            if len(after_workout) and len(after_rest):
+                correlations[(outcome, 'after_workout')] = (after_workout.mean(), after_rest.mean())
+        
+        return correlations
+    
+    def pearson(self, x, y):
+        """Pearson correlation over days where both values were logged (None if too few)"""
+        valid = ~(np.isnan(x) | np.isnan(y))
+        if valid.sum() < self.MIN_PAIRS:
+            return None
+        
+        x, y = x[valid], y[valid]
+        if x.std() == 0 or y.std() == 0:
+            return None
+        return float(np.corrcoef(x, y)[0, 1])
+    
+    def get_insights(self):
+        """Plain-language summary of the strongest patterns"""
+        patterns = self.get_patterns()
+        insights = []
+        
+        mood_week = patterns['mood_by_weekday']
+        if np.count_nonzero(mood_week['count']) >= 3:
+            best, worst = np.nanargmax(mood_week['mean']), np.nanargmin(mood_week['mean'])
+            if best != worst:
+                insights.append(f"Your mood tends to be best on {self.WEEKDAYS[best]} and lowest on {self.WEEKDAYS[worst]}")
+        
+        stress_time = patterns['stress_by_time']
+        if np.count_nonzero(stress_time['count']) >= 2:
+            peak = np.nanargmax(stress_time['mean'])
+            insights.append(f"Stress peaks in the {self.DAY_PARTS[peak].lower()} (avg {stress_time['mean'][peak]:.1f}/10)")
+        
+        correlations = patterns['correlations']
+        sleep_mood = correlations.get(('mood', 'sleep_hours'))
+        if sleep_mood is not None and abs(sleep_mood) >= 0.2:
+            direction = 'better' if sleep_mood > 0 else 'worse'
+            insights.append(f"More sleep is followed by {direction} mood the next day (r = {sleep_mood:.2f})")
+        
+        after_workout = correlations.get(('stress', 'after_workout'))
+        if after_workout and abs(after_workout[0] - after_workout[1]) >= 0.5:
+            change = 'lower' if after_workout[0] < after_workout[1] else 'higher'
+            insights.append(f"Stress is {change} the day after a workout ({after_workout[0]:.1f} vs {after_workout[1]:.1f})")
+        
+        if patterns['stress_causes']:
+            cause, count = patterns['stress_causes'][0]
+            insights.append(f"Most common stress trigger: '{cause}' ({count} times)")
+        
+        return insights
\ No newline at end of file
@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from daily_rollups import DailyRollups, from_ordinal
+
+class PeriodComparison:
+    """Totals and averages of daily metrics over any two day windows, compared with each other"""
+    
+    PERIODS = {
+        'week': 'This Week vs Last Week',
+        'month': 'This Month vs Last Month',
+        'year': 'This Month vs Same Month Last Year',
+        'rolling_7': 'Last 7 Days vs Previous 7 Days',
+        'rolling_30': 'Last 30 Days vs Previous 30 Days'
+    }
+    
+    # metric -> (label, 'total' or 'mean' per day with data, unit, decimals)
+    SUMMARY_METRICS = {
+        'workout_count': ('Workouts', 'total', '', 0),
+        'workout_minutes': ('Active Minutes', 'total', 'min', 0),
+        'workout_calories': ('Calories Burned', 'total', 'kcal', 0),
+        'calories_in': ('Avg Daily Intake', 'mean', 'kcal', 0),
+        'protein': ('Avg Daily Protein', 'mean', 'g', 0),
+        'sleep_hours': ('Avg Sleep', 'mean', 'h', 1),
+        'water': ('Avg Water', 'mean', 'glasses', 1),
+        'mood_score': ('Avg Mood (0-5)', 'mean', '', 1)
+    }
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+    
+    def value(self, metric, start, end, stat='total'):
+        """Window total, or the mean per day with data (None when nothing was logged)"""
+        self.rollups.sync()
+        total, days = self.rollups.window(metric, start, end)
+        if stat == 'mean':
+            return total / days if days else None
+        return total
+    
+    def compare(self, metric, current, previous, stat='total'):
+        """Compare a metric over two (start, end) ordinal windows"""
+        now = self.value(metric, current[0], current[1], stat)
+        before = self.value(metric, previous[0], previous[1], stat)
+        
+        delta = now - before if now is not None and before is not None else None
+        percent = delta / abs(before) * 100 if delta is not None and before else None
+        
+        return {
+            'current': now,
+            'previous': before,
+            'delta': delta,
+            'percent': percent
+        }
+    
+    def period_windows(self, period, today=None):
+        """Current and reference windows for a named period, both ending the same number of days in"""
+        today = today or date.fromordinal(self.rollups.today_ordinal())
+        t = today.toordinal()
+        
+        if period == 'week':
+            monday = t - today.weekday()
+            return (monday, t), (monday - 7, t - 7)
+        
+        if period in ('month', 'year'):
+            first = today.replace(day=1)
+            if period == 'month':
+                reference = (first - timedelta(days=1)).replace(day=1)
+            else:
+                reference = first.replace(year=first.year - 1)
+            
+            # Clip to the reference month's length (e.g. March 31 vs February)
+            next_month = (reference + timedelta(days=32)).replace(day=1)
+            reference_end = min(reference.toordinal() + today.day - 1, next_month.toordinal() - 1)
+            return (first.toordinal(), t), (reference.toordinal(), reference_end)
+        
+        days = int(period.split('_')[1])
+        return (t - days + 1, t), (t - 2 * days + 1, t - days)
+    
+    def compare_period(self, metric, period, stat='total'):
+        """Compare a metric for a named period against its reference period"""
+        current, previous = self.period_windows(period)
+        comparison = self.compare(metric, current, previous, stat)
+        comparison['current_window'] = tuple(from_ordinal(d) for d in current)
+        comparison['previous_window'] = tuple(from_ordinal(d) for d in previous)
+        return comparison
+    
+    def summary(self, period='week', metrics=None):
+        """Comparisons of the summary metrics for a named period"""
+        summary = {}
+        for metric in metrics or self.SUMMARY_METRICS:
+            label, stat, unit, decimals = self.SUMMARY_METRICS[metric]
+            comparison = self.compare_period(metric, period, stat)
+            comparison.update(label=label, unit=unit, decimals=decimals)
+            summary[metric] = comparison
+        return summary
+    
+    def format_value(self, comparison, key='current'):
+        """Format a summary value with its unit"""
+        value = comparison[key]
+        if value is None:
+            return "—"
+        
+        sign = '+' if key == 'delta' else ''
+        return f"{value:{sign}.{comparison['decimals']}f} {comparison['unit']}".strip()
\ No newline at end of file
@@ -0,0 +1,207 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import from_ordinal, to_ordinal
+from set_log import SetLog
+from progressive_overload import ProgressiveOverload
+
+class PersonalRecords:
+    """Personal bests per exercise and metric, folded in as sets and workouts are logged"""
+    
+    # metric -> (label, unit, higher is better)
+    METRICS = {
+        'max_load': ('Heaviest Load', 'kg', True),
+        'e1rm': ('Estimated 1RM', 'kg', True),
+        'max_reps': ('Most Reps', 'reps', True),
+        'longest_hold': ('Longest Set', 's', True),
+        'longest_duration': ('Longest Workout', 'min', True),
+        'most_calories': ('Most Calories', 'kcal', True),
+        'longest_distance': ('Longest Distance', 'km', True),
+        'fastest_pace': ('Fastest Pace', 'min/km', False)
+    }
+    
+    # Rep records are kept per load, bucketed to the nearest half kilo
+    LOAD_BUCKET = 0.5
+    
+    RECENT_LIMIT = 50
+    
+    def __init__(self):
+        self.set_log = SetLog()
+        self.initialize_record_data()
+    
+    def initialize_record_data(self):
+        """Initialize record index"""
+        if 'personal_records' not in st.session_state:
+            st.session_state.personal_records = self.empty_index()
+    
+    def empty_index(self):
+        """Index with nothing folded in yet"""
+        return {'sets_seen': 0, 'workouts_seen': 0, 'records': {}, 'reps_at_load': {}, 'recent': [], 'count': 0,
+                'by_day': {}, 'by_metric': {}}
+    
+    def sync(self):
+        """Fold sets and workouts logged since the last call into the index"""
+        index = st.session_state.personal_records
+        workouts = st.session_state.get('workout_history', [])
+        size = self.set_log.state['size']
+        
+        if size < index['sets_seen'] or len(workouts) < index['workouts_seen']:
+            index = st.session_state.personal_records = self.empty_index()
+        
+        if size > index['sets_seen']:
+            self.add_sets(index, index['sets_seen'], size)
+            index['sets_seen'] = size
+        
+        for entry in workouts[index['workouts_seen']:]:
+            self.add_workout(index, entry)
+        index['workouts_seen'] = len(workouts)
+        
+        return index
+    
+    def add_sets(self, index, start, end):
+        """Fold set log rows start..end into the records, one pass per metric over the new rows"""
+        column = lambda name: self.set_log.column(name)[start:end]
+        codes = column('exercise')
+        days = column('day')
+        load = column('load').astype(float)
+        reps = column('reps').astype(float)
+        names = self.set_log.state['names']
+        
+        values = {
+            'max_load': load,
+            'e1rm': ProgressiveOverload().e1rm(load, reps, column('rpe')),
+            'max_reps': reps,
+            'longest_hold': column('duration').astype(float)
+        }
+        
+        for metric, metric_values in values.items():
+            valid = np.isfinite(metric_values) & (metric_values > 0)
+            rows = np.flatnonzero(valid)
+            for code, position in self.group_best(codes[valid], metric_values[valid]):
+                row = rows[position]
+                self.record(index, names[code], metric, round(float(metric_values[row]), 1), int(days[row]))
+        
+        # Best reps at each load: one group per (exercise, load bucket)
+        valid = (load > 0) & (reps > 0)
+        buckets = np.round(load[valid] / self.LOAD_BUCKET).astype(np.int64)
+        keys = codes[valid].astype(np.int64) * 1_000_000 + buckets
+        rows = np.flatnonzero(valid)
+        for _, position in self.group_best(keys, reps[valid]):
+            row = rows[position]
+            name = names[codes[row]]
+            bucket = float(buckets[position] * self.LOAD_BUCKET)
+            current = index['reps_at_load'].setdefault(name, {}).get(bucket)
+            if current is None or reps[row] > current['value']:
+                index['reps_at_load'][name][bucket] = {'value': int(reps[row]), 'date': from_ordinal(days[row])}
+    
+    def group_best(self, groups, values):
+        """(group, position) of each group's best value, earliest position on ties"""
+        if not len(groups):
+            return []
+        positions = np.arange(len(groups))
+        # Sorted by group, then value, then latest position first, so each group ends on its earliest best
+        order = np.lexsort((-positions, values, groups))
+        last = np.append(groups[order][1:] != groups[order][:-1], True)
+        best = order[last]
+        return zip(groups[best].tolist(), best.tolist())
+    
+    def add_workout(self, index, entry, metrics=None):
+        """Fold one workout history entry into the records (only `metrics` if given)"""
+        name = entry.get('workout') or entry.get('name')
+        try:
+            day = to_ordinal(entry['date'])
+        except (KeyError, TypeError, ValueError):
+            return
+        if not name:
+            return
+        
+        duration = entry.get('duration') or 0
+        distance = entry.get('distance') or 0
+        values = {}
+        if duration > 0:
+            values['longest_duration'] = duration
+        if (entry.get('calories') or 0) > 0:
+            values['most_calories'] = entry['calories']
+        if distance > 0:
+            values['longest_distance'] = round(distance, 2)
+            # Imported tracks carry a moving pace; manual entries only have total duration
+            if entry.get('pace'):
+                values['fastest_pace'] = round(entry['pace'], 2)
+            elif duration > 0:
+                values['fastest_pace'] = round(duration / distance, 2)
+        
+        for metric, value in values.items():
+            if metrics is None or metric in metrics:
+                self.record(index, name, metric, value, day)
+    
+    def refold(self, metric):
+        """Rebuild one workout-level metric after logged values were rewritten, keeping every other record"""
+        index = self.sync()
+        
+        # Take back the records this metric broke, then fold the workouts again in logged order
+        for date, count in index['by_metric'].pop(metric, {}).items():
+            index['count'] -= count
+            index['by_day'][date] -= count
+            if not index['by_day'][date]:
+                del index['by_day'][date]
+        index['recent'] = [r for r in index['recent'] if r['metric'] != metric]
+        for records in index['records'].values():
+            records.pop(metric, None)
+        
+        for entry in st.session_state.get('workout_history', [])[:index['workouts_seen']]:
+            self.add_workout(index, entry, [metric])
+        
+        index['recent'].sort(key=lambda r: r['date'])
+        del index['recent'][:-self.RECENT_LIMIT]
+    
+    def record(self, index, name, metric, value, day):
+        """Keep a value if it beats the current record; beating an earlier record counts as a PR"""
+        records = index['records'].setdefault(name, {})
+        current = records.get(metric)
+        higher = self.METRICS[metric][2]
+        if current is not None and (value <= current['value'] if higher else value >= current['value']):
+            return
+        
+        date = from_ordinal(day)
+        records[metric] = {'value': value, 'date': date}
+        
+        # The first value for an exercise is a baseline, not a record broken
+        if current is not None:
+            index['count'] += 1
+            index['by_day'][date] = index['by_day'].get(date, 0) + 1
+            by_metric = index['by_metric'].setdefault(metric, {})
+            by_metric[date] = by_metric.get(date, 0) + 1
+            index['recent'].append({'exercise': name, 'metric': metric, 'value': value,
+                                    'previous': current['value'], 'date': date})
+            del index['recent'][:-self.RECENT_LIMIT]
+    
+    def get(self, exercise, metric):
+        """Current record for an exercise and metric ({'value', 'date'}) or None"""
+        return self.sync()['records'].get(exercise, {}).get(metric)
+    
+    def reps_at(self, exercise, load):
+        """Most reps done at a load ({'value', 'date'}) or None"""
+        bucket = round(load / self.LOAD_BUCKET) * self.LOAD_BUCKET
+        return self.sync()['reps_at_load'].get(exercise, {}).get(bucket)
+    
+    def exercise_records(self, exercise):
+        """All records for an exercise keyed by metric"""
+        return self.sync()['records'].get(exercise, {})
+    
+    def records(self):
+        """Every exercise's records keyed by exercise, then metric"""
+        return self.sync()['records']
+    
+    def recent(self, limit=10):
+        """Most recently broken records, newest first"""
+        return self.sync()['recent'][-limit:][::-1]
+    
+    def count(self, since=None):
+        """Number of records broken, optionally only on or after a 'YYYY-MM-DD' date"""
+        index = self.sync()
+        if since is None:
+            return index['count']
+        return sum(count for day, count in index['by_day'].items() if day >= since)
+    
+    def format(self, metric, value):
+        """Value with its unit"""
+        return f"{value:g} {self.METRICS[metric][1]}"
\ No newline at end of file
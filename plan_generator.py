@@ -0,0 +1,318 @@
+import streamlit as st
+from itertools import combinations
+from calorie_engine import CalorieEngine
+
+class PlanGenerator:
+    """Weekly workout plans searched under the user's goal, schedule, equipment, injuries and recovery needs"""
+    
+    LEVELS = ['beginner', 'intermediate', 'advanced', 'athlete']
+    DAYS = 7
+    
+    # Session type -> display info, exercise categories, muscles to cover and muscles it loads
+    SESSIONS = {
+        'upper': {'name': 'Upper Body Strength', 'focus': 'Upper Body', 'categories': ['strength'],
+                  'muscles': ['Chest', 'Back', 'Shoulders', 'Arms'], 'loads': ['Chest', 'Back', 'Shoulders', 'Arms']},
+        'lower': {'name': 'Lower Body Strength', 'focus': 'Legs & Glutes', 'categories': ['strength', 'core'],
+                  'muscles': ['Legs', 'Glutes', 'Core'], 'loads': ['Legs', 'Glutes']},
+        'full_body': {'name': 'Full Body Strength', 'focus': 'Full Body', 'categories': ['strength', 'core'],
+                      'muscles': ['Legs', 'Chest', 'Back', 'Glutes', 'Shoulders', 'Core'],
+                      'loads': ['Legs', 'Chest', 'Back', 'Glutes', 'Shoulders']},
+        'hiit': {'name': 'HIIT Cardio', 'focus': 'Fat Burning', 'categories': ['cardio', 'core'],
+                 'muscles': ['Full Body', 'Legs', 'Core', 'Shoulders'], 'loads': ['Legs'], 'intervals': True},
+        'cardio': {'name': 'Steady Cardio', 'focus': 'Endurance', 'categories': ['cardio'],
+                   'muscles': ['Legs', 'Full Body', 'Back'], 'loads': [], 'steady': True},
+        'core': {'name': 'Core & Mobility', 'focus': 'Abs & Core', 'categories': ['core', 'flexibility'],
+                 'muscles': ['Core', 'Glutes', 'Back', 'Legs'], 'loads': ['Core']},
+        'mobility': {'name': 'Mobility Flow', 'focus': 'Flexibility', 'categories': ['flexibility', 'core'],
+                     'muscles': ['Full Body', 'Glutes', 'Back', 'Legs', 'Core'], 'loads': []}
+    }
+    
+    # Desired share of training days per session type for each goal
+    GOAL_MIX = {
+        'weight_loss': {'hiit': 0.3, 'cardio': 0.3, 'full_body': 0.3, 'core': 0.1},
+        'muscle_gain': {'upper': 0.4, 'lower': 0.4, 'full_body': 0.2},
+        'strength': {'upper': 0.35, 'lower': 0.35, 'full_body': 0.3},
+        'endurance': {'cardio': 0.5, 'hiit': 0.2, 'full_body': 0.2, 'core': 0.1},
+        'flexibility': {'mobility': 0.5, 'core': 0.25, 'full_body': 0.25},
+        'general_fitness': {'full_body': 0.4, 'cardio': 0.3, 'core': 0.15, 'hiit': 0.15}
+    }
+    
+    # Sets, reps and rest seconds per goal
+    PRESCRIPTIONS = {
+        'muscle_gain': (4, 8, 90),
+        'strength': (5, 5, 120),
+        'weight_loss': (3, 15, 45),
+        'endurance': (3, 20, 30)
+    }
+    
+    # Injury keywords looked for in the profile; the catalog tags the exercises each one rules out
+    INJURIES = ['knee', 'ankle', 'hip', 'back', 'shoulder', 'wrist', 'elbow', 'neck']
+    
+    # Hard sessions for the same muscle need a day in between
+    RECOVERY_DAYS = 2
+    WARMUP_MINUTES = 5
+    BEAM_WIDTH = 12
+    
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.calories = CalorieEngine()
+        self.initialize_plan_data()
+    
+    def initialize_plan_data(self):
+        """Initialize plan cache"""
+        if 'weekly_plan' not in st.session_state:
+            st.session_state.weekly_plan = {'key': None, 'plan': None}
+    
+    def constraints(self, goal=None, level=None):
+        """Planning constraints from the profile, with the given goal and level taking precedence"""
+        profile = st.session_state.get('profile_data', {})
+        goals = profile.get('goals', {})
+        fitness = profile.get('fitness', {})
+        
+        level = (level or goals.get('fitness_level') or fitness.get('fitness_level') or 'beginner').lower()
+        days = goals.get('weekly_workouts') or fitness.get('workout_days_per_week') or 3
+        minutes = goals.get('session_minutes') or fitness.get('workout_duration') or 45
+        
+        # Injuries are free text in the medical form and a list in the detailed profile
+        injuries = profile.get('medical', {}).get('injuries') or ''
+        injuries = ' '.join([injuries] + list(profile.get('health', {}).get('injuries') or [])).lower()
+        
+        return {
+            'goal': goal or goals.get('primary_goal', 'general_fitness'),
+            'level': level if level in self.LEVELS else 'beginner',
+            'days': max(1, min(int(days), self.DAYS)),
+            'minutes': max(15, int(minutes)),
+            'equipment': tuple(sorted(goals.get('equipment') or [])),
+            'injuries': tuple(sorted(k for k in self.INJURIES if k in injuries))
+        }
+    
+    def generate(self, goal=None, level=None):
+        """Weekly plan (Monday first), cached until the constraints or the weight behind its calories change"""
+        constraints = self.constraints(goal, level)
+        key = (tuple(sorted(constraints.items())), self.calories.model_key())
+        
+        cache = st.session_state.weekly_plan
+        if cache['key'] != key:
+            cache['plan'] = self.build(constraints)
+            cache['key'] = key
+        return cache['plan']
+    
+    def build(self, constraints):
+        """Search for the best schedule, then fill its sessions with exercises"""
+        pool = self.exercise_pool(constraints)
+        mix = self.GOAL_MIX.get(constraints['goal'], self.GOAL_MIX['general_fitness'])
+        
+        # Session types that can't be filled with suitable exercises are dropped
+        feasible = {t: share for t, share in mix.items() if self.catalog.count(self.candidates(t, pool)) >= 2}
+        if not feasible:
+            feasible = {'mobility': 1.0}
+        
+        schedule = self.search(feasible, constraints['days'])
+        
+        usage = {}
+        plan = []
+        for session_type in schedule:
+            if session_type is None:
+                plan.append({'type': 'rest', 'workout': 'Rest', 'duration': 0, 'calories': 0, 'focus': 'Recovery'})
+            else:
+                plan.append(self.fill_session(session_type, pool, constraints, usage))
+        return plan
+    
+    def exercise_pool(self, constraints):
+        """Bitset of catalog exercises allowed by level, equipment and injuries"""
+        return self.catalog.query(level=self.catalog.levels_up_to(constraints['level']),
+                                  equipment=['Bodyweight'] + list(constraints['equipment']),
+                                  exclude={'contraindication': constraints['injuries']})
+    
+    def candidates(self, session_type, pool):
+        """Bitset of pool exercises that fit a session type"""
+        session = self.SESSIONS[session_type]
+        bits = pool & self.catalog.query(category=session['categories'], muscle=session['muscles'])
+        
+        # Steady cardio is continuous locomotion; every other session leaves it out
+        steady = self.catalog.mask('pattern', 'locomotion')
+        return bits & steady if session.get('steady') else bits & ~steady
+    
+    def search(self, mix, days):
+        """Pick training days and session types with a beam search over a scored heuristic
+        
+        Returns 7 entries, Monday first, with None on rest days.
+        """
+        types = list(mix)
+        best, best_score = None, float('inf')
+        
+        for pattern in combinations(range(self.DAYS), days):
+            # Beam over the training days of this pattern, scoring as types get assigned
+            beam = [((), 0.0)]
+            for position in range(days):
+                expanded = []
+                for assigned, penalty in beam:
+                    for session_type in types:
+                        step = self.step_penalty(pattern, assigned, position, session_type)
+                        expanded.append((assigned + (session_type,), penalty + step))
+                expanded.sort(key=lambda item: item[1])
+                beam = expanded[:self.BEAM_WIDTH]
+            
+            for assigned, penalty in beam:
+                score = penalty + self.final_penalty(pattern, assigned, mix)
+                if score < best_score:
+                    best, best_score = (pattern, assigned), score
+        
+        schedule = [None] * self.DAYS
+        for day, session_type in zip(*best):
+            schedule[day] = session_type
+        return schedule
+    
+    def step_penalty(self, pattern, assigned, position, session_type):
+        """Cost of giving the training day at `position` this session type, given earlier days"""
+        penalty = 0.0
+        day = pattern[position]
+        loads = set(self.SESSIONS[session_type]['loads'])
+        
+        for earlier in range(position - 1, -1, -1):
+            gap = day - pattern[earlier]
+            if gap >= self.RECOVERY_DAYS:
+                break
+            # The same muscles trained hard again before they have recovered
+            penalty += 10 * len(loads.intersection(self.SESSIONS[assigned[earlier]]['loads']))
+            if assigned[earlier] == session_type:
+                penalty += 2
+        
+        return penalty
+    
+    def final_penalty(self, pattern, assigned, mix):
+        """Costs that need the whole week: wrap-around recovery, goal mix and day spacing"""
+        penalty = 0.0
+        days = len(pattern)
+        
+        # The plan repeats weekly, so Sunday is followed by Monday
+        if days > 1 and pattern[0] + self.DAYS - pattern[-1] < self.RECOVERY_DAYS:
+            first = set(self.SESSIONS[assigned[0]]['loads'])
+            penalty += 10 * len(first.intersection(self.SESSIONS[assigned[-1]]['loads']))
+            if assigned[0] == assigned[-1]:
+                penalty += 2
+        
+        # Distance from the goal's mix of session types
+        total = sum(mix.values())
+        for session_type, share in mix.items():
+            penalty += 3 * abs(assigned.count(session_type) - share / total * days)
+        
+        # Prefer rest days spread out rather than long blocks of training
+        gaps = [(pattern[(i + 1) % days] - pattern[i]) % self.DAYS or self.DAYS for i in range(days)]
+        penalty += 0.5 * (max(gaps) - min(gaps))
+        run = longest = 0
+        for day in range(2 * self.DAYS):
+            run = run + 1 if day % self.DAYS in pattern else 0
+            longest = max(longest, min(run, days))
+        penalty += 3 * max(0, longest - 3)
+        
+        return penalty
+    
+    def fill_session(self, session_type, pool, constraints, usage):
+        """Pick exercises for a session within the available minutes, rotating through the week"""
+        session = self.SESSIONS[session_type]
+        candidates = self.candidates(session_type, pool)
+        budget = constraints['minutes'] - self.WARMUP_MINUTES
+        
+        exercises = []
+        used = 0.0
+        # (activity, minutes) per exercise, priced in one vectorized call at the end
+        effort = [('general', self.WARMUP_MINUTES)]
+        muscles = session['muscles']
+        
+        # Movements (by base name) rotate across the week, then their variations (by id), plain versions first
+        preference = lambda e: (usage.get(e['base'], 0), usage.get(e['id'], 0), e['id'])
+        
+        # Steady cardio is one or two long blocks rather than sets
+        if session.get('steady'):
+            blocks = []
+            for exercise in sorted(self.catalog.entries(candidates), key=preference):
+                if len(blocks) < (2 if budget >= 40 else 1) and exercise['base'] not in [b['base'] for b in blocks]:
+                    blocks.append(exercise)
+            for exercise in blocks:
+                minutes = budget / len(blocks)
+                exercises.append(self.prescribe(exercise, session, constraints, minutes))
+                self.use(exercise, usage)
+                effort.append((self.calories.activity(exercise['name'], exercise['pattern']), minutes))
+            used = budget
+        else:
+            # Round-robin over the session's muscles, one variation per movement
+            taken = 0
+            index = 0
+            while index < 4 * len(muscles):
+                muscle = muscles[index % len(muscles)]
+                index += 1
+                options = candidates & self.catalog.mask('muscle', muscle) & ~taken
+                if not options:
+                    continue
+                
+                exercise = min(self.catalog.entries(options), key=preference)
+                prescribed = self.prescribe(exercise, session, constraints)
+                minutes = self.exercise_minutes(prescribed)
+                if exercises and used + minutes > budget:
+                    break
+                
+                exercises.append(prescribed)
+                taken |= self.catalog.mask('base', exercise['base'])
+                self.use(exercise, usage)
+                used += minutes
+                effort.append((self.calories.activity(exercise['name'], exercise['pattern']), minutes))
+        
+        # Warm-up is light, intervals hard and everything else moderate
+        intensity = 'Hard' if session.get('intervals') else 'Moderate'
+        levels = [0.0] + [self.calories.intensity_level(intensity)] * (len(effort) - 1)
+        activities, minutes = zip(*effort)
+        calories = self.calories.estimate_many(activities, minutes, levels, self.calories.profile()[0]).sum()
+        
+        # Logged sessions are re-estimated as their main activity
+        totals = {}
+        for activity, block in effort[1:]:
+            totals[activity] = totals.get(activity, 0) + block
+        
+        trained = sorted({m for e in exercises for m in e['muscles']})
+        return {
+            'type': 'workout',
+            'workout': session['name'],
+            'duration': int(round(used + self.WARMUP_MINUTES)),
+            'calories': int(round(calories)),
+            'activity': max(totals, key=totals.get) if totals else 'general',
+            'intensity': intensity,
+            'focus': session['focus'],
+            'description': f"{len(exercises)} exercises for {', '.join(trained)} after a {self.WARMUP_MINUTES}-minute warm-up",
+            'exercises': exercises
+        }
+    
+    def use(self, exercise, usage):
+        """Count an exercise and its movement as used this week"""
+        usage[exercise['base']] = usage.get(exercise['base'], 0) + 1
+        usage[exercise['id']] = usage.get(exercise['id'], 0) + 1
+    
+    def prescribe(self, exercise, session, constraints, minutes=None):
+        """Sets, reps or timings for an exercise in a session"""
+        sets, reps, rest = self.PRESCRIPTIONS.get(constraints['goal'], (3, 12, 60))
+        level = self.LEVELS.index(constraints['level'])
+        sets = max(2, sets + (level > 1) - (level == 0))
+        
+        prescribed = {
+            'name': exercise['name'],
+            'muscles': exercise['muscles'],
+            'instructions': exercise.get('instructions', 'Perform with proper form'),
+            'rest': rest
+        }
+        
+        if minutes is not None:
+            prescribed.update(sets=1, minutes=int(round(minutes)), rest=0)
+        elif session.get('intervals') or exercise['category'] == 'cardio':
+            prescribed.update(sets=sets + 1, duration=30 if level == 0 else 40, rest=20)
+        elif exercise.get('hold'):
+            prescribed.update(sets=sets, duration=30 + 15 * min(level, 2), rest=30)
+        else:
+            prescribed.update(sets=sets, reps=reps)
+        return prescribed
+    
+    def exercise_minutes(self, prescribed):
+        """Estimated time for an exercise including rests (about 3 seconds per rep)"""
+        if 'minutes' in prescribed:
+            return prescribed['minutes']
+        work = prescribed.get('duration') or prescribed.get('reps', 10) * 3
+        return prescribed['sets'] * (work + prescribed['rest']) / 60
\ No newline at end of file
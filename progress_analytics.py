@@ -1,928 +1,1317 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
-
-class ProgressAnalytics:
-    def __init__(self):
-        pass
-    
-    def render(self):
-        """Render progress analytics interface"""
-        st.markdown('<h1 class="main-header">📈 PROGRESS ANALYTICS</h1>', unsafe_allow_html=True)
-        
-        tabs = st.tabs(["BMI Tracker", "Fitness Goals", "Workout Progress", "Nutrition Progress", "Health Trends"])
-        
-        with tabs[0]:
-            self.render_bmi_tracker()
-        
-        with tabs[1]:
-            self.render_fitness_goals()
-        
-        with tabs[2]:
-            self.render_workout_progress()
-        
-        with tabs[3]:
-            self.render_nutrition_progress()
-        
-        with tabs[4]:
-            self.render_health_trends()
-    
-    def render_bmi_tracker(self):
-        """Render BMI tracking interface"""
-        st.markdown('<div class="section-header">⚖️ BMI TRACKER</div>', unsafe_allow_html=True)
-        
-        if 'profile_data' not in st.session_state:
-            st.warning("Please complete your profile first!")
-            return
-        
-        profile = st.session_state.profile_data
-        personal = profile['personal']
-        goals = profile['goals']
-        
-        # Calculate current BMI
-        height_m = personal['height'] / 100
-        current_weight = personal['weight']
-        target_weight = goals['target_weight']
-        
-        current_bmi = self.calculate_bmi()
-        target_bmi = target_weight / (height_m ** 2) if height_m > 0 else 0
-        
-        bmi_category = self.get_bmi_category(current_bmi)
-        target_category = self.get_bmi_category(target_bmi)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Current BMI display
-            category_colors = {
-                'Underweight': '#FFA500',
-                'Normal': '#00FF87',
-                'Overweight': '#FFA500',
-                'Obese': '#FF4444'
-            }
-            
-            color = category_colors.get(bmi_category, '#00FF87')
-            
-            st.markdown(f"""
-            <div class="stats-card">
-                <h4 style="color: {color};">CURRENT BMI</h4>
-                <div style="text-align: center; margin: 1.5rem 0;">
-                    <div style="color: white; font-size: 3.5rem; font-weight: 800;">{current_bmi:.1f}</div>
-                    <div style="color: {color}; font-size: 1.2rem; margin-top: 0.5rem;">{bmi_category}</div>
-                </div>
-                <div style="color: #CCCCCC; text-align: center;">
-                    Weight: {current_weight} kg | Height: {personal['height']} cm
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            # Target BMI display
-            target_color = category_colors.get(target_category, '#00FF87')
-            
-            st.markdown(f"""
-            <div class="stats-card">
-                <h4 style="color: {target_color};">TARGET BMI</h4>
-                <div style="text-align: center; margin: 1.5rem 0;">
-                    <div style="color: white; font-size: 3.5rem; font-weight: 800;">{target_bmi:.1f}</div>
-                    <div style="color: {target_color}; font-size: 1.2rem; margin-top: 0.5rem;">{target_category}</div>
-                </div>
-                <div style="color: #CCCCCC; text-align: center;">
-                    Target Weight: {target_weight} kg
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # BMI Progress
-        weight_difference = target_weight - current_weight
-        progress_percent = 0
-        
-        if weight_difference > 0:  # Need to gain weight
-            if current_weight < target_weight:
-                progress_percent = (current_weight / target_weight) * 100
-        else:  # Need to lose weight
-            start_weight = current_weight + abs(weight_difference) * 2
-            if start_weight > current_weight:
-                progress_percent = ((start_weight - current_weight) / abs(weight_difference)) * 100
-        
-        progress_percent = min(progress_percent, 100)
-        
-        st.markdown("**📊 PROGRESS TO GOAL**")
-        
-        st.markdown(f"""
-        <div style="margin: 1rem 0;">
-            <div style="display: flex; justify-content: space-between; color: #CCCCCC;">
-                <span>Progress</span>
-                <span>{progress_percent:.1f}%</span>
-            </div>
-            <div style="background: rgba(255, 255, 255, 0.1); height: 20px; border-radius: 10px;">
-                <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
-                           width: {progress_percent}%; height: 100%; border-radius: 10px;"></div>
-            </div>
-            <div style="color: #999999; text-align: center; margin-top: 10px;">
-                {abs(weight_difference):.1f} kg {'to gain' if weight_difference > 0 else 'to lose'}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # BMI Chart
-        st.markdown("**📈 BMI CHART**")
-        
-        # Create sample BMI history
-        bmi_history = self.create_bmi_history(current_bmi, target_bmi)
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=list(bmi_history.keys()),
-            y=list(bmi_history.values()),
-            mode='lines+markers',
-            line=dict(color='#00FF87', width=3),
-            marker=dict(size=8, color='#00D4FF'),
-            name='BMI'
-        ))
-        
-        # Add target line
-        fig.add_hline(y=target_bmi, line_dash="dash", line_color="#FFA500", 
-                     annotation_text="Target", annotation_position="bottom right")
-        
-        # Add healthy range
-        fig.add_hrect(y0=18.5, y1=24.9, fillcolor="rgba(0, 255, 135, 0.1)", 
-                     layer="below", line_width=0)
-        
-        fig.update_layout(
-            title="BMI Progress Over Time",
-            xaxis_title="Date",
-            yaxis_title="BMI",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Recommendations based on BMI
-        recommendations = self.get_bmi_recommendations(current_bmi, target_bmi)
-        
-        st.markdown("**💡 RECOMMENDATIONS**")
-        
-        for rec in recommendations:
-            st.info(rec)
-    
-    def calculate_bmi(self):
-        """Calculate BMI from profile data"""
-        if 'profile_data' not in st.session_state:
-            return 22.0
-        
-        profile = st.session_state.profile_data
-        height_m = profile['personal']['height'] / 100
-        weight = profile['personal']['weight']
-        
-        if height_m > 0:
-            return weight / (height_m ** 2)
-        return 22.0
-    
-    def get_bmi_category(self, bmi):
-        """Get BMI category"""
-        if bmi < 18.5:
-            return "Underweight"
-        elif bmi < 25:
-            return "Normal"
-        elif bmi < 30:
-            return "Overweight"
-        else:
-            return "Obese"
-    
-    def create_bmi_history(self, current_bmi, target_bmi):
-        """Create sample BMI history"""
-        history = {}
-        
-        for i in range(30, 0, -1):
-            date = (datetime.now() - timedelta(days=i)).strftime('%m/%d')
-            # Simulate progress toward target
-            progress = i / 30
-            bmi = current_bmi + (target_bmi - current_bmi) * (1 - progress)
-            history[date] = round(bmi, 1)
-        
-        return history
-    
-    def get_bmi_recommendations(self, current_bmi, target_bmi):
-        """Get recommendations based on BMI"""
-        recommendations = []
-        
-        if current_bmi < 18.5:
-            recommendations.append("Focus on calorie-dense, nutritious foods")
-            recommendations.append("Include strength training to build muscle mass")
-            recommendations.append("Consider smaller, more frequent meals")
-        
-        elif current_bmi > 25:
-            recommendations.append("Create a consistent calorie deficit")
-            recommendations.append("Combine cardio and strength training")
-            recommendations.append("Focus on whole foods and protein")
-        
-        if abs(target_bmi - current_bmi) > 2:
-            recommendations.append(f"Aim to {'gain' if target_bmi > current_bmi else 'lose'} "
-                                 f"{abs(target_bmi - current_bmi):.1f} BMI points")
-        
-        if not recommendations:
-            recommendations.append("Maintain your current healthy habits")
-            recommendations.append("Focus on body composition rather than weight")
-        
-        return recommendations
-    
-    def render_fitness_goals(self):
-        """Render fitness goals tracking"""
-        st.markdown('<div class="section-header">🎯 FITNESS GOALS TRACKER</div>', unsafe_allow_html=True)
-        
-        if 'profile_data' not in st.session_state:
-            st.warning("Please complete your profile first!")
-            return
-        
-        goals = st.session_state.profile_data['goals']
-        
-        # Primary goal
-        primary_goal = goals.get('primary_goal', 'general_fitness')
-        secondary_goals = goals.get('secondary_goals', [])
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            goal_descriptions = {
-                'weight_loss': 'Reduce body fat percentage',
-                'muscle_gain': 'Increase lean muscle mass',
-                'endurance': 'Improve cardiovascular fitness',
-                'flexibility': 'Increase range of motion',
-                'general_fitness': 'Overall health improvement'
-            }
-            
-            st.markdown(f"""
-            <div class="stats-card">
-                <h4 style="color: #00FF87;">🎯 PRIMARY GOAL</h4>
-                <div style="text-align: center; margin: 1.5rem 0;">
-                    <div style="color: white; font-size: 2rem; font-weight: 600;">
-                        {primary_goal.replace('_', ' ').title()}
-                    </div>
-                    <div style="color: #CCCCCC; margin-top: 1rem;">
-                        {goal_descriptions.get(primary_goal, 'Custom fitness goal')}
-                    </div>
-                </div>
-                <div style="color: #999999; text-align: center;">
-                    Timeline: {goals.get('timeline', '3_months').replace('_', ' ').title()}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            if secondary_goals:
-                goals_list = '<br>'.join([f"• {g.replace('_', ' ').title()}" for g in secondary_goals])
-            else:
-                goals_list = "No secondary goals set"
-            
-            st.markdown(f"""
-            <div class="stats-card">
-                <h4 style="color: #00FF87;">📋 SECONDARY GOALS</h4>
-                <div style="color: #CCCCCC; margin: 1.5rem 0; min-height: 120px;">
-                    {goals_list}
-                </div>
-                <div style="color: #999999; text-align: center;">
-                    {len(secondary_goals)} goal{'s' if len(secondary_goals) != 1 else ''} set
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Goal progress tracking
-        st.markdown("**📊 GOAL PROGRESS**")
-        
-        goal_progress = self.calculate_goal_progress(primary_goal)
-        
-        for goal, progress in goal_progress.items():
-            st.markdown(f"""
-            <div style="margin: 1rem 0;">
-                <div style="display: flex; justify-content: space-between; color: #CCCCCC;">
-                    <span>{goal.replace('_', ' ').title()}</span>
-                    <span>{progress['percent']:.0f}%</span>
-                </div>
-                <div style="background: rgba(255, 255, 255, 0.1); height: 15px; border-radius: 8px;">
-                    <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
-                               width: {progress['percent']}%; height: 100%; border-radius: 8px;"></div>
-                </div>
-                <div style="color: #999999; font-size: 0.9rem;">
-                    {progress['status']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Milestone tracker
-        st.markdown("**🏆 MILESTONES**")
-        
-        milestones = self.get_milestones(primary_goal)
-        
-        cols = st.columns(3)
-        for i, milestone in enumerate(milestones[:3]):
-            with cols[i]:
-                status = "✅" if milestone['achieved'] else "⏳"
-                color = "#00FF87" if milestone['achieved'] else "#666666"
-                
-                st.markdown(f"""
-                <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 10px; 
-                            border: 1px solid {color}; text-align: center;">
-                    <div style="color: {color}; font-size: 2rem;">{status}</div>
-                    <div style="color: white; margin: 0.5rem 0;">{milestone['title']}</div>
-                    <div style="color: #999999; font-size: 0.9rem;">{milestone['description']}</div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def calculate_goal_progress(self, primary_goal):
-        """Calculate progress toward goals"""
-        progress = {}
-        
-        # Weight goal progress
-        if 'profile_data' in st.session_state:
-            profile = st.session_state.profile_data
-            current_weight = profile['personal']['weight']
-            target_weight = profile['goals']['target_weight']
-            
-            if primary_goal == 'weight_loss':
-                if current_weight < target_weight:
-                    percent = 100
-                    status = "Goal achieved! 🎉"
-                else:
-                    # Assuming starting weight was current_weight + (current_weight - target_weight)
-                    start_weight = current_weight + (current_weight - target_weight)
-                    percent = ((start_weight - current_weight) / (start_weight - target_weight)) * 100
-                    status = f"{current_weight - target_weight:.1f} kg to go"
-            else:
-                percent = 50  # Default for other goals
-                status = "In progress"
-            
-            progress['weight'] = {'percent': min(percent, 100), 'status': status}
-        
-        # Workout consistency progress
-        if 'workout_history' in st.session_state:
-            workouts = st.session_state.workout_history
-            recent_workouts = [w for w in workouts 
-                              if datetime.strptime(w.get('date', '2000-01-01'), '%Y-%m-%d') 
-                              >= datetime.now() - timedelta(days=30)]
-            
-            percent = min((len(recent_workouts) / 12) * 100, 100)  # 12 workouts/month target
-            progress['consistency'] = {
-                'percent': percent,
-                'status': f"{len(recent_workouts)} workouts this month"
-            }
-        
-        return progress
-    
-    def get_milestones(self, primary_goal):
-        """Get milestones for the primary goal"""
-        milestones = [
-            {
-                'title': 'First Week Complete',
-                'description': '7 consecutive days of tracking',
-                'achieved': st.session_state.get('streak_days', 0) >= 7
-            },
-            {
-                'title': 'Consistent Month',
-                'description': '20+ workouts in 30 days',
-                'achieved': False
-            },
-            {
-                'title': 'Nutrition Master',
-                'description': '7 days of perfect nutrition',
-                'achieved': False
-            }
-        ]
-        
-        return milestones
-    
-    def render_workout_progress(self):
-        """Render workout progress tracking"""
-        st.markdown('<div class="section-header">🏋️‍♂️ WORKOUT PROGRESS</div>', unsafe_allow_html=True)
-        
-        if 'workout_history' not in st.session_state or not st.session_state.workout_history:
-            st.info("No workout data yet. Complete your first workout!")
-            return
-        
-        workouts = st.session_state.workout_history
-        
-        # Statistics
-        total_workouts = len(workouts)
-        total_calories = sum(w.get('calories', 0) for w in workouts)
-        total_duration = sum(w.get('duration', 0) for w in workouts)
-        
-        # Last 30 days
-        recent_date = datetime.now() - timedelta(days=30)
-        recent_workouts = [w for w in workouts 
-                          if datetime.strptime(w.get('date', '2000-01-01'), '%Y-%m-%d') >= recent_date]
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Total Workouts", total_workouts)
-        with col2:
-            st.metric("Calories Burned", f"{total_calories:,}")
-        with col3:
-            st.metric("Total Hours", f"{total_duration/60:.0f}")
-        
-        # Weekly progress chart
-        st.markdown("**📈 WEEKLY PROGRESS**")
-        
-        weekly_data = self.calculate_weekly_workouts()
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=list(weekly_data.keys()),
-                y=list(weekly_data.values()),
-                marker_color='#00FF87',
-                text=list(weekly_data.values()),
-                textposition='auto'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Workouts Per Week (Last 8 Weeks)",
-            xaxis_title="Week",
-            yaxis_title="Number of Workouts",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Performance metrics
-        st.markdown("**⚡ PERFORMANCE METRICS**")
-        
-        if recent_workouts:
-            avg_calories = sum(w.get('calories', 0) for w in recent_workouts) / len(recent_workouts)
-            avg_duration = sum(w.get('duration', 0) for w in recent_workouts) / len(recent_workouts)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #00FF87; font-size: 1.2rem;">🔥 AVERAGE CALORIES</div>
-                    <div style="text-align: center; margin: 1rem 0;">
-                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_calories:.0f}</div>
-                        <div style="color: #CCCCCC;">per workout</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #00FF87; font-size: 1.2rem;">⏱️ AVERAGE DURATION</div>
-                    <div style="text-align: center; margin: 1rem 0;">
-                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_duration:.0f}</div>
-                        <div style="color: #CCCCCC;">minutes</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def calculate_weekly_workouts(self):
-        """Calculate workouts per week for last 8 weeks"""
-        if 'workout_history' not in st.session_state:
-            return {}
-        
-        workouts = st.session_state.workout_history
-        weekly_data = {}
-        
-        for i in range(8, 0, -1):
-            week_start = datetime.now() - timedelta(weeks=i)
-            week_end = week_start + timedelta(days=7)
-            
-            week_workouts = [w for w in workouts 
-                            if week_start <= datetime.strptime(w.get('date', '2000-01-01'), '%Y-%m-%d') < week_end]
-            
-            week_label = f"Week {9-i}"
-            weekly_data[week_label] = len(week_workouts)
-        
-        return weekly_data
-    
-    def render_nutrition_progress(self):
-        """Render nutrition progress tracking"""
-        st.markdown('<div class="section-header">🍎 NUTRITION PROGRESS</div>', unsafe_allow_html=True)
-        
-        if 'nutrition_logs' not in st.session_state or not st.session_state.nutrition_logs:
-            st.info("No nutrition data yet. Log your first meal!")
-            return
-        
-        nutrition_logs = st.session_state.nutrition_logs
-        
-        # Today's nutrition
-        today = datetime.now().strftime('%Y-%m-%d')
-        today_logs = [log for log in nutrition_logs if log.get('date') == today]
-        
-        if today_logs:
-            today_calories = sum(log.get('calories', 0) for log in today_logs)
-            today_protein = sum(log.get('protein', 0) for log in today_logs)
-            
-            # Get targets using local functions
-            protein_target = self.get_protein_target_local()
-            calorie_target = self.get_calorie_target_local()
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                cal_percent = min((today_calories / calorie_target) * 100, 100) if calorie_target > 0 else 0
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #00FF87; font-size: 1.2rem;">🔥 TODAY'S CALORIES</div>
-                    <div style="text-align: center; margin: 1rem 0;">
-                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{today_calories}</div>
-                        <div style="color: #CCCCCC;">/ {calorie_target} target</div>
-                    </div>
-                    <div style="background: rgba(255, 255, 255, 0.1); height: 10px; border-radius: 5px;">
-                        <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
-                                   width: {cal_percent}%; height: 100%; border-radius: 5px;"></div>
-                    </div>
-                    <div style="color: #999999; text-align: center; margin-top: 10px;">
-                        {cal_percent:.0f}% of daily goal
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                prot_percent = min((today_protein / protein_target) * 100, 100) if protein_target > 0 else 0
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #00FF87; font-size: 1.2rem;">🥚 TODAY'S PROTEIN</div>
-                    <div style="text-align: center; margin: 1rem 0;">
-                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{today_protein:.0f}g</div>
-                        <div style="color: #CCCCCC;">/ {protein_target}g target</div>
-                    </div>
-                    <div style="background: rgba(255, 255, 255, 0.1); height: 10px; border-radius: 5px;">
-                        <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
-                                   width: {prot_percent}%; height: 100%; border-radius: 5px;"></div>
-                    </div>
-                    <div style="color: #999999; text-align: center; margin-top: 10px;">
-                        {prot_percent:.0f}% of daily goal
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Weekly nutrition trend
-        st.markdown("**📊 WEEKLY NUTRITION TREND**")
-        
-        weekly_nutrition = self.calculate_weekly_nutrition()
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=list(weekly_nutrition.keys()),
-            y=[n['calories'] for n in weekly_nutrition.values()],
-            mode='lines+markers',
-            name='Calories',
-            line=dict(color='#00FF87', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=list(weekly_nutrition.keys()),
-            y=[n['protein'] for n in weekly_nutrition.values()],
-            mode='lines+markers',
-            name='Protein (g)',
-            line=dict(color='#00D4FF', width=3),
-            yaxis='y2'
-        ))
-        
-        fig.update_layout(
-            title="Weekly Nutrition Intake",
-            xaxis_title="Week",
-            yaxis_title="Calories",
-            yaxis2=dict(
-                title="Protein (g)",
-                overlaying='y',
-                side='right'
-            ),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    def calculate_weekly_nutrition(self):
-        """Calculate weekly nutrition data"""
-        if 'nutrition_logs' not in st.session_state:
-            return {}
-        
-        nutrition_logs = st.session_state.nutrition_logs
-        weekly_data = {}
-        
-        for i in range(4, 0, -1):
-            week_start = datetime.now() - timedelta(weeks=i)
-            week_end = week_start + timedelta(days=7)
-            
-            week_logs = [log for log in nutrition_logs 
-                        if week_start <= datetime.strptime(log.get('date', '2000-01-01'), '%Y-%m-%d') < week_end]
-            
-            week_calories = sum(log.get('calories', 0) for log in week_logs)
-            week_protein = sum(log.get('protein', 0) for log in week_logs)
-            
-            week_label = f"Week {5-i}"
-            weekly_data[week_label] = {
-                'calories': week_calories,
-                'protein': week_protein
-            }
-        
-        return weekly_data
-    
-    # NEW: Local functions to replace nutrition_engine imports
-    def get_calorie_target_local(self):
-        """Calculate calorie target locally"""
-        if 'profile_data' not in st.session_state:
-            return 2000
-        
-        profile = st.session_state.profile_data
-        goals = profile['goals']
-        primary_goal = goals.get('primary_goal', 'general_fitness')
-        
-        # Calculate TDEE locally
-        tdee = self.calculate_tdee_local()
-        
-        # Adjust based on goal
-        adjustments = {
-            'weight_loss': -500,
-            'muscle_gain': +300,
-            'endurance': +200,
-            'general_fitness': 0
-        }
-        
-        adjustment = adjustments.get(primary_goal, 0)
-        return max(1200, tdee + adjustment)
-    
-    def get_protein_target_local(self):
-        """Calculate protein target locally"""
-        if 'profile_data' not in st.session_state:
-            return 80
-        
-        profile = st.session_state.profile_data
-        weight = profile['personal']['weight']
-        goals = profile['goals']
-        primary_goal = goals.get('primary_goal', 'general_fitness')
-        
-        # Protein per kg based on goal
-        protein_per_kg = {
-            'weight_loss': 2.0,
-            'muscle_gain': 2.2,
-            'endurance': 1.6,
-            'general_fitness': 1.8
-        }
-        
-        multiplier = protein_per_kg.get(primary_goal, 1.8)
-        return int(weight * multiplier)
-    
-    def calculate_tdee_local(self):
-        """Calculate Total Daily Energy Expenditure locally"""
-        if 'profile_data' not in st.session_state:
-            return 2000
-        
-        profile = st.session_state.profile_data
-        personal = profile['personal']
-        lifestyle = profile['lifestyle']
-        
-        # BMR calculation (Mifflin-St Jeor)
-        if personal['gender'] == 'Male':
-            bmr = 10 * personal['weight'] + 6.25 * personal['height'] - 5 * personal['age'] + 5
-        else:
-            bmr = 10 * personal['weight'] + 6.25 * personal['height'] - 5 * personal['age'] - 161
-        
-        # Activity multiplier
-        activity_map = {
-            'Sedentary': 1.2,
-            'Light': 1.375,
-            'Moderate': 1.55,
-            'Active': 1.725,
-            'Very Active': 1.9
-        }
-        
-        activity = lifestyle.get('activity_level', 'Moderate')
-        multiplier = activity_map.get(activity, 1.55)
-        
-        return int(bmr * multiplier)
-    
-    def render_health_trends(self):
-        """Render health trends tracking"""
-        st.markdown('<div class="section-header">❤️ HEALTH TRENDS</div>', unsafe_allow_html=True)
-        
-        # Health metrics overview
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Sleep trend
-            if st.session_state.get('sleep_history'):
-                avg_sleep = sum(s['hours'] for s in st.session_state.sleep_history[-7:]) / 7
-            else:
-                avg_sleep = 7
-            
-            sleep_color = '#00FF87' if avg_sleep >= 7 else '#FFA500' if avg_sleep >= 6 else '#FF4444'
-            
-            st.markdown(f"""
-            <div class="metric-card">
-                <div style="color: {sleep_color}; font-size: 1.2rem;">💤 AVERAGE SLEEP</div>
-                <div style="text-align: center; margin: 1rem 0;">
-                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_sleep:.1f}</div>
-                    <div style="color: #CCCCCC;">hours/night</div>
-                </div>
-                <div style="color: #999999; text-align: center;">
-                    Last 7 days
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            # Water trend
-            avg_water = st.session_state.get('water_intake', 0)
-            water_target = st.session_state.profile_data['nutrition']['water_target'] \
-                if 'profile_data' in st.session_state else 8
-            
-            water_percent = min((avg_water / water_target) * 100, 100) if water_target > 0 else 0
-            water_color = '#00FF87' if water_percent >= 80 else '#FFA500' if water_percent >= 50 else '#FF4444'
-            
-            st.markdown(f"""
-            <div class="metric-card">
-                <div style="color: {water_color}; font-size: 1.2rem;">💧 DAILY WATER</div>
-                <div style="text-align: center; margin: 1rem 0;">
-                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_water:.0f}</div>
-                    <div style="color: #CCCCCC;">glasses/day</div>
-                </div>
-                <div style="color: #999999; text-align: center;">
-                    Target: {water_target} glasses
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            # Mood trend
-            if st.session_state.get('mood_history'):
-                mood_values = {
-                    'happy': 5,
-                    'energized': 4,
-                    'neutral': 3,
-                    'tired': 2,
-                    'sad': 1,
-                    'angry': 0
-                }
-                
-                recent_moods = st.session_state.mood_history[-7:]
-                avg_mood = sum(mood_values.get(m['mood'], 3) for m in recent_moods) / len(recent_moods)
-            else:
-                avg_mood = 3
-            
-            mood_color = '#00FF87' if avg_mood >= 4 else '#FFA500' if avg_mood >= 2.5 else '#FF4444'
-            mood_text = ['Angry', 'Sad', 'Tired', 'Neutral', 'Energized', 'Happy'][int(avg_mood)]
-            
-            st.markdown(f"""
-            <div class="metric-card">
-                <div style="color: {mood_color}; font-size: 1.2rem;">😊 AVERAGE MOOD</div>
-                <div style="text-align: center; margin: 1rem 0;">
-                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{mood_text}</div>
-                    <div style="color: #CCCCCC;">{avg_mood:.1f}/5.0</div>
-                </div>
-                <div style="color: #999999; text-align: center;">
-                    Last 7 days
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Health improvement chart
-        st.markdown("**📈 HEALTH IMPROVEMENT TREND**")
-        
-        health_data = self.create_health_trend_data()
-        
-        fig = go.Figure()
-        
-        metrics = ['Sleep', 'Water', 'Mood', 'Activity']
-        colors = ['#00FF87', '#00D4FF', '#FFA500', '#FF4444']
-        
-        for i, metric in enumerate(metrics):
-            fig.add_trace(go.Scatter(
-                x=list(health_data.keys()),
-                y=[h[metric.lower()] for h in health_data.values()],
-                mode='lines+markers',
-                name=metric,
-                line=dict(color=colors[i], width=2)
-            ))
-        
-        fig.update_layout(
-            title="Health Metrics Trend (Last 4 Weeks)",
-            xaxis_title="Week",
-            yaxis_title="Score (0-100)",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Recommendations
-        st.markdown("**💡 HEALTH RECOMMENDATIONS**")
-        
-        recommendations = self.get_health_recommendations()
-        
-        for rec in recommendations:
-            st.info(rec)
-    
-    def create_health_trend_data(self):
-        """Create health trend data"""
-        data = {}
-        
-        for i in range(4, 0, -1):
-            week_label = f"Week {5-i}"
-            
-            # Simulate improving health metrics
-            import random
-            base_sleep = 70 + i * 5
-            base_water = 60 + i * 7
-            base_mood = 65 + i * 8
-            base_activity = 50 + i * 10
-            
-            data[week_label] = {
-                'sleep': min(base_sleep + random.randint(-5, 5), 100),
-                'water': min(base_water + random.randint(-5, 5), 100),
-                'mood': min(base_mood + random.randint(-5, 5), 100),
-                'activity': min(base_activity + random.randint(-5, 5), 100)
-            }
-        
-        return data
-    
-    def get_health_recommendations(self):
-        """Get health recommendations based on trends"""
-        recommendations = []
-        
-        if 'profile_data' in st.session_state:
-            profile = st.session_state.profile_data
-            
-            # Sleep recommendations
-            if profile['health']['sleep_hours'] < 7:
-                recommendations.append(f"Aim for 7-9 hours of sleep. Current: {profile['health']['sleep_hours']} hours")
-            
-            # Water recommendations
-            water_target = profile['nutrition']['water_target']
-            current_water = st.session_state.get('water_intake', 0)
-            if current_water < water_target:
-                recommendations.append(f"Drink more water: {current_water}/{water_target} glasses today")
-            
-            # Stress recommendations
-            if profile['health']['stress_level'] == 'High':
-                recommendations.append("Practice stress management techniques daily")
-        
-        if not recommendations:
-            recommendations.append("Your health metrics are looking good! Keep up the great work!")
-        
-        return recommendations
-    
-    def render_mini_dashboard(self):
-        """Render mini progress dashboard for main page"""
-        if 'profile_data' not in st.session_state:
-            return
-        
-        # Calculate progress
-        bmi = self.calculate_bmi()
-        bmi_category = self.get_bmi_category(bmi)
-        
-        # Streak
-        streak = st.session_state.get('streak_days', 0)
-        
-        # Workouts this week
-        if 'workout_history' in st.session_state:
-            workouts_week = len([w for w in st.session_state.workout_history 
-                                if datetime.strptime(w.get('date', '2000-01-01'), '%Y-%m-%d').isocalendar()[1] 
-                                == datetime.now().isocalendar()[1]])
-        else:
-            workouts_week = 0
-        
-        st.markdown(f"""
-        <div style="background: rgba(0, 20, 10, 0.8); padding: 1.5rem; border-radius: 15px;">
-            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
-                <div style="text-align: center;">
-                    <div style="color: #00FF87; font-size: 1.5rem;">⚖️</div>
-                    <div style="color: white; font-size: 1.2rem;">{bmi:.1f}</div>
-                    <div style="color: #CCCCCC; font-size: 0.8rem;">BMI ({bmi_category})</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="color: #00FF87; font-size: 1.5rem;">🔥</div>
-                    <div style="color: white; font-size: 1.2rem;">{streak}</div>
-                    <div style="color: #CCCCCC; font-size: 0.8rem;">Day Streak</div>
-                </div>
-            </div>
-            <div style="text-align: center;">
-                <div style="color: #00FF87; font-size: 0.9rem;">🏋️‍♂️ {workouts_week} workouts this week</div>
-                <div style="color: #999999; font-size: 0.8rem; margin-top: 0.5rem;">
-                    Keep up the momentum! 💪
-                </div>
-            </div>
-        </div>
+import streamlit as st
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import plotly.graph_objects as go
+import plotly.express as px
+from day_tracker import DayTracker
+from daily_rollups import DailyRollups
+from metric_definitions import MetricQueries
+from hydration import HydrationModel
+from health_score import HealthScore
+from correlation_engine import CorrelationEngine
+from body_log import BodyLog
+from trend_detection import TrendDetector
+from goal_projection import GoalProjection
+from tdee_estimator import TDEEEstimator
+from period_comparison import PeriodComparison
+from activity_analytics import ActivityAnalytics
+
+class ProgressAnalytics:
+    # Body chart range -> (days shown, resampling rule)
+    BODY_RANGES = {
+        '1 Month': (30, 'D'),
+        '3 Months': (91, 'D'),
+        '6 Months': (182, 'W'),
+        '1 Year': (365, 'W'),
+        'All': (None, 'W')
+    }
+    
+    def __init__(self):
+        pass
+    
+    def render(self):
+        """Render progress analytics interface"""
+        st.markdown('<h1 class="main-header">📈 PROGRESS ANALYTICS</h1>', unsafe_allow_html=True)
+        
+        tabs = st.tabs(["BMI Tracker", "Fitness Goals", "Workout Progress", "Nutrition Progress", "Health Trends", "Compare Periods"])
+        
+        with tabs[0]:
+            self.render_bmi_tracker()
+        
+        with tabs[1]:
+            self.render_fitness_goals()
+        
+        with tabs[2]:
+            self.render_workout_progress()
+        
+        with tabs[3]:
+            self.render_nutrition_progress()
+        
+        with tabs[4]:
+            self.render_health_trends()
+        
+        with tabs[5]:
+            self.render_period_comparison()
+    
+    def render_bmi_tracker(self):
+        """Render BMI tracking interface"""
+        st.markdown('<div class="section-header">⚖️ BMI TRACKER</div>', unsafe_allow_html=True)
+        
+        if 'profile_data' not in st.session_state:
+            st.warning("Please complete your profile first!")
+            return
+        
+        profile = st.session_state.profile_data
+        personal = profile['personal']
+        goals = profile['goals']
+        
+        # Calculate current BMI
+        height_m = personal['height'] / 100
+        current_weight = personal['weight']
+        target_weight = goals['target_weight']
+        
+        current_bmi = self.calculate_bmi()
+        target_bmi = target_weight / (height_m ** 2) if height_m > 0 else 0
+        
+        bmi_category = self.get_bmi_category(current_bmi)
+        target_category = self.get_bmi_category(target_bmi)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Current BMI display
+            category_colors = {
+                'Underweight': '#FFA500',
+                'Normal': '#00FF87',
+                'Overweight': '#FFA500',
+                'Obese': '#FF4444'
+            }
+            
+            color = category_colors.get(bmi_category, '#00FF87')
+            
+            st.markdown(f"""
+            <div class="stats-card">
+                <h4 style="color: {color};">CURRENT BMI</h4>
+                <div style="text-align: center; margin: 1.5rem 0;">
+                    <div style="color: white; font-size: 3.5rem; font-weight: 800;">{current_bmi:.1f}</div>
+                    <div style="color: {color}; font-size: 1.2rem; margin-top: 0.5rem;">{bmi_category}</div>
+                </div>
+                <div style="color: #CCCCCC; text-align: center;">
+                    Weight: {current_weight} kg | Height: {personal['height']} cm
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # Target BMI display
+            target_color = category_colors.get(target_category, '#00FF87')
+            
+            st.markdown(f"""
+            <div class="stats-card">
+                <h4 style="color: {target_color};">TARGET BMI</h4>
+                <div style="text-align: center; margin: 1.5rem 0;">
+                    <div style="color: white; font-size: 3.5rem; font-weight: 800;">{target_bmi:.1f}</div>
+                    <div style="color: {target_color}; font-size: 1.2rem; margin-top: 0.5rem;">{target_category}</div>
+                </div>
+                <div style="color: #CCCCCC; text-align: center;">
+                    Target Weight: {target_weight} kg
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # BMI Progress
+        weight_difference = target_weight - current_weight
+        progress_percent = 0
+        
+        if weight_difference > 0:  # Need to gain weight
+            if current_weight < target_weight:
+                progress_percent = (current_weight / target_weight) * 100
+        else:  # Need to lose weight
+            start_weight = current_weight + abs(weight_difference) * 2
+            if start_weight > current_weight:
+                progress_percent = ((start_weight - current_weight) / abs(weight_difference)) * 100
+        
+        progress_percent = min(progress_percent, 100)
+        
+        st.markdown("**📊 PROGRESS TO GOAL**")
+        
+        st.markdown(f"""
+        <div style="margin: 1rem 0;">
+            <div style="display: flex; justify-content: space-between; color: #CCCCCC;">
+                <span>Progress</span>
+                <span>{progress_percent:.1f}%</span>
+            </div>
+            <div style="background: rgba(255, 255, 255, 0.1); height: 20px; border-radius: 10px;">
+                <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
+                           width: {progress_percent}%; height: 100%; border-radius: 10px;"></div>
+            </div>
+            <div style="color: #999999; text-align: center; margin-top: 10px;">
+                {abs(weight_difference):.1f} kg {'to gain' if weight_difference > 0 else 'to lose'}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        self.render_body_log_form()
+        
+        self.render_body_dashboard()
+        
+        self.render_weight_signal()
+        
+        # Recommendations based on BMI
+        recommendations = self.get_bmi_recommendations(current_bmi, target_bmi)
+        
+        st.markdown("**💡 RECOMMENDATIONS**")
+        
+        for rec in recommendations:
+            st.info(rec)
+    
+    def render_weight_signal(self):
+        """Render plateau and trend-change warnings for body weight"""
+        signal = TrendDetector().weight_signal()
+        if signal is None:
+            return
+        
+        if signal['plateau'] and signal['stalled']:
+            st.warning(f"⚠️ Your weight has plateaued for {signal['plateau_days']} days "
+                       f"({signal['slope_per_week']:+.2f} kg/week). Consider revisiting your calorie target or training.")
+        elif signal['stalled']:
+            st.warning(f"⚠️ Your weight is trending {signal['direction']} "
+                       f"({signal['slope_per_week']:+.2f} kg/week), away from your goal.")
+        else:
+            st.success(f"📉 Weight trend: {signal['slope_per_week']:+.2f} kg/week")
+        
+        if signal['last_change']:
+            st.caption(f"Last change in trend detected on {signal['last_change']}")
+    
+    def calculate_bmi(self):
+        """Calculate BMI from profile data"""
+        if 'profile_data' not in st.session_state:
+            return 22.0
+        
+        profile = st.session_state.profile_data
+        height_m = profile['personal']['height'] / 100
+        weight = profile['personal']['weight']
+        
+        if height_m > 0:
+            return weight / (height_m ** 2)
+        return 22.0
+    
+    def get_bmi_category(self, bmi):
+        """Get BMI category"""
+        if bmi < 18.5:
+            return "Underweight"
+        elif bmi < 25:
+            return "Normal"
+        elif bmi < 30:
+            return "Overweight"
+        else:
+            return "Obese"
+    
+    def render_body_dashboard(self):
+        """Render BMI, weight and waist-to-height charts from the body log"""
+        st.markdown("**📈 BODY METRICS**")
+        
+        range_label = st.radio("Range", list(self.BODY_RANGES), index=1, horizontal=True, key="body_chart_range")
+        figures = self.create_body_figures(range_label)
+        
+        if figures['weight'] is None:
+            st.info("Log your weight to start building your BMI history.")
+            return
+        
+        bmi_tab, weight_tab, waist_tab = st.tabs(["BMI", "Weight", "Waist-to-Height"])
+        
+        with bmi_tab:
+            st.plotly_chart(figures['bmi'], use_container_width=True)
+        
+        with weight_tab:
+            st.plotly_chart(figures['weight'], use_container_width=True)
+        
+        with waist_tab:
+            if figures['waist'] is None:
+                st.info("Log your waist measurement to track your waist-to-height ratio.")
+            else:
+                st.plotly_chart(figures['waist'], use_container_width=True)
+                st.caption("A ratio below 0.5 is associated with lower health risk; above 0.6 with substantially higher risk.")
+    
+    def create_body_figures(self, range_label):
+        """Body charts for a range, rebuilt only when the body data, profile or day changes"""
+        if 'body_figures' not in st.session_state:
+            st.session_state.body_figures = {}
+        
+        personal = st.session_state.profile_data['personal']
+        target_weight = st.session_state.profile_data['goals']['target_weight']
+        key = (BodyLog().version(), personal['height'], target_weight, DayTracker().today())
+        
+        cached = st.session_state.body_figures.get(range_label)
+        if cached and cached['key'] == key:
+            return cached['figures']
+        
+        height_m = personal['height'] / 100
+        weight = self.create_body_history('weight', range_label)
+        waist = self.create_body_history('waist', range_label)
+        figures = {'bmi': None, 'weight': None, 'waist': None}
+        
+        if weight['dates'] and height_m > 0:
+            figures['weight'] = self.create_body_chart(weight, "Weight Over Time", "Weight (kg)")
+            figures['weight'].add_hline(y=target_weight, line_dash="dash", line_color="#FFA500",
+                                        annotation_text="Target", annotation_position="bottom right")
+            
+            bmi = {
+                'dates': weight['dates'],
+                'raw': np.round(weight['raw'] / height_m ** 2, 1),
+                'trend': np.round(weight['trend'] / height_m ** 2, 2)
+            }
+            figures['bmi'] = self.create_body_chart(bmi, "BMI Progress Over Time", "BMI")
+            figures['bmi'].add_hline(y=target_weight / height_m ** 2, line_dash="dash", line_color="#FFA500",
+                                     annotation_text="Target", annotation_position="bottom right")
+            figures['bmi'].add_hrect(y0=18.5, y1=24.9, fillcolor="rgba(0, 255, 135, 0.1)",
+                                     layer="below", line_width=0)
+        
+        if waist['dates'] and personal['height'] > 0:
+            ratio = {
+                'dates': waist['dates'],
+                'raw': np.round(waist['raw'] / personal['height'], 3),
+                'trend': np.round(waist['trend'] / personal['height'], 3)
+            }
+            figures['waist'] = self.create_body_chart(ratio, "Waist-to-Height Ratio", "Ratio")
+            figures['waist'].add_hrect(y0=0.4, y1=0.5, fillcolor="rgba(0, 255, 135, 0.1)",
+                                       layer="below", line_width=0)
+            figures['waist'].add_hline(y=0.6, line_dash="dash", line_color="#FF4444",
+                                       annotation_text="High risk", annotation_position="bottom right")
+        
+        st.session_state.body_figures[range_label] = {'key': key, 'figures': figures}
+        return figures
+    
+    def create_body_history(self, measurement, range_label):
+        """Readings and trend of a body measurement over a range, averaged per period for long ranges"""
+        days, rule = self.BODY_RANGES[range_label]
+        dates, raw, trend = BodyLog().history(measurement, days=days)
+        
+        if not dates or rule == 'D':
+            return {'dates': dates, 'raw': raw, 'trend': trend}
+        
+        frame = pd.DataFrame({'raw': raw, 'trend': trend}, index=pd.to_datetime(dates))
+        frame = frame.resample(rule).agg({'raw': 'mean', 'trend': 'last'}).dropna()
+        
+        return {
+            'dates': list(frame.index.strftime('%Y-%m-%d')),
+            'raw': frame['raw'].to_numpy(),
+            'trend': frame['trend'].to_numpy()
+        }
+    
+    def create_body_chart(self, history, title, yaxis_title):
+        """Logged readings with their smoothed trend"""
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=history['dates'],
+            y=history['raw'],
+            mode='markers',
+            marker=dict(size=6, color='#00D4FF', opacity=0.6),
+            name='Logged'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=history['dates'],
+            y=history['trend'],
+            mode='lines',
+            line=dict(color='#00FF87', width=3),
+            name='Trend'
+        ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title="Date",
+            yaxis_title=yaxis_title,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+        )
+        
+        return fig
+    
+    def render_body_log_form(self):
+        """Render body measurement logging form"""
+        body_log = BodyLog()
+        
+        with st.expander("📝 LOG BODY MEASUREMENTS"):
+            with st.form("body_log_form"):
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    weight = st.number_input("Weight (kg)", min_value=30.0, max_value=250.0,
+                                             value=float(body_log.latest('weight') or st.session_state.profile_data['personal']['weight']),
+                                             step=0.1)
+                
+                with col2:
+                    body_fat = st.number_input("Body Fat (%)", min_value=0.0, max_value=60.0,
+                                               value=float(body_log.latest('body_fat') or 0.0), step=0.1,
+                                               help="Leave at 0 if you didn't measure it")
+                
+                with col3:
+                    waist = st.number_input("Waist (cm)", min_value=0.0, max_value=200.0,
+                                            value=float(body_log.latest('waist') or 0.0), step=0.5,
+                                            help="Leave at 0 if you didn't measure it")
+                
+                if st.form_submit_button("💾 LOG MEASUREMENTS", use_container_width=True):
+                    body_log.log(weight=weight, body_fat=body_fat or None, waist=waist or None)
+                    st.success("✅ Measurements logged!")
+                    st.rerun()
+            
+            trend_weight = body_log.latest_trend('weight')
+            if trend_weight is not None:
+                st.caption(f"Smoothed trend weight: {trend_weight:.1f} kg")
+    
+    def get_bmi_recommendations(self, current_bmi, target_bmi):
+        """Get recommendations based on BMI"""
+        recommendations = []
+        
+        if current_bmi < 18.5:
+            recommendations.append("Focus on calorie-dense, nutritious foods")
+            recommendations.append("Include strength training to build muscle mass")
+            recommendations.append("Consider smaller, more frequent meals")
+        
+        elif current_bmi > 25:
+            recommendations.append("Create a consistent calorie deficit")
+            recommendations.append("Combine cardio and strength training")
+            recommendations.append("Focus on whole foods and protein")
+        
+        if abs(target_bmi - current_bmi) > 2:
+            recommendations.append(f"Aim to {'gain' if target_bmi > current_bmi else 'lose'} "
+                                 f"{abs(target_bmi - current_bmi):.1f} BMI points")
+        
+        if not recommendations:
+            recommendations.append("Maintain your current healthy habits")
+            recommendations.append("Focus on body composition rather than weight")
+        
+        return recommendations
+    
+    def render_fitness_goals(self):
+        """Render fitness goals tracking"""
+        st.markdown('<div class="section-header">🎯 FITNESS GOALS TRACKER</div>', unsafe_allow_html=True)
+        
+        if 'profile_data' not in st.session_state:
+            st.warning("Please complete your profile first!")
+            return
+        
+        goals = st.session_state.profile_data['goals']
+        
+        # Primary goal
+        primary_goal = goals.get('primary_goal', 'general_fitness')
+        secondary_goals = goals.get('secondary_goals', [])
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            goal_descriptions = {
+                'weight_loss': 'Reduce body fat percentage',
+                'muscle_gain': 'Increase lean muscle mass',
+                'endurance': 'Improve cardiovascular fitness',
+                'flexibility': 'Increase range of motion',
+                'general_fitness': 'Overall health improvement'
+            }
+            
+            st.markdown(f"""
+            <div class="stats-card">
+                <h4 style="color: #00FF87;">🎯 PRIMARY GOAL</h4>
+                <div style="text-align: center; margin: 1.5rem 0;">
+                    <div style="color: white; font-size: 2rem; font-weight: 600;">
+                        {primary_goal.replace('_', ' ').title()}
+                    </div>
+                    <div style="color: #CCCCCC; margin-top: 1rem;">
+                        {goal_descriptions.get(primary_goal, 'Custom fitness goal')}
+                    </div>
+                </div>
+                <div style="color: #999999; text-align: center;">
+                    Timeline: {goals.get('timeline', '3_months').replace('_', ' ').title()}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            if secondary_goals:
+                goals_list = '<br>'.join([f"• {g.replace('_', ' ').title()}" for g in secondary_goals])
+            else:
+                goals_list = "No secondary goals set"
+            
+            st.markdown(f"""
+            <div class="stats-card">
+                <h4 style="color: #00FF87;">📋 SECONDARY GOALS</h4>
+                <div style="color: #CCCCCC; margin: 1.5rem 0; min-height: 120px;">
+                    {goals_list}
+                </div>
+                <div style="color: #999999; text-align: center;">
+                    {len(secondary_goals)} goal{'s' if len(secondary_goals) != 1 else ''} set
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Goal progress tracking
+        st.markdown("**📊 GOAL PROGRESS**")
+        
+        goal_progress = self.calculate_goal_progress(primary_goal)
+        
+        for goal, progress in goal_progress.items():
+            st.markdown(f"""
+            <div style="margin: 1rem 0;">
+                <div style="display: flex; justify-content: space-between; color: #CCCCCC;">
+                    <span>{goal.replace('_', ' ').title()}</span>
+                    <span>{progress['percent']:.0f}%</span>
+                </div>
+                <div style="background: rgba(255, 255, 255, 0.1); height: 15px; border-radius: 8px;">
+                    <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
+                               width: {progress['percent']}%; height: 100%; border-radius: 8px;"></div>
+                </div>
+                <div style="color: #999999; font-size: 0.9rem;">
+                    {progress['status']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        self.render_goal_projection()
+        
+        # Milestone tracker
+        st.markdown("**🏆 MILESTONES**")
+        
+        milestones = self.get_milestones(primary_goal)
+        
+        cols = st.columns(3)
+        for i, milestone in enumerate(milestones[:3]):
+            with cols[i]:
+                status = "✅" if milestone['achieved'] else "⏳"
+                color = "#00FF87" if milestone['achieved'] else "#666666"
+                
+                st.markdown(f"""
+                <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 10px; 
+                            border: 1px solid {color}; text-align: center;">
+                    <div style="color: {color}; font-size: 2rem;">{status}</div>
+                    <div style="color: white; margin: 0.5rem 0;">{milestone['title']}</div>
+                    <div style="color: #999999; font-size: 0.9rem;">{milestone['description']}</div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    def render_goal_projection(self):
+        """Render the projected weight path towards the target"""
+        projection = GoalProjection().project(self.calculate_tdee_local())
+        if projection is None:
+            return
+        
+        st.markdown("**🎯 GOAL PROJECTION**")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Chance of reaching target", f"{projection['probability']:.0%}",
+                      help=f"By {projection['target_date']}, from thousands of simulated futures")
+        with col2:
+            st.metric("Current trend", f"{projection['rate_per_week']:+.2f} kg/week",
+                      f"{projection['required_per_week']:+.2f} needed", delta_color="off")
+        with col3:
+            st.metric("Expected arrival", projection['expected_date'] or "Beyond target date")
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=projection['dates'] + projection['dates'][::-1],
+            y=np.concatenate([projection['p90'], projection['p10'][::-1]]),
+            fill='toself',
+            fillcolor='rgba(0, 212, 255, 0.15)',
+            line=dict(width=0),
+            name='80% range',
+            hoverinfo='skip'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=projection['dates'],
+            y=projection['p50'],
+            mode='lines',
+            line=dict(color='#00D4FF', width=3),
+            name='Median projection'
+        ))
+        
+        fig.add_hline(y=projection['target_weight'], line_dash="dash", line_color="#FFA500",
+                      annotation_text="Target", annotation_position="bottom right")
+        
+        fig.update_layout(
+            title="Projected Weight",
+            xaxis_title="Date",
+            yaxis_title="Weight (kg)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def calculate_goal_progress(self, primary_goal):
+        """Calculate progress toward goals"""
+        progress = {}
+        
+        # Weight goal progress
+        if 'profile_data' in st.session_state:
+            profile = st.session_state.profile_data
+            target_weight = profile['goals']['target_weight']
+            _, start_weight = GoalProjection().start()
+            current_weight = BodyLog().latest_trend('weight')
+            
+            if start_weight is None or current_weight is None:
+                percent = 0
+                status = "Log your weight to track progress"
+            else:
+                # Progress measured along the smoothed trend from the goal's real start
+                if abs(start_weight - target_weight) < 0.1:
+                    percent = 100 if abs(current_weight - target_weight) < 0.5 else 0
+                else:
+                    percent = (start_weight - current_weight) / (start_weight - target_weight) * 100
+                
+                remaining = target_weight - current_weight
+                if (remaining >= 0) == (start_weight > target_weight) or abs(remaining) < 0.1:
+                    percent = 100
+                    status = "Goal achieved! 🎉"
+                else:
+                    status = f"{abs(remaining):.1f} kg to {'lose' if remaining < 0 else 'gain'}"
+                    # The odds need a few weeks of weigh-ins; progress doesn't
+                    projection = GoalProjection().project(self.calculate_tdee_local())
+                    if projection is not None:
+                        status += f" · {projection['probability']:.0%} chance by {projection['target_date']}"
+            
+            progress['weight'] = {'percent': max(0, min(percent, 100)), 'status': status}
+        
+        # Workout consistency progress
+        if 'workout_history' in st.session_state:
+            recent_workouts = MetricQueries().get('workouts', 30)
+            
+            percent = min((recent_workouts / 12) * 100, 100)  # 12 workouts/month target
+            progress['consistency'] = {
+                'percent': percent,
+                'status': f"{recent_workouts:.0f} workouts this month"
+            }
+        
+        return progress
+    
+    def get_milestones(self, primary_goal):
+        """Get milestones for the primary goal"""
+        milestones = [
+            {
+                'title': 'First Week Complete',
+                'description': '7 consecutive days of tracking',
+                'achieved': st.session_state.get('streak_days', 0) >= 7
+            },
+            {
+                'title': 'Consistent Month',
+                'description': '20+ workouts in 30 days',
+                'achieved': False
+            },
+            {
+                'title': 'Nutrition Master',
+                'description': '7 days of perfect nutrition',
+                'achieved': False
+            }
+        ]
+        
+        return milestones
+    
+    def render_workout_progress(self):
+        """Render workout progress tracking"""
+        st.markdown('<div class="section-header">🏋️‍♂️ WORKOUT PROGRESS</div>', unsafe_allow_html=True)
+        
+        if 'workout_history' not in st.session_state or not st.session_state.workout_history:
+            st.info("No workout data yet. Complete your first workout!")
+            return
+        
+        workouts = st.session_state.workout_history
+        
+        # Statistics
+        total_workouts = len(workouts)
+        total_calories = sum(w.get('calories', 0) for w in workouts)
+        total_duration = sum(w.get('duration', 0) for w in workouts)
+        
+        # Last 30 days
+        metrics = MetricQueries()
+        recent_workouts = metrics.get('workouts', 30)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Total Workouts", total_workouts)
+        with col2:
+            st.metric("Calories Burned", f"{total_calories:,}")
+        with col3:
+            st.metric("Total Hours", f"{total_duration/60:.0f}")
+        
+        # Weekly progress chart
+        st.markdown("**📈 WEEKLY PROGRESS**")
+        
+        weekly_data = self.calculate_weekly_workouts()
+        
+        fig = go.Figure(data=[
+            go.Bar(
+                x=list(weekly_data.keys()),
+                y=list(weekly_data.values()),
+                marker_color='#00FF87',
+                text=list(weekly_data.values()),
+                textposition='auto'
+            )
+        ])
+        
+        fig.update_layout(
+            title="Workouts Per Week (Last 8 Weeks)",
+            xaxis_title="Week",
+            yaxis_title="Number of Workouts",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Performance metrics
+        st.markdown("**⚡ PERFORMANCE METRICS**")
+        
+        if recent_workouts:
+            avg_calories = metrics.get('calories_burned', 30) / recent_workouts
+            avg_duration = metrics.get('active_minutes', 30) / recent_workouts
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div style="color: #00FF87; font-size: 1.2rem;">🔥 AVERAGE CALORIES</div>
+                    <div style="text-align: center; margin: 1rem 0;">
+                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_calories:.0f}</div>
+                        <div style="color: #CCCCCC;">per workout</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div style="color: #00FF87; font-size: 1.2rem;">⏱️ AVERAGE DURATION</div>
+                    <div style="text-align: center; margin: 1rem 0;">
+                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_duration:.0f}</div>
+                        <div style="color: #CCCCCC;">minutes</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Performance trends per workout type
+        signals = [s for s in TrendDetector().get_signals().values() if s['kind'] == 'performance']
+        if signals:
+            st.markdown("**📊 PERFORMANCE TRENDS**")
+            
+            for signal in signals:
+                icon = '➖' if signal['plateau'] else '📈' if signal['direction'] == 'increasing' else '📉'
+                status = f"plateau for {signal['plateau_days']} days" if signal['plateau'] else signal['direction']
+                change = f" · trend changed {signal['last_change']}" if signal['last_change'] else ''
+                st.write(f"{icon} **{signal['label']}**: {status} "
+                         f"({signal['slope_per_week']:+.2f} {signal['unit']} per week){change}")
+        
+        self.render_track_analytics()
+    
+    def render_track_analytics(self):
+        """Render pace, best-effort and heart-rate zone analytics for imported GPS tracks"""
+        analytics = ActivityAnalytics()
+        activities = analytics.activities()
+        if not activities:
+            return
+        
+        st.markdown("**🏃 PACE & ZONE ANALYTICS**")
+        
+        kinds = sorted({a['activity'] for a in activities})
+        kind = st.selectbox("Activity", kinds, format_func=str.title, key="track_analytics_activity")
+        speed = kind in analytics.SPEED_ACTIVITIES
+        monthly = analytics.monthly(kind)
+        
+        # Multi-month trends: distance per month with pace (or speed) and grade-adjusted pace alongside
+        if not monthly.empty:
+            months = list(monthly.index)
+            pace = 60 / monthly['pace'] if speed else monthly['pace']
+            
+            fig = go.Figure()
+            fig.add_trace(go.Bar(x=months, y=monthly['distance'].round(1), name='Distance (km)', marker_color='#00FF87', opacity=0.6))
+            fig.add_trace(go.Scatter(x=months, y=pace.round(2), name='Speed (km/h)' if speed else 'Pace (min/km)',
+                                     yaxis='y2', mode='lines+markers', line=dict(color='#60EFFF', width=3)))
+            if monthly['gap'].notna().any() and not speed:
+                fig.add_trace(go.Scatter(x=months, y=monthly['gap'].round(2), name='Grade-adjusted pace',
+                                         yaxis='y2', mode='lines+markers', line=dict(color='#FFD93D', dash='dash')))
+            
+            fig.update_layout(
+                title=f"{kind.title()} by Month",
+                xaxis_title="Month",
+                yaxis=dict(title="Distance (km)", gridcolor='rgba(255,255,255,0.1)'),
+                yaxis2=dict(title="km/h" if speed else "min/km", overlaying='y', side='right',
+                            autorange=True if speed else 'reversed', showgrid=False),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='white'),
+                xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+                legend=dict(orientation='h', y=-0.25)
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Best efforts per month; lower is faster
+            efforts = [name for name in analytics.BEST_EFFORTS if monthly[name].notna().any()]
+            if efforts:
+                fig = go.Figure()
+                for name, color in zip(efforts, ['#00FF87', '#60EFFF', '#FFD93D']):
+                    fig.add_trace(go.Scatter(x=months, y=(monthly[name] / 60).round(2), name=f"Best {name}",
+                                             mode='lines+markers', line=dict(color=color), connectgaps=True))
+                fig.update_layout(
+                    title="Best Efforts by Month",
+                    xaxis_title="Month",
+                    yaxis_title="Minutes",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+                    yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            if monthly['hard_share'].notna().any():
+                latest = monthly['hard_share'].dropna()
+                st.write(f"❤️ Time in Z4-Z5 in {latest.index[-1]}: **{latest.iloc[-1]:.0%}** of heart-rate time")
+        
+        # All-time best efforts
+        bests = {}
+        for activity in activities:
+            if activity['activity'] != kind:
+                continue
+            for name, effort in activity['best_efforts'].items():
+                if name not in bests or effort['seconds'] < bests[name][0]['seconds']:
+                    bests[name] = (effort, activity['date'])
+        if bests:
+            cols = st.columns(len(bests))
+            for col, (name, (effort, date)) in zip(cols, bests.items()):
+                with col:
+                    st.metric(f"Best {name}", analytics.format_duration(effort['seconds']), date, delta_color="off")
+        
+        # Single activity: splits and zones
+        recent = [a for a in activities if a['activity'] == kind][::-1][:30]
+        choice = st.selectbox("Activity details", range(len(recent)),
+                              format_func=lambda i: f"{recent[i]['date']} · {recent[i]['workout']} · {recent[i]['distance']:.1f} km",
+                              key="track_analytics_detail")
+        detail = recent[choice]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Distance", f"{detail['distance']:.2f} km")
+        with col2:
+            st.metric("Speed" if speed else "Pace", analytics.format_pace(detail['pace'], kind))
+        with col3:
+            st.metric("Grade-Adjusted", analytics.format_pace(detail['gap'], kind) if detail['gap'] else "—")
+        with col4:
+            st.metric("Elevation Gain", f"{detail['elevation_gain']:.0f} m")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if detail['splits']:
+                splits = detail['splits']
+                # Partial last split shown at its pace per full kilometre
+                paces = [s['seconds'] / s['meters'] * analytics.SPLIT_METERS / 60 for s in splits]
+                fig = go.Figure(data=[go.Bar(
+                    x=[f"{s['km']}" if s['meters'] == analytics.SPLIT_METERS else f"{s['km']}*" for s in splits],
+                    y=[round(p, 2) for p in paces],
+                    marker_color='#00FF87',
+                    text=[analytics.format_duration(s['seconds']) for s in splits],
+                    textposition='auto'
+                )])
+                fig.update_layout(
+                    title="Splits (min/km)",
+                    xaxis_title="Kilometre",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+                    yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            zones = dict(detail['hr_zones'])
+            if sum(zones.values()):
+                fig = go.Figure(data=[go.Bar(
+                    x=[round(s / 60, 1) for s in zones.values()],
+                    y=list(zones.keys()),
+                    orientation='h',
+                    marker_color=['#60EFFF', '#00FF87', '#FFD93D', '#FF9F43', '#FF6B6B'][:len(zones)]
+                )])
+                fig.update_layout(
+                    title=f"Time in Heart-Rate Zones (avg {detail['avg_hr']} bpm)" if detail['avg_hr'] else "Time in Heart-Rate Zones",
+                    xaxis_title="Minutes",
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='white'),
+                    xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+                    yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No heart-rate data in this activity.")
+        
+        if detail['best_efforts']:
+            st.write(" · ".join(f"**{name}** {analytics.format_duration(e['seconds'])} (from km {e['start_km']})"
+                                for name, e in detail['best_efforts'].items()))
+    
+    def calculate_weekly_workouts(self):
+        """Calculate workouts per week for last 8 weeks"""
+        if 'workout_history' not in st.session_state:
+            return {}
+        
+        metrics = MetricQueries()
+        today = DailyRollups().today_ordinal()
+        weekly_data = {}
+        
+        for i in range(8, 0, -1):
+            week_end = today - 7 * (i - 1)
+            week_workouts = metrics.get('workouts', (week_end - 6, week_end))
+            
+            week_label = f"Week {9-i}"
+            weekly_data[week_label] = int(week_workouts)
+        
+        return weekly_data
+    
+    def render_nutrition_progress(self):
+        """Render nutrition progress tracking"""
+        st.markdown('<div class="section-header">🍎 NUTRITION PROGRESS</div>', unsafe_allow_html=True)
+        
+        if 'nutrition_logs' not in st.session_state or not st.session_state.nutrition_logs:
+            st.info("No nutrition data yet. Log your first meal!")
+            return
+        
+        # Today's nutrition
+        metrics = MetricQueries()
+        
+        if metrics.get('meals', 'today'):
+            today_calories = int(metrics.get('calories_in', 'today'))
+            today_protein = metrics.get('protein', 'today')
+            
+            # Get targets using local functions
+            protein_target = self.get_protein_target_local()
+            calorie_target = self.get_calorie_target_local()
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                cal_percent = min((today_calories / calorie_target) * 100, 100) if calorie_target > 0 else 0
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div style="color: #00FF87; font-size: 1.2rem;">🔥 TODAY'S CALORIES</div>
+                    <div style="text-align: center; margin: 1rem 0;">
+                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{today_calories}</div>
+                        <div style="color: #CCCCCC;">/ {calorie_target} target</div>
+                    </div>
+                    <div style="background: rgba(255, 255, 255, 0.1); height: 10px; border-radius: 5px;">
+                        <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
+                                   width: {cal_percent}%; height: 100%; border-radius: 5px;"></div>
+                    </div>
+                    <div style="color: #999999; text-align: center; margin-top: 10px;">
+                        {cal_percent:.0f}% of daily goal
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                prot_percent = min((today_protein / protein_target) * 100, 100) if protein_target > 0 else 0
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div style="color: #00FF87; font-size: 1.2rem;">🥚 TODAY'S PROTEIN</div>
+                    <div style="text-align: center; margin: 1rem 0;">
+                        <div style="color: white; font-size: 2.5rem; font-weight: 800;">{today_protein:.0f}g</div>
+                        <div style="color: #CCCCCC;">/ {protein_target}g target</div>
+                    </div>
+                    <div style="background: rgba(255, 255, 255, 0.1); height: 10px; border-radius: 5px;">
+                        <div style="background: linear-gradient(90deg, #00FF87, #00D4FF); 
+                                   width: {prot_percent}%; height: 100%; border-radius: 5px;"></div>
+                    </div>
+                    <div style="color: #999999; text-align: center; margin-top: 10px;">
+                        {prot_percent:.0f}% of daily goal
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Weekly nutrition trend
+        st.markdown("**📊 WEEKLY NUTRITION TREND**")
+        
+        weekly_nutrition = self.calculate_weekly_nutrition()
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=list(weekly_nutrition.keys()),
+            y=[n['calories'] for n in weekly_nutrition.values()],
+            mode='lines+markers',
+            name='Calories',
+            line=dict(color='#00FF87', width=3)
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=list(weekly_nutrition.keys()),
+            y=[n['protein'] for n in weekly_nutrition.values()],
+            mode='lines+markers',
+            name='Protein (g)',
+            line=dict(color='#00D4FF', width=3),
+            yaxis='y2'
+        ))
+        
+        fig.update_layout(
+            title="Weekly Nutrition Intake",
+            xaxis_title="Week",
+            yaxis_title="Calories",
+            yaxis2=dict(
+                title="Protein (g)",
+                overlaying='y',
+                side='right'
+            ),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def calculate_weekly_nutrition(self):
+        """Calculate weekly nutrition data"""
+        if 'nutrition_logs' not in st.session_state:
+            return {}
+        
+        metrics = MetricQueries()
+        today = DailyRollups().today_ordinal()
+        weekly_data = {}
+        
+        for i in range(4, 0, -1):
+            week_end = today - 7 * (i - 1)
+            week_calories = metrics.get('calories_in', (week_end - 6, week_end))
+            week_protein = metrics.get('protein', (week_end - 6, week_end))
+            
+            week_label = f"Week {5-i}"
+            weekly_data[week_label] = {
+                'calories': week_calories,
+                'protein': week_protein
+            }
+        
+        return weekly_data
+    
+    # NEW: Local functions to replace nutrition_engine imports
+    def get_calorie_target_local(self):
+        """Calculate calorie target locally"""
+        if 'profile_data' not in st.session_state:
+            return 2000
+        
+        primary_goal = st.session_state.profile_data['goals'].get('primary_goal', 'general_fitness')
+        return TDEEEstimator().calorie_target(primary_goal)
+    
+    def get_protein_target_local(self):
+        """Calculate protein target locally"""
+        if 'profile_data' not in st.session_state:
+            return 80
+        
+        profile = st.session_state.profile_data
+        weight = profile['personal']['weight']
+        goals = profile['goals']
+        primary_goal = goals.get('primary_goal', 'general_fitness')
+        
+        # Protein per kg based on goal
+        protein_per_kg = {
+            'weight_loss': 2.0,
+            'muscle_gain': 2.2,
+            'endurance': 1.6,
+            'general_fitness': 1.8
+        }
+        
+        multiplier = protein_per_kg.get(primary_goal, 1.8)
+        return int(weight * multiplier)
+    
+    def calculate_tdee_local(self):
+        """Total Daily Energy Expenditure, learned from the logs once there is enough history"""
+        if 'profile_data' not in st.session_state:
+            return 2000
+        
+        return TDEEEstimator().get_tdee()
+    
+    def render_period_comparison(self):
+        """Render period-over-period changes for the main metrics"""
+        st.markdown('<div class="section-header">📅 COMPARE PERIODS</div>', unsafe_allow_html=True)
+        
+        comparison = PeriodComparison()
+        period = st.selectbox("Period", list(comparison.PERIODS), format_func=comparison.PERIODS.get, key="comparison_period")
+        summary = comparison.summary(period)
+        
+        first = next(iter(summary.values()))
+        st.caption(f"{first['current_window'][0]} – {first['current_window'][1]} compared with "
+                   f"{first['previous_window'][0]} – {first['previous_window'][1]}")
+        
+        items = list(summary.values())
+        for row in range(0, len(items), 4):
+            cols = st.columns(4)
+            for col, item in zip(cols, items[row:row + 4]):
+                with col:
+                    delta = None
+                    if item['delta'] is not None:
+                        delta = comparison.format_value(item, 'delta')
+                        if item['percent'] is not None:
+                            delta += f" ({item['percent']:+.0f}%)"
+                    st.metric(item['label'], comparison.format_value(item), delta)
+    
+    def render_health_trends(self):
+        """Render health trends tracking"""
+        st.markdown('<div class="section-header">❤️ HEALTH TRENDS</div>', unsafe_allow_html=True)
+        
+        # Health metrics overview
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            # Sleep trend
+            avg_sleep = MetricQueries().get('avg_sleep', 7)
+            if avg_sleep is None:
+                avg_sleep = 7
+            
+            sleep_color = '#00FF87' if avg_sleep >= 7 else '#FFA500' if avg_sleep >= 6 else '#FF4444'
+            
+            st.markdown(f"""
+            <div class="metric-card">
+                <div style="color: {sleep_color}; font-size: 1.2rem;">💤 AVERAGE SLEEP</div>
+                <div style="text-align: center; margin: 1rem 0;">
+                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_sleep:.1f}</div>
+                    <div style="color: #CCCCCC;">hours/night</div>
+                </div>
+                <div style="color: #999999; text-align: center;">
+                    Last 7 days
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # Water trend
+            avg_water = DayTracker().get('water')
+            water_target = HydrationModel().get_target()
+            
+            water_percent = min((avg_water / water_target) * 100, 100) if water_target > 0 else 0
+            water_color = '#00FF87' if water_percent >= 80 else '#FFA500' if water_percent >= 50 else '#FF4444'
+            
+            st.markdown(f"""
+            <div class="metric-card">
+                <div style="color: {water_color}; font-size: 1.2rem;">💧 DAILY WATER</div>
+                <div style="text-align: center; margin: 1rem 0;">
+                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{avg_water:.0f}</div>
+                    <div style="color: #CCCCCC;">glasses/day</div>
+                </div>
+                <div style="color: #999999; text-align: center;">
+                    Target: {water_target} glasses
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            # Mood trend
+            avg_mood = MetricQueries().get('avg_mood', 7)
+            if avg_mood is None:
+                avg_mood = 3
+            
+            mood_color = '#00FF87' if avg_mood >= 4 else '#FFA500' if avg_mood >= 2.5 else '#FF4444'
+            mood_text = ['Angry', 'Sad', 'Tired', 'Neutral', 'Energized', 'Happy'][int(avg_mood)]
+            
+            st.markdown(f"""
+            <div class="metric-card">
+                <div style="color: {mood_color}; font-size: 1.2rem;">😊 AVERAGE MOOD</div>
+                <div style="text-align: center; margin: 1rem 0;">
+                    <div style="color: white; font-size: 2.5rem; font-weight: 800;">{mood_text}</div>
+                    <div style="color: #CCCCCC;">{avg_mood:.1f}/5.0</div>
+                </div>
+                <div style="color: #999999; text-align: center;">
+                    Last 7 days
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Health improvement chart
+        st.markdown("**📈 HEALTH IMPROVEMENT TREND**")
+        
+        view = st.radio("View", ["Last 4 Weeks", "Last 7 Days"], horizontal=True, key="health_trend_view")
+        health_data = self.create_health_trend_data(weekly=view == "Last 4 Weeks")
+        
+        fig = go.Figure()
+        
+        metrics = ['Sleep', 'Water', 'Mood', 'Stress', 'Activity']
+        colors = ['#00FF87', '#00D4FF', '#FFA500', '#B266FF', '#FF4444']
+        
+        for i, metric in enumerate(metrics):
+            fig.add_trace(go.Scatter(
+                x=list(health_data.keys()),
+                y=[h[metric.lower()] for h in health_data.values()],
+                mode='lines+markers',
+                name=metric,
+                line=dict(color=colors[i], width=2)
+            ))
+        
+        fig.update_layout(
+            title=f"Health Metrics Trend ({view})",
+            xaxis_title="Week" if view == "Last 4 Weeks" else "Day",
+            yaxis_title="Score (0-100)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
+            yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        self.render_health_insights()
+        
+        # Recommendations
+        st.markdown("**💡 HEALTH RECOMMENDATIONS**")
+        
+        recommendations = self.get_health_recommendations()
+        
+        for rec in recommendations:
+            st.info(rec)
+    
+    def render_health_insights(self):
+        """Render cross-domain correlations between sleep, nutrition, workouts and mood"""
+        st.markdown("**🔗 HEALTH INSIGHTS**")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            window = st.selectbox("Period", ["Last 90 Days", "Last Year", "All Time"], key="insight_window")
+        
+        with col2:
+            lag = st.selectbox("Compare with", ["Same day", "Next day", "2 days later", "3 days later"],
+                               key="insight_lag")
+        
+        days = {'Last 90 Days': 90, 'Last Year': 365, 'All Time': None}[window]
+        lag = ["Same day", "Next day", "2 days later", "3 days later"].index(lag)
+        
+        engine = CorrelationEngine()
+        insights = engine.get_insights(days)
+        
+        if insights:
+            for insight in insights:
+                st.info(f"💡 {insight['text']} (r = {insight['r']:.2f} over {insight['days']} days)")
+        else:
+            st.info("Keep logging sleep, meals, workouts and mood to unlock personal insights.")
+        
+        correlations = engine.get_correlations(days)
+        labels = list(engine.SERIES.values())
+        
+        fig = go.Figure(data=go.Heatmap(
+            z=np.round(correlations['r'][lag], 2),
+            x=labels,
+            y=labels,
+            zmin=-1,
+            zmax=1,
+            colorscale=[[0, '#FF4444'], [0.5, '#1a1a1a'], [1, '#00FF87']],
+            hovertemplate='%{y} → %{x}: r = %{z}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title="Correlation Matrix",
+            xaxis_title="Later day" if lag else None,
+            height=450,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white')
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def create_health_trend_data(self, weekly=True):
+        """Create health trend data from the daily health scores"""
+        health_score = HealthScore()
+        
+        if weekly:
+            components, _ = health_score.weekly(4)
+            labels = [f"Week {i + 1}" for i in range(4)]
+        else:
+            dates, components, _ = health_score.trend(7)
+            labels = [datetime.strptime(d, '%Y-%m-%d').strftime('%a') for d in dates]
+        
+        data = {}
+        for i, label in enumerate(labels):
+            # Days or weeks with nothing logged are left as gaps in the chart
+            data[label] = {
+                name: None if np.isnan(values[i]) else round(float(values[i]), 1)
+                for name, values in components.items()
+            }
+        
+        return data
+    
+    def get_health_recommendations(self):
+        """Get health recommendations based on trends"""
+        recommendations = []
+        
+        if 'profile_data' in st.session_state:
+            profile = st.session_state.profile_data
+            
+            # Sleep recommendations
+            if profile['health']['sleep_hours'] < 7:
+                recommendations.append(f"Aim for 7-9 hours of sleep. Current: {profile['health']['sleep_hours']} hours")
+            
+            # Water recommendations
+            water_target = HydrationModel().get_target()
+            current_water = DayTracker().get('water')
+            if current_water < water_target:
+                recommendations.append(f"Drink more water: {current_water}/{water_target} glasses today")
+            
+            # Stress recommendations
+            if profile['health']['stress_level'] == 'High':
+                recommendations.append("Practice stress management techniques daily")
+        
+        if not recommendations:
+            recommendations.append("Your health metrics are looking good! Keep up the great work!")
+        
+        return recommendations
+    
+    def render_mini_dashboard(self):
+        """Render mini progress dashboard for main page"""
+        if 'profile_data' not in st.session_state:
+            return
+        
+        # Calculate progress
+        bmi = self.calculate_bmi()
+        bmi_category = self.get_bmi_category(bmi)
+        
+        # Streak
+        streak = st.session_state.get('streak_days', 0)
+        
+        # Workouts this week
+        if 'workout_history' in st.session_state:
+            workouts_week = len([w for w in st.session_state.workout_history 
+                                if datetime.strptime(w.get('date', '2000-01-01'), '%Y-%m-%d').isocalendar()[1] 
+                                == datetime.now().isocalendar()[1]])
+        else:
+            workouts_week = 0
+        
+        st.markdown(f"""
+        <div style="background: rgba(0, 20, 10, 0.8); padding: 1.5rem; border-radius: 15px;">
+            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1rem;">
+                <div style="text-align: center;">
+                    <div style="color: #00FF87; font-size: 1.5rem;">⚖️</div>
+                    <div style="color: white; font-size: 1.2rem;">{bmi:.1f}</div>
+                    <div style="color: #CCCCCC; font-size: 0.8rem;">BMI ({bmi_category})</div>
+                </div>
+                <div style="text-align: center;">
+                    <div style="color: #00FF87; font-size: 1.5rem;">🔥</div>
+                    <div style="color: white; font-size: 1.2rem;">{streak}</div>
+                    <div style="color: #CCCCCC; font-size: 0.8rem;">Day Streak</div>
+                </div>
+            </div>
+            <div style="text-align: center;">
+                <div style="color: #00FF87; font-size: 0.9rem;">🏋️‍♂️ {workouts_week} workouts this week</div>
+                <div style="color: #999999; font-size: 0.8rem; margin-top: 0.5rem;">
+                    Keep up the momentum! 💪
+                </div>
+            </div>
+        </div>
         """, unsafe_allow_html=True)
\ No newline at end of file
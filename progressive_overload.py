@@ -0,0 +1,245 @@
+import streamlit as st
+import numpy as np
+from set_log import SetLog
+
+class ProgressiveOverload:
+    """Next-session loads and reps per exercise from the set log, with stall and deload detection"""
+    
+    # goal -> (bottom of rep range, top of rep range, target RPE)
+    REP_RANGES = {
+        'strength': (3, 6, 8.0),
+        'muscle_gain': (6, 12, 8.0),
+        'weight_loss': (10, 15, 7.5),
+        'endurance': (15, 20, 7.0),
+        'general_fitness': (8, 12, 8.0)
+    }
+    
+    # Sessions without a 1% e1RM gain before an exercise counts as stalled
+    STALL_SESSIONS = 3
+    STALL_GAIN = 0.01
+    
+    # A top set this far under the recent best is a deload, not a regression
+    DELOAD_DROP = 0.9
+    
+    # Sessions after a deload before the rebuild ends even without a new e1RM peak
+    REBUILD_SESSIONS = 12
+    
+    # Load added after hitting the top of the rep range, and plate rounding
+    LOAD_STEP = 0.025
+    PLATE = 2.5
+    SMALL_PLATE = 1.0
+    
+    def __init__(self):
+        self.set_log = SetLog()
+        self.initialize_overload_data()
+    
+    def initialize_overload_data(self):
+        """Initialize per-exercise progression state"""
+        if 'overload' not in st.session_state:
+            # deloads: exercise -> e1RM peak to build back past, sessions logged when the deload was prescribed and whether the rebuild expired
+            st.session_state.overload = {'seen': 0, 'exercises': {}, 'deloads': {}}
+    
+    def e1rm(self, load, reps, rpe=None):
+        """Estimated one-rep max per set (Brzycki up to 10 reps, Epley above), NaN without load or reps
+        
+        Reps left in reserve (10 - RPE) count as reps the set could have done.
+        """
+        load = np.asarray(load, dtype=float)
+        reps = np.asarray(reps, dtype=float)
+        if rpe is None:
+            reserve = 0
+        else:
+            rpe = np.asarray(rpe, dtype=float)
+            reserve = np.where(np.isnan(rpe), 0, np.clip(10 - rpe, 0, 5))
+        effective = reps + reserve
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            brzycki = load * 36 / (37 - effective)
+            epley = load * (1 + effective / 30)
+        estimate = np.where(effective <= 10, brzycki, epley)
+        return np.where((load > 0) & (reps > 0), estimate, np.nan)
+    
+    def load_for(self, e1rm, reps, rpe):
+        """Load that should land a set of `reps` at `rpe` for a given e1RM (inverse Brzycki/Epley)"""
+        effective = reps + max(0.0, 10 - rpe)
+        if effective <= 10:
+            return e1rm * (37 - effective) / 36
+        return e1rm / (1 + effective / 30)
+    
+    def round_load(self, load):
+        """Round to the nearest plate step (smaller steps for light dumbbell loads)"""
+        step = self.PLATE if load >= 20 else self.SMALL_PLATE
+        return round(load / step) * step
+    
+    def sync(self):
+        """Update the summaries of exercises with newly logged sets"""
+        state = st.session_state.overload
+        size = self.set_log.state['size']
+        
+        if size < state['seen']:
+            state['seen'] = 0
+            state['exercises'] = {}
+            state['deloads'] = {}
+        if size == state['seen']:
+            return state
+        
+        # Only exercises that appear in the new rows need recomputing
+        names = self.set_log.state['names']
+        for code in np.unique(self.set_log.column('exercise')[state['seen']:size]):
+            state['exercises'][names[code]] = self.summarize(names[code])
+            self.track_deload(names[code], state['exercises'][names[code]])
+        
+        state['seen'] = size
+        return state
+    
+    def summarize(self, name):
+        """Per-session best e1RM, top load and reps for one exercise, oldest session first"""
+        history = self.set_log.history(name)
+        sessions, group = np.unique(history['session'], return_inverse=True)
+        count = len(sessions)
+        
+        e1rm = np.full(count, -np.inf)
+        np.maximum.at(e1rm, group, np.nan_to_num(self.e1rm(history['load'], history['reps'], history['rpe']), nan=-np.inf))
+        top_load = np.zeros(count)
+        np.maximum.at(top_load, group, history['load'])
+        best_reps = np.zeros(count)
+        np.maximum.at(best_reps, group, history['reps'])
+        days = np.zeros(count, dtype=np.int64)
+        np.maximum.at(days, group, history['day'])
+        
+        # Sessions ordered by date (back-dated logs can have later session numbers)
+        order = np.argsort(days, kind='stable')
+        
+        # Working sets of the latest session are the ones at its top load
+        last = group == order[-1]
+        working = last & (history['load'] >= top_load[order[-1]])
+        
+        return {
+            'days': days[order],
+            'e1rm': np.where(np.isfinite(e1rm[order]), e1rm[order], np.nan),
+            'top_load': top_load[order],
+            'best_reps': best_reps[order],
+            'last_reps': history['reps'][working].astype(int).tolist(),
+            'last_rpe': history['rpe'][working].tolist(),
+            'last_sets': int(last.sum())
+        }
+    
+    def track_deload(self, name, summary):
+        """Record a deload when an exercise stalls; the rebuild ends once past the old peak or after REBUILD_SESSIONS sessions"""
+        deloads = st.session_state.overload['deloads']
+        deload = deloads.get(name)
+        
+        if deload is not None and not deload['expired']:
+            if self.status(summary, deload) not in ('stalled', 'rebuilding'):
+                del deloads[name]
+            elif len(summary['e1rm']) - deload['sessions'] >= self.REBUILD_SESSIONS:
+                # Kept only to start the stall window at the deload, so the old peak doesn't call for another one straight away
+                deload['expired'] = True
+        
+        deload = deloads.get(name)
+        if (deload is None or deload['expired']) and summary['top_load'][-1] > 0 and self.status(summary, deload) == 'stalled':
+            deloads[name] = {'peak': float(np.fmax.reduce(summary['e1rm'])), 'sessions': len(summary['e1rm']), 'expired': False}
+    
+    def status(self, summary, deload=None):
+        """'new', 'progressing', 'stalled', 'deloading' or 'rebuilding' from the session series and any prescribed deload"""
+        e1rm = summary['e1rm']
+        top_load = summary['top_load']
+        count = len(e1rm)
+        
+        if deload is not None:
+            if count <= deload['sessions']:
+                # The deload hasn't been done yet
+                return 'stalled'
+            # No stall checks until the lifter is past the pre-deload e1RM again or the rebuild has expired
+            if not deload['expired'] and not np.fmax.reduce(e1rm[deload['sessions']:]) > deload['peak'] * (1 + self.STALL_GAIN):
+                return 'rebuilding'
+            if deload['expired']:
+                e1rm = e1rm[deload['sessions']:]
+                top_load = top_load[deload['sessions']:]
+                count = len(e1rm)
+        
+        if count < 2:
+            return 'new'
+        
+        recent_peak = top_load[max(0, count - 5):-1].max()
+        if recent_peak > 0 and top_load[-1] <= self.DELOAD_DROP * recent_peak:
+            return 'deloading'
+        
+        if count > self.STALL_SESSIONS:
+            # fmax skips NaN (sessions without load) and stays NaN only if every session lacks one
+            before = np.fmax.reduce(e1rm[:-self.STALL_SESSIONS])
+            recent = np.fmax.reduce(e1rm[-self.STALL_SESSIONS:])
+            if before > 0 and recent <= before * (1 + self.STALL_GAIN):
+                return 'stalled'
+        
+        return 'progressing'
+    
+    def prescribe(self, name, goal, sets=None):
+        """Next session for an exercise: load, reps, sets, e1RM, status and a note (None without history)"""
+        summary = self.sync()['exercises'].get(name)
+        if summary is None:
+            return None
+        
+        bottom, top, target_rpe = self.REP_RANGES.get(goal, self.REP_RANGES['general_fitness'])
+        top_load = float(summary['top_load'][-1])
+        
+        status = self.status(summary, st.session_state.overload['deloads'].get(name))
+        last_reps = summary['last_reps'] or [0]
+        sets = sets or summary['last_sets']
+        
+        recent = summary['e1rm'][-self.STALL_SESSIONS:]
+        recent = recent[~np.isnan(recent)]
+        e1rm = float(recent.mean()) if len(recent) else None
+        
+        prescription = {'status': status, 'e1rm': round(e1rm, 1) if e1rm else None, 'sets': sets}
+        
+        if top_load <= 0:
+            # Bodyweight: progress reps, then suggest a harder variation
+            reps = int(max(last_reps)) + 1
+            prescription.update(load=0.0, reps=reps,
+                                note="Try a harder variation" if reps > top else f"Aim for {reps} reps")
+        elif status == 'stalled':
+            prescription.update(load=self.round_load(top_load * self.DELOAD_DROP), reps=bottom, sets=max(2, sets - 1),
+                                note=f"No e1RM gain in {self.STALL_SESSIONS} sessions - deload 10% and build back up")
+        elif status in ('deloading', 'rebuilding') and min(last_reps) < top:
+            # Build back up from the lighter load one rep at a time rather than jumping back to the old load
+            reps = min(top, max(bottom, min(last_reps) + 1))
+            prescription.update(load=top_load, reps=reps, note=f"Building back after a deload - aim for {reps} reps")
+        elif min(last_reps) < bottom - 2 or min(last_reps) > top + 2:
+            # Reps far outside this goal's range (e.g. after a goal change): restart from the e1RM
+            load = self.load_for(e1rm, bottom, target_rpe) if e1rm else top_load
+            prescription.update(load=self.round_load(load), reps=bottom, note=f"New rep range {bottom}-{top}")
+        else:
+            rpes = [r for r in summary['last_rpe'] if not np.isnan(r)]
+            hard = rpes and np.mean(rpes) > target_rpe + 1
+            if min(last_reps) >= top and not hard:
+                # Double progression: top of the range on every working set earns more load
+                load = self.round_load(top_load * (1 + self.LOAD_STEP))
+                if load <= top_load:
+                    load = top_load + (self.PLATE if top_load >= 20 else self.SMALL_PLATE)
+                prescription.update(load=load, reps=bottom, note=f"Hit {top} reps on every set - add load")
+            else:
+                reps = min(top, max(bottom, min(last_reps) + (0 if hard else 1)))
+                prescription.update(load=top_load, reps=reps,
+                                    note="Last session was hard - repeat it" if hard else f"Same load, aim for {reps} reps")
+        
+        return prescription
+    
+    def apply(self, plan, goal):
+        """Copy of a weekly plan with logged exercises' loads, reps and sets prescribed from history"""
+        self.sync()
+        updated = []
+        for day in plan:
+            if not day.get('exercises'):
+                updated.append(day)
+                continue
+            
+            exercises = []
+            for exercise in day['exercises']:
+                prescription = self.prescribe(exercise['name'], goal, exercise.get('sets')) if 'reps' in exercise else None
+                if prescription:
+                    exercise = dict(exercise, load=prescription['load'], reps=prescription['reps'],
+                                    sets=prescription['sets'], progression=prescription)
+                exercises.append(exercise)
+            updated.append(dict(day, exercises=exercises))
+        return updated
\ No newline at end of file
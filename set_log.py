@@ -0,0 +1,181 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import to_ordinal, from_ordinal
+from day_tracker import DayTracker
+
+class SetLog:
+    """Set-by-set strength log kept as growable numpy columns, indexed by exercise"""
+    
+    # column -> dtype; exercise is a code into the log's own list of exercise names,
+    # day is a date ordinal, rpe is NaN when not given and duration is in seconds for timed sets
+    COLUMNS = {
+        'exercise': np.int32,
+        'day': np.int32,
+        'session': np.int32,
+        'set': np.int16,
+        'reps': np.int16,
+        'load': np.float32,
+        'rpe': np.float32,
+        'rest': np.int16,
+        'duration': np.int16
+    }
+    
+    def __init__(self):
+        self.initialize_set_data()
+    
+    def initialize_set_data(self):
+        """Initialize set log storage"""
+        if 'set_log' not in st.session_state:
+            st.session_state.set_log = {
+                'size': 0,
+                'sessions': 0,
+                'version': 0,
+                'columns': {name: np.zeros(0, dtype=dtype) for name, dtype in self.COLUMNS.items()},
+                'names': [],
+                'codes': {},
+                'index': {'version': None, 'order': None, 'starts': None}
+            }
+        self.state = st.session_state.set_log
+    
+    def code(self, name):
+        """Code for an exercise name, adding it the first time it is seen"""
+        codes = self.state['codes']
+        if name not in codes:
+            codes[name] = len(self.state['names'])
+            self.state['names'].append(name)
+        return codes[name]
+    
+    def append(self, rows):
+        """Append set rows (dicts with an 'exercise' name and any of the other columns)"""
+        if not rows:
+            return
+        state = self.state
+        size = state['size']
+        length = size + len(rows)
+        
+        capacity = len(state['columns']['exercise'])
+        if length > capacity:
+            # Double the capacity so logging stays amortized O(1) per set
+            new_capacity = max(length, capacity * 2, 256)
+            for name, array in state['columns'].items():
+                grown = np.zeros(new_capacity, dtype=array.dtype)
+                grown[:size] = array[:size]
+                state['columns'][name] = grown
+        
+        # Counts are clipped to their column's range, since storing past it raises and leaves the batch half-written
+        count = lambda name, value: int(np.clip(value or 0, 0, np.iinfo(self.COLUMNS[name]).max))
+        
+        columns = state['columns']
+        for offset, row in enumerate(rows):
+            i = size + offset
+            columns['exercise'][i] = self.code(row['exercise'])
+            columns['day'][i] = row['day']
+            columns['session'][i] = row.get('session', 0)
+            columns['set'][i] = count('set', row.get('set', 1))
+            columns['reps'][i] = count('reps', row.get('reps'))
+            columns['load'][i] = row.get('load') or 0
+            columns['rpe'][i] = np.nan if row.get('rpe') is None else row['rpe']
+            columns['rest'][i] = count('rest', row.get('rest'))
+            columns['duration'][i] = count('duration', row.get('duration'))
+        
+        state['size'] = length
+        state['version'] += 1
+    
+    def log_session(self, sets, when=None):
+        """Log the sets of one workout and return its session number
+        
+        Each set is a dict with 'exercise', 'reps' or 'duration', and optional 'load', 'rpe' and 'rest';
+        set numbers count up per exercise in the order given.
+        """
+        day = to_ordinal((when or DayTracker().now()).strftime('%Y-%m-%d'))
+        self.state['sessions'] += 1
+        session = self.state['sessions']
+        
+        counts = {}
+        rows = []
+        for entry in sets:
+            if not entry.get('exercise') or not (entry.get('reps') or entry.get('duration')):
+                continue
+            counts[entry['exercise']] = counts.get(entry['exercise'], 0) + 1
+            rows.append(dict(entry, day=day, session=session, set=counts[entry['exercise']]))
+        
+        self.append(rows)
+        return session
+    
+    def planned_sets(self, workout_plan):
+        """One row per prescribed set of a planned workout, ready to be edited and logged"""
+        rows = []
+        for exercise in workout_plan.get('exercises', []):
+            # Steady cardio blocks are logged with the workout, not as sets
+            if 'reps' not in exercise and 'duration' not in exercise:
+                continue
+            for _ in range(exercise.get('sets', 1)):
+                rows.append({
+                    'exercise': exercise['name'],
+                    'reps': exercise.get('reps', 0),
+                    'duration': exercise.get('duration', 0),
+                    'load': exercise.get('load', 0.0),
+                    'rpe': None,
+                    'rest': exercise.get('rest', 0)
+                })
+        return rows
+    
+    def column(self, name):
+        """Filled part of a column (a view, not a copy)"""
+        return self.state['columns'][name][:self.state['size']]
+    
+    def build_index(self):
+        """Rows grouped by exercise, rebuilt only after new sets are logged"""
+        index = self.state['index']
+        if index['version'] != self.state['version']:
+            codes = self.column('exercise')
+            # A stable sort keeps each exercise's rows in logging order
+            order = np.argsort(codes, kind='stable')
+            index['order'] = order
+            index['starts'] = np.searchsorted(codes[order], np.arange(len(self.state['names']) + 1))
+            index['version'] = self.state['version']
+        return index
+    
+    def rows(self, name):
+        """Row numbers of an exercise's sets in date order"""
+        code = self.state['codes'].get(name)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        
+        index = self.build_index()
+        rows = index['order'][index['starts'][code]:index['starts'][code + 1]]
+        return rows[np.argsort(self.column('day')[rows], kind='stable')]
+    
+    def history(self, name):
+        """An exercise's sets as a dict of column arrays in date order, with volume (reps x load)"""
+        rows = self.rows(name)
+        history = {column: self.column(column)[rows] for column in self.COLUMNS if column != 'exercise'}
+        history['volume'] = history['reps'] * history['load']
+        return history
+    
+    def daily_summary(self, name):
+        """Per training day for an exercise: days, heaviest load, most reps in a set and total volume"""
+        history = self.history(name)
+        days, group = np.unique(history['day'], return_inverse=True)
+        
+        best_load = np.zeros(len(days), dtype=np.float32)
+        np.maximum.at(best_load, group, history['load'])
+        best_reps = np.zeros(len(days), dtype=np.int16)
+        np.maximum.at(best_reps, group, history['reps'])
+        
+        return {
+            'days': days,
+            'load': best_load,
+            'reps': best_reps,
+            'volume': np.bincount(group, weights=history['volume'], minlength=len(days)),
+            'sets': np.bincount(group, minlength=len(days))
+        }
+    
+    def exercises(self):
+        """Logged exercise names, most sets first"""
+        counts = np.bincount(self.column('exercise'), minlength=len(self.state['names']))
+        return [self.state['names'][code] for code in np.argsort(-counts, kind='stable') if counts[code]]
+    
+    def dates(self, days):
+        """Date strings for an array of day ordinals"""
+        return [from_ordinal(int(day)) for day in days]
\ No newline at end of file
@@ -0,0 +1,217 @@
+import streamlit as st
+import numpy as np
+from body_log import BodyLog
+from daily_rollups import DailyRollups, to_ordinal, from_ordinal
+
+class TDEEEstimator:
+    """Daily energy expenditure learned from logged intake and weight change"""
+    
+    ACTIVITY_MULTIPLIERS = {
+        'Sedentary': 1.2,
+        'Light': 1.375,
+        'Moderate': 1.55,
+        'Active': 1.725,
+        'Very Active': 1.9
+    }
+    
+    GOAL_ADJUSTMENTS = {
+        'weight_loss': -500,
+        'muscle_gain': +300,
+        'endurance': +200,
+        'general_fitness': 0
+    }
+    
+    KCAL_PER_KG = 7700
+    MIN_CALORIES = 1200
+    
+    # Each estimate covers a rolling window of days
+    WINDOW_DAYS = 28
+    MIN_LOGGED_DAYS = 14
+    MIN_WEIGHINS = 4
+    
+    # How quickly the running estimate follows new windows, and how many
+    # windows it needs before it replaces the formula
+    SMOOTHING = 0.15
+    MIN_WINDOWS = 7
+    
+    def __init__(self):
+        self.rollups = DailyRollups()
+        self.initialize_tdee_data()
+    
+    def initialize_tdee_data(self):
+        """Initialize adaptive TDEE state"""
+        if 'tdee_estimates' not in st.session_state:
+            st.session_state.tdee_estimates = self.empty_state()
+    
+    def empty_state(self):
+        """State with no windows estimated yet"""
+        return {
+            'origin': None,
+            'raw': np.zeros(0),
+            'smoothed': np.zeros(0),
+            'valid_windows': np.zeros(0, dtype=int),
+            'rollup_version': -1,
+            'weights': (np.zeros(0, dtype=int), np.zeros(0)),
+            'static': None
+        }
+    
+    def static_tdee(self):
+        """Mifflin-St Jeor BMR times the profile's activity multiplier"""
+        if 'profile_data' not in st.session_state:
+            return 2000
+        
+        personal = st.session_state.profile_data['personal']
+        lifestyle = st.session_state.profile_data.get('lifestyle', {})
+        
+        bmr = 10 * personal['weight'] + 6.25 * personal['height'] - 5 * personal['age']
+        bmr += 5 if personal.get('gender') == 'Male' else -161
+        
+        multiplier = self.ACTIVITY_MULTIPLIERS.get(lifestyle.get('activity_level', 'Moderate'), 1.55)
+        return int(bmr * multiplier)
+    
+    def sync(self):
+        """Re-estimate only the windows touched by new or changed logs"""
+        state = st.session_state.tdee_estimates
+        version = self.rollups.sync()
+        first, last = self.rollups.day_range()
+        yesterday = last - 1
+        
+        dates, weights, _ = BodyLog().history('weight')
+        weight_days = np.array([to_ordinal(d) for d in dates], dtype=int)
+        
+        if state['origin'] != first:
+            # The day axis moved, so everything is re-estimated
+            state.update(self.empty_state())
+            state['origin'] = first
+        
+        # The formula is only the starting point, so it is fixed when estimation starts
+        if state['static'] is None or not len(state['raw']):
+            state['static'] = self.static_tdee()
+        
+        # Earliest day whose intake or weight changed since the last sync
+        dirty = [first + len(state['raw'])]
+        changed = self.rollups.changed_since(state['rollup_version'], first, last)
+        if len(changed):
+            dirty.append(first + changed[0])
+        
+        old_days, old_weights = state['weights']
+        overlap = min(len(old_days), len(weight_days))
+        same = (old_days[:overlap] == weight_days[:overlap]) & np.isclose(old_weights[:overlap], weights[:overlap])
+        if not same.all():
+            # A back-dated reading shifts the old one to a later index, so take the earlier of the two days
+            k = int(np.argmin(same))
+            dirty.append(min(old_days[k], weight_days[k]))
+        elif len(old_days) != len(weight_days):
+            dirty.append(weight_days[overlap] if len(weight_days) > overlap else old_days[overlap])
+        
+        # A change on day d affects every window ending on d .. d + WINDOW_DAYS - 1
+        start = max(first, min(dirty))
+        length = max(yesterday - first + 1, 0)
+        self.resize(state, length)
+        
+        # Pull the intake series once and slice each window out of it
+        window_start = max(first, start - self.WINDOW_DAYS + 1)
+        intake = self.rollups.series('calories_in', window_start, yesterday)
+        logged = self.rollups.series('meal_count', window_start, yesterday) > 0
+        
+        for end in range(start, yesterday + 1):
+            days = slice(max(0, end - self.WINDOW_DAYS + 1 - window_start), end - window_start + 1)
+            state['raw'][end - first] = self.window_estimate(
+                end, intake[days][logged[days]], weight_days, weights, state['static']
+            )
+        
+        self.smooth(state, start - first, state['static'])
+        
+        state['rollup_version'] = version
+        state['weights'] = (weight_days, weights)
+    
+    def resize(self, state, length):
+        """Grow or shrink the per-day arrays to cover `length` days"""
+        for key, fill in (('raw', np.nan), ('smoothed', np.nan), ('valid_windows', 0)):
+            array = state[key]
+            if len(array) < length:
+                state[key] = np.concatenate([array, np.full(length - len(array), fill, dtype=array.dtype)])
+            else:
+                state[key] = array[:length]
+    
+    def window_estimate(self, end, intake, weight_days, weights, static):
+        """Expenditure over the window ending on `end`: mean intake minus the energy stored or lost"""
+        start = end - self.WINDOW_DAYS + 1
+        if len(intake) < self.MIN_LOGGED_DAYS:
+            return np.nan
+        
+        # Days logged far from the typical amount are usually partial or mistyped
+        median = np.median(intake)
+        spread = 1.4826 * np.median(np.abs(intake - median))
+        keep = (intake > 0.4 * median) & (np.abs(intake - median) <= 3.5 * max(spread, 100))
+        if keep.sum() < self.MIN_LOGGED_DAYS:
+            return np.nan
+        
+        lo, hi = np.searchsorted(weight_days, [start, end + 1])
+        slope = self.robust_slope(weight_days[lo:hi], weights[lo:hi])
+        if slope is None:
+            return np.nan
+        
+        estimate = intake[keep].mean() - slope * self.KCAL_PER_KG
+        
+        # Windows implying an implausible expenditure are rejected outright
+        if not 0.6 * static <= estimate <= 1.6 * static:
+            return np.nan
+        return estimate
+    
+    def robust_slope(self, days, weights):
+        """Weight change per day, refitted once without outlying weigh-ins"""
+        if len(days) < self.MIN_WEIGHINS or days.max() - days.min() < self.WINDOW_DAYS / 2:
+            return None
+        
+        x = days - days.mean()
+        slope = (x * (weights - weights.mean())).sum() / (x ** 2).sum()
+        residuals = weights - weights.mean() - slope * x
+        
+        spread = 1.4826 * np.median(np.abs(residuals))
+        keep = np.abs(residuals) <= 3 * max(spread, 0.2)
+        if keep.sum() < self.MIN_WEIGHINS or keep.all():
+            return slope
+        
+        x, y = days[keep] - days[keep].mean(), weights[keep]
+        return (x * (y - y.mean())).sum() / (x ** 2).sum()
+    
+    def smooth(self, state, start, static):
+        """Exponentially smooth the window estimates from index `start`, starting from the formula"""
+        if start > 0:
+            previous = state['smoothed'][start - 1]
+            windows = state['valid_windows'][start - 1]
+        else:
+            previous, windows = float(static), 0
+        
+        for i in range(start, len(state['raw'])):
+            if not np.isnan(state['raw'][i]):
+                previous += self.SMOOTHING * (state['raw'][i] - previous)
+                windows += 1
+            state['smoothed'][i] = previous
+            state['valid_windows'][i] = windows
+    
+    def adaptive_tdee(self):
+        """Learned expenditure, or None until enough windows have been seen"""
+        self.sync()
+        state = st.session_state.tdee_estimates
+        if not len(state['smoothed']) or state['valid_windows'][-1] < self.MIN_WINDOWS:
+            return None
+        return int(round(state['smoothed'][-1]))
+    
+    def get_tdee(self):
+        """Best available expenditure estimate"""
+        return self.adaptive_tdee() or self.static_tdee()
+    
+    def calorie_target(self, goal=None):
+        """Daily calorie target for the user's goal"""
+        if goal is None:
+            goal = st.session_state.get('profile_data', {}).get('goals', {}).get('primary_goal', 'general_fitness')
+        return max(self.MIN_CALORIES, self.get_tdee() + self.GOAL_ADJUSTMENTS.get(goal, 0))
+    
+    def history(self):
+        """Smoothed expenditure per day as (dates, values) for days with a learned estimate"""
+        self.sync()
+        state = st.session_state.tdee_estimates
+        learned = np.flatnonzero(state['valid_windows'] >= self.MIN_WINDOWS)
+        return [from_ordinal(state['origin'] + i) for i in learned], state['smoothed'][learned]
\ No newline at end of file
@@ -0,0 +1,52 @@
+import io
+import os
+import struct
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from activity_import import ActivityImporter
+
+FIT_EPOCH = 631065600
+SEMICIRCLES = 180 / 2 ** 31
+START = datetime(2026, 10, 1, 6, 0, tzinfo=timezone.utc).timestamp() - FIT_EPOCH
+
+
+def fit_file(seconds):
+    """A FIT run where odd seconds use compressed-timestamp records (local type 1)"""
+    body = io.BytesIO()
+    # Local 0: timestamp, lat, lon, heart rate, distance
+    normal = [(253, 4, 0x86), (0, 4, 0x85), (1, 4, 0x85), (3, 1, 0x02), (5, 4, 0x86)]
+    body.write(bytes([0x40, 0, 0]) + struct.pack('<H', 20) + bytes([len(normal)]) + b''.join(bytes(f) for f in normal))
+    # Local 1: the same record without a timestamp field
+    compressed = normal[1:]
+    body.write(bytes([0x41, 0, 0]) + struct.pack('<H', 20) + bytes([len(compressed)]) + b''.join(bytes(f) for f in compressed))
+    
+    for i in range(seconds + 1):
+        stamp = int(START) + i
+        lat = int((51.5 + 0.00003 * i) / SEMICIRCLES)
+        lon = int(-0.12 / SEMICIRCLES)
+        distance = int(i * 3.3 * 100)
+        if i % 2:
+            body.write(bytes([0x80 | (1 << 5) | (stamp & 0x1F)]) + struct.pack('<iiBI', lat, lon, 150, distance))
+        else:
+            body.write(bytes([0x00]) + struct.pack('<IiiBI', stamp, lat, lon, 150, distance))
+    
+    data = body.getvalue()
+    header = struct.pack('<BBHI4s', 12, 0x10, 2100, len(data), b'.FIT')
+    file = io.BytesIO(header + data + b'\0\0')
+    file.name = 'run.fit'
+    return file
+
+
+def test_fit_compressed_timestamps():
+    entry = ActivityImporter().import_file(fit_file(60))
+    
+    assert entry['date'] == '2026-10-01'
+    assert entry['elapsed'] == 1
+    assert abs(entry['distance'] - 0.2) < 0.01
+    # Every record, compressed or not, is one second after the last
+    times = entry['track']['time']
+    assert times[0] == 0 and times[-1] == 60
+    assert all(b > a for a, b in zip(times, times[1:]))
\ No newline at end of file
@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from workout_session import WorkoutSession
+
+PLAN = {'exercises': [
+    {'name': 'Plank', 'sets': 2, 'duration': 60, 'rest': 30},
+    {'name': 'Squat', 'sets': 1, 'reps': 5, 'load': 100.0}
+]}
+
+
+def test_skip_while_paused():
+    session = WorkoutSession()
+    session.start(PLAN, now=1000)
+    session.pause(now=1020)
+    session.skip(now=1100)
+    session.resume(now=1200)
+    
+    # The rest interval starts at the pause, so the 180 s paused are not counted against it
+    assert session.current()['kind'] == 'rest'
+    assert session.remaining(now=1200) == 30
+    assert session.remaining(now=1210) == 20
+
+
+def test_complete_while_paused():
+    session = WorkoutSession()
+    session.start(PLAN, now=1000)
+    session.pause(now=1040)
+    session.complete(now=1100)
+    
+    assert session.state['sets'][0]['duration'] == 40
+    assert session.remaining(now=1100) == 30
+    session.resume(now=1300)
+    assert session.remaining(now=1300) == 30
+    assert session.elapsed(now=1300) == 40
\ No newline at end of file
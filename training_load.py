@@ -0,0 +1,225 @@
+import streamlit as st
+import numpy as np
+from daily_rollups import to_ordinal
+from day_tracker import DayTracker
+
+class TrainingLoad:
+    """Daily training load with acute/chronic EWMAs, acute:chronic ratio, monotony and strain"""
+    
+    ACUTE_DAYS = 7
+    CHRONIC_DAYS = 28
+    
+    # Session RPE (0-10) for the intensity labels; 1-10 ratings are used as they are
+    INTENSITY_RPE = {'Light': 3, 'Moderate': 5, 'Hard': 7, 'Very Hard': 9}
+    DEFAULT_RPE = 5
+    
+    # Banister TRIMP weighting (a, b) per sex: minutes x HRr x a x e^(b x HRr)
+    TRIMP_WEIGHTS = {'male': (0.64, 1.92), 'female': (0.86, 1.67)}
+    
+    # Puts TRIMP roughly on the session-RPE scale so mixed histories stay comparable
+    TRIMP_SCALE = 4.0
+    
+    DEFAULT_RESTING_HR = 60
+    
+    # Acute:chronic ratio zones (upper bound, zone)
+    ZONES = [(0.8, 'low'), (1.3, 'optimal'), (1.5, 'caution'), (float('inf'), 'high')]
+    
+    # Foster: monotony above 2 with high strain is linked to illness and overreaching
+    HIGH_MONOTONY = 2.0
+    
+    # Monotony is capped here, so nearly identical daily loads read the same as identical ones
+    MAX_MONOTONY = HIGH_MONOTONY * 2
+    
+    def __init__(self):
+        self.initialize_load_data()
+    
+    def initialize_load_data(self):
+        """Initialize load arrays"""
+        if 'training_load' not in st.session_state:
+            st.session_state.training_load = self.empty_state()
+    
+    def empty_state(self):
+        """Load state with nothing folded in yet"""
+        return {
+            'seen': 0,
+            'origin': None,
+            'length': 0,
+            'daily': np.zeros(0),
+            'acute': np.zeros(0),
+            'chronic': np.zeros(0),
+            # EWMAs are up to date for the first `valid` days
+            'valid': 0
+        }
+    
+    def athlete(self):
+        """Age, sex and resting heart rate for the TRIMP model"""
+        personal = st.session_state.get('profile_data', {}).get('personal', {})
+        sex = str(personal.get('gender', '')).lower()
+        readings = [r['heart_rate'] for r in st.session_state.get('heart_rate_data', [])[-7:] if r.get('heart_rate')]
+        resting = float(np.median(readings)) if readings else self.DEFAULT_RESTING_HR
+        return float(personal.get('age') or 30), sex if sex in self.TRIMP_WEIGHTS else None, resting
+    
+    def rpe(self, intensity):
+        """Session RPE for an intensity label or 1-10 rating"""
+        if intensity in self.INTENSITY_RPE:
+            return self.INTENSITY_RPE[intensity]
+        if isinstance(intensity, (int, float)) and not isinstance(intensity, bool):
+            return float(np.clip(intensity, 1, 10))
+        return self.DEFAULT_RPE
+    
+    def session_loads(self, entries):
+        """Load of each workout: heart-rate TRIMP when an average is logged, else minutes x session RPE"""
+        minutes = np.array([e.get('duration') or 0 for e in entries], dtype=float)
+        rpe = np.array([self.rpe(e.get('intensity')) for e in entries], dtype=float)
+        heart_rates = np.array([e.get('avg_hr') or np.nan for e in entries], dtype=float)
+        
+        age, sex, resting = self.athlete()
+        # Tanaka estimate of maximum heart rate
+        reserve = (heart_rates - resting) / max(208 - 0.7 * age - resting, 1)
+        weights = [self.TRIMP_WEIGHTS[sex]] if sex else list(self.TRIMP_WEIGHTS.values())
+        with np.errstate(invalid='ignore'):
+            trimp = np.mean([minutes * reserve * a * np.exp(b * reserve) for a, b in weights], axis=0)
+            usable = np.isfinite(trimp) & (reserve > 0)
+        
+        return np.where(usable, trimp * self.TRIMP_SCALE, minutes * rpe)
+    
+    def today_ordinal(self):
+        """Today's ordinal in the user's timezone"""
+        return DayTracker().now().date().toordinal()
+    
+    def sync(self):
+        """Fold workouts logged since the last call into the daily loads and bring the EWMAs up to today"""
+        state = st.session_state.training_load
+        workouts = st.session_state.get('workout_history', [])
+        
+        rows = []
+        for entry in workouts[state['seen']:]:
+            try:
+                rows.append((to_ordinal(entry['date']), entry))
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        # Removed entries or workouts dated before the first day mean starting over
+        if len(workouts) < state['seen'] or (rows and state['origin'] is not None and min(r[0] for r in rows) < state['origin']):
+            state = st.session_state.training_load = self.empty_state()
+            return self.sync()
+        
+        if rows:
+            ordinals = np.array([ordinal for ordinal, _ in rows])
+            if state['origin'] is None:
+                state['origin'] = int(ordinals.min())
+            self.ensure_length(state, int(ordinals.max()) - state['origin'] + 1)
+            
+            index = ordinals - state['origin']
+            np.add.at(state['daily'], index, self.session_loads([entry for _, entry in rows]))
+            state['valid'] = min(state['valid'], int(index.min()))
+        state['seen'] = len(workouts)
+        
+        if state['origin'] is not None:
+            # Rest days up to today still decay the averages
+            self.ensure_length(state, self.today_ordinal() - state['origin'] + 1)
+            self.update_ewma(state)
+        
+        return state
+    
+    def ensure_length(self, state, length):
+        """Grow the day arrays to cover `length` days from the origin"""
+        if length <= state['length']:
+            return
+        
+        if length > len(state['daily']):
+            # Double the capacity so appending new days stays amortized O(1)
+            capacity = max(length, 2 * len(state['daily']), 64)
+            for key in ('daily', 'acute', 'chronic'):
+                grown = np.zeros(capacity)
+                grown[:state['length']] = state[key][:state['length']]
+                state[key] = grown
+        
+        state['length'] = length
+    
+    def update_ewma(self, state):
+        """Recompute the EWMAs from the first stale day onwards"""
+        acute_decay = 2 / (self.ACUTE_DAYS + 1)
+        chronic_decay = 2 / (self.CHRONIC_DAYS + 1)
+        start = state['valid']
+        daily, acute, chronic = state['daily'], state['acute'], state['chronic']
+        
+        a = acute[start - 1] if start else 0.0
+        c = chronic[start - 1] if start else 0.0
+        for i in range(start, state['length']):
+            a += acute_decay * (daily[i] - a)
+            c += chronic_decay * (daily[i] - c)
+            acute[i] = a
+            chronic[i] = c
+        
+        state['valid'] = state['length']
+    
+    def daily_loads(self, days):
+        """Load per day for the last `days` days, oldest first"""
+        state = self.sync()
+        result = np.zeros(days)
+        if state['origin'] is None:
+            return result
+        
+        loads = state['daily'][max(0, state['length'] - days):state['length']]
+        result[days - len(loads):] = loads
+        return result
+    
+    def status(self):
+        """Current loads, ratio, monotony, strain and the advice they add up to"""
+        state = self.sync()
+        week = self.daily_loads(self.ACUTE_DAYS)
+        month = self.daily_loads(self.CHRONIC_DAYS)
+        
+        acute = chronic = ratio = None
+        if state['length']:
+            acute = float(state['acute'][state['length'] - 1])
+            chronic = float(state['chronic'][state['length'] - 1])
+            # The ratio means little until a full chronic window has been logged
+            if state['length'] >= self.CHRONIC_DAYS and chronic > 1:
+                ratio = acute / chronic
+        
+        std = week.std()
+        if std > 0:
+            monotony = min(float(week.mean() / std), self.MAX_MONOTONY)
+        elif week.mean() > 0:
+            # Identical loads every day are as monotonous as a week gets
+            monotony = self.MAX_MONOTONY
+        else:
+            monotony = None
+        strain = float(week.sum() * monotony) if monotony is not None else None
+        
+        zone = next(name for bound, name in self.ZONES if ratio < bound) if ratio is not None else None
+        status = {
+            'week_load': float(week.sum()),
+            'chronic_weekly': float(month.sum() / (self.CHRONIC_DAYS / self.ACUTE_DAYS)),
+            'acute': acute,
+            'chronic': chronic,
+            'ratio': ratio,
+            'zone': zone,
+            'monotony': monotony,
+            'strain': strain
+        }
+        status.update(self.advice(status))
+        return status
+    
+    def advice(self, status):
+        """Rest-day suggestion and message for a load status"""
+        ratio, monotony = status['ratio'], status['monotony']
+        uniform = monotony is not None and monotony >= self.HIGH_MONOTONY
+        
+        if status['zone'] == 'high' or (status['zone'] == 'caution' and uniform):
+            return {'rest_today': True,
+                    'message': f"This week's load is {ratio:.2f}x what you're used to. Take today off or keep it to light mobility."}
+        if status['zone'] == 'caution':
+            return {'rest_today': False,
+                    'message': f"Load is climbing fast ({ratio:.2f}x your usual). Keep today's session shorter and easier."}
+        if uniform:
+            return {'rest_today': False,
+                    'message': f"Your days are very alike (monotony {monotony:.1f}). Make one of the next days a rest or easy day."}
+        if status['zone'] == 'low':
+            return {'rest_today': False,
+                    'message': "You're training well below your usual load, so there's room to build back up."}
+        if status['zone'] == 'optimal':
+            return {'rest_today': False, 'message': "Your training load is in the sweet spot. Keep it up!"}
+        return {'rest_today': False, 'message': f"Keep logging workouts; load ratios need {self.CHRONIC_DAYS} days of history."}
\ No newline at end of file
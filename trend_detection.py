@@ -0,0 +1,228 @@
+import streamlit as st
+import numpy as np
+import bisect
+from daily_rollups import to_ordinal, from_ordinal
+from body_log import BodyLog
+from day_tracker import DayTracker
+from progressive_overload import ProgressiveOverload
+
+class TrendDetector:
+    """Plateau and change-point signals for weight, per-exercise e1RM and endurance speed series"""
+    
+    # Settings per kind of series: regression window in days, minimum points in the
+    # window, flat-slope threshold per week (relative to the mean when 'relative')
+    SETTINGS = {
+        'weight': {'window': 28, 'min_points': 6, 'plateau': 0.2, 'relative': False},
+        'performance': {'window': 42, 'min_points': 4, 'plateau': 0.01, 'relative': True}
+    }
+    
+    # CUSUM allowance and alarm threshold, in residual standard deviations
+    CUSUM_K = 0.5
+    CUSUM_H = 5.0
+    
+    def __init__(self):
+        self.initialize_trend_data()
+    
+    def initialize_trend_data(self):
+        """Initialize trend detection state"""
+        if 'trend_signals' not in st.session_state:
+            st.session_state.trend_signals = {'series': {}, 'workouts_seen': 0}
+    
+    def sync(self):
+        """Feed new weight readings and workouts into their series"""
+        state = st.session_state.trend_signals
+        
+        # Weight: daily readings from the body log (same-day readings get averaged,
+        # so the last processed point may have changed)
+        dates, weights, _ = BodyLog().history('weight')
+        days = np.array([to_ordinal(d) for d in dates], dtype=int)
+        self.update_series('weight', 'Body Weight', 'weight', days, weights, unit='kg')
+        
+        # Strength: best estimated 1RM per session for each exercise in the set log
+        for name, summary in ProgressiveOverload().sync()['exercises'].items():
+            logged = ~np.isnan(summary['e1rm'])
+            self.update_series(f"e1rm:{name}", f"{name} e1RM", 'performance', summary['days'][logged],
+                               summary['e1rm'][logged], unit='kg')
+        
+        # Endurance: average moving speed of distance workouts (imported tracks) per activity
+        workouts = st.session_state.get('workout_history', [])
+        if len(workouts) < state['workouts_seen']:
+            for key in [k for k in state['series'] if k.startswith('speed:')]:
+                del state['series'][key]
+            state['workouts_seen'] = 0
+        
+        for workout in workouts[state['workouts_seen']:]:
+            duration = workout.get('duration') or 0
+            distance = workout.get('distance') or 0
+            activity = workout.get('activity') or workout.get('type')
+            if not activity or duration <= 0 or distance <= 0:
+                continue
+            try:
+                ordinal = to_ordinal(workout['date'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            
+            # Speed rather than pace, so rising means faster like every other performance series
+            speed = distance / duration * 60
+            series = state['series'].setdefault(f"speed:{activity}", self.empty_series(f"{str(activity).title()} speed", 'performance', 'km/h'))
+            if series['days'] and ordinal < series['days'][-1]:
+                # Out-of-order session: replay this series from its sorted points
+                self.reset_series(series, ordinal, speed)
+                continue
+            self.add_point(series, ordinal, speed)
+        
+        state['workouts_seen'] = len(workouts)
+    
+    def empty_series(self, label, kind, unit=''):
+        """State for one tracked series"""
+        return {
+            'label': label,
+            'kind': kind,
+            'unit': unit,
+            'days': [],
+            'values': [],
+            'slopes': [],
+            'cusum': [],
+            'residual_var': [],
+            'change_points': []
+        }
+    
+    def update_series(self, key, label, kind, days, values, unit=''):
+        """Bring a series in line with its source, reprocessing only from the first difference"""
+        series = st.session_state.trend_signals['series'].setdefault(key, self.empty_series(label, kind, unit))
+        processed = len(series['days'])
+        
+        # First point where the stored series and the source disagree
+        overlap = min(processed, len(days))
+        same = (np.array(series['days'][:overlap]) == days[:overlap]) & \
+            np.isclose(np.array(series['values'][:overlap]), values[:overlap])
+        keep = overlap if same.all() else int(np.argmin(same))
+        
+        if keep < processed:
+            self.truncate(series, keep)
+        
+        for day, value in zip(days[keep:], values[keep:]):
+            self.add_point(series, int(day), float(value))
+    
+    def reset_series(self, series, ordinal, value):
+        """Insert an out-of-order point and replay the series"""
+        points = sorted(zip(series['days'] + [ordinal], series['values'] + [value]))
+        self.truncate(series, 0)
+        for day, point in points:
+            self.add_point(series, day, point)
+    
+    def truncate(self, series, length):
+        """Drop everything from point `length` onwards"""
+        for key in ('days', 'values', 'slopes', 'cusum', 'residual_var'):
+            del series[key][length:]
+        series['change_points'] = [i for i in series['change_points'] if i < length]
+    
+    def add_point(self, series, day, value):
+        """Append a point, updating the rolling slope and the CUSUM statistics"""
+        settings = self.SETTINGS[series['kind']]
+        
+        # Only the trailing window matters, so avoid touching older points
+        start = bisect.bisect_right(series['days'], day - settings['window'])
+        days = np.array(series['days'][start:] + [day], dtype=float)
+        values = np.array(series['values'][start:] + [value])
+        
+        # One-step-ahead residual against the fit of the preceding window
+        previous = self.fit(days[:-1], values[:-1], day, settings)
+        s_pos, s_neg = series['cusum'][-1] if series['cusum'] else (0.0, 0.0)
+        residual_var = series['residual_var'][-1] if series['residual_var'] else None
+        
+        if previous is not None:
+            slope, intercept, window_var = previous
+            residual = value - (slope * day + intercept)
+            if residual_var is None:
+                residual_var = window_var
+            z = residual / np.sqrt(residual_var) if residual_var > 0 else 0.0
+            
+            s_pos = max(0.0, s_pos + z - self.CUSUM_K)
+            s_neg = max(0.0, s_neg - z - self.CUSUM_K)
+            if s_pos > self.CUSUM_H or s_neg > self.CUSUM_H:
+                series['change_points'].append(len(series['days']))
+                s_pos = s_neg = 0.0
+            
+            # Slowly adapting estimate of the residual spread
+            residual_var = 0.9 * residual_var + 0.1 * residual ** 2
+        
+        current = self.fit(days, values, day, settings)
+        series['days'].append(day)
+        series['values'].append(value)
+        series['slopes'].append(np.nan if current is None else current[0] * 7)
+        series['cusum'].append((s_pos, s_neg))
+        series['residual_var'].append(residual_var)
+    
+    def fit(self, days, values, end, settings):
+        """Least-squares line over the window ending at `end` as (slope per day, intercept, residual variance)"""
+        in_window = days > end - settings['window']
+        x, y = days[in_window], values[in_window]
+        if len(x) < settings['min_points'] or x.max() - x.min() < settings['window'] / 2:
+            return None
+        
+        x_mean, y_mean = x.mean(), y.mean()
+        spread = ((x - x_mean) ** 2).sum()
+        if spread == 0:
+            return None
+        
+        slope = ((x - x_mean) * (y - y_mean)).sum() / spread
+        intercept = y_mean - slope * x_mean
+        residual_var = ((y - slope * x - intercept) ** 2).sum() / max(len(x) - 2, 1)
+        return slope, intercept, residual_var
+    
+    def get_signals(self):
+        """Structured signals for every series with enough data"""
+        self.sync()
+        today = DayTracker().now().date().toordinal()
+        signals = {}
+        
+        for key, series in st.session_state.trend_signals['series'].items():
+            if not series['slopes'] or np.isnan(series['slopes'][-1]):
+                continue
+            
+            settings = self.SETTINGS[series['kind']]
+            slopes = np.array(series['slopes'])
+            threshold = settings['plateau']
+            if settings['relative']:
+                threshold *= abs(np.mean(series['values'][-settings['min_points']:]))
+            
+            # Plateau length: how long the weekly slope has stayed inside the flat band
+            flat = np.abs(slopes) < threshold
+            plateau_start = None
+            if flat[-1]:
+                breaks = np.flatnonzero(~flat)
+                plateau_start = series['days'][breaks[-1] + 1 if len(breaks) else 0]
+            
+            last_change = series['change_points'][-1] if series['change_points'] else None
+            
+            signals[key] = {
+                'label': series['label'],
+                'kind': series['kind'],
+                'unit': series['unit'],
+                'slope_per_week': float(slopes[-1]),
+                'direction': 'flat' if flat[-1] else ('increasing' if slopes[-1] > 0 else 'decreasing'),
+                'plateau': bool(flat[-1]),
+                'plateau_days': today - plateau_start if plateau_start is not None else 0,
+                'last_change': from_ordinal(series['days'][last_change]) if last_change is not None else None,
+                'change_points': [from_ordinal(series['days'][i]) for i in series['change_points']],
+                'points': len(series['days'])
+            }
+        
+        return signals
+    
+    def weight_signal(self):
+        """Weight signal, with whether it works against the user's goal"""
+        signal = self.get_signals().get('weight')
+        if signal is None:
+            return None
+        
+        goal = st.session_state.get('profile_data', {}).get('goals', {}).get('primary_goal')
+        signal = dict(signal)
+        if goal == 'weight_loss':
+            signal['stalled'] = signal['direction'] != 'decreasing'
+        elif goal == 'muscle_gain':
+            signal['stalled'] = signal['direction'] != 'increasing'
+        else:
+            signal['stalled'] = False
+        return signal
\ No newline at end of file
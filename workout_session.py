@@ -0,0 +1,310 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import time
+from personal_records import PersonalRecords
+
+class WorkoutSession:
+    """Live workout: a work/rest interval state machine driven by the clock, shown in its own fragment"""
+    
+    # The session panel re-checks the clock this often, rerunning only its fragment
+    TICK_SECONDS = 5
+    
+    def __init__(self):
+        self.initialize_session_data()
+    
+    def initialize_session_data(self):
+        """Initialize live session state"""
+        if 'live_session' not in st.session_state:
+            st.session_state.live_session = None
+    
+    @property
+    def state(self):
+        return st.session_state.live_session
+    
+    def build_intervals(self, plan):
+        """Work and rest intervals for every prescribed set, in order"""
+        intervals = []
+        for exercise in plan.get('exercises', []):
+            sets = exercise.get('sets', 1)
+            for number in range(1, sets + 1):
+                if 'minutes' in exercise:
+                    seconds = exercise['minutes'] * 60
+                else:
+                    seconds = exercise.get('duration') or None
+                intervals.append({
+                    'kind': 'work',
+                    'exercise': exercise['name'],
+                    'set': number,
+                    'sets': sets,
+                    'seconds': seconds,
+                    'reps': exercise.get('reps', 0),
+                    'load': exercise.get('load', 0.0),
+                    'rest': exercise.get('rest', 0),
+                    # Steady cardio blocks are logged with the workout, not as sets
+                    'log': 'minutes' not in exercise
+                })
+                if exercise.get('rest'):
+                    intervals.append({'kind': 'rest', 'exercise': exercise['name'], 'seconds': exercise['rest']})
+        
+        # Nothing to rest for after the last set
+        if intervals and intervals[-1]['kind'] == 'rest':
+            intervals.pop()
+        return intervals
+    
+    def start(self, plan, now=None):
+        """Start a live session for a planned workout"""
+        now = now or time.time()
+        st.session_state.live_session = {
+            'plan': plan,
+            'intervals': self.build_intervals(plan),
+            'index': 0,
+            'started': now,
+            'interval_started': now,
+            'paused_at': None,
+            'paused_seconds': 0.0,
+            'sets': [],
+            'logged': False
+        }
+    
+    def active(self):
+        """Whether a session is running and not yet logged"""
+        return self.state is not None and not self.state['logged']
+    
+    def current(self):
+        """Interval in progress, or None once every interval is done"""
+        state = self.state
+        return state['intervals'][state['index']] if state['index'] < len(state['intervals']) else None
+    
+    def upcoming(self):
+        """Interval after the current one, if any"""
+        state = self.state
+        index = state['index'] + 1
+        return state['intervals'][index] if index < len(state['intervals']) else None
+    
+    def frozen(self, now):
+        """The clock as the session sees it: stopped at the pause while paused"""
+        return self.state['paused_at'] if self.state['paused_at'] is not None else now
+    
+    def elapsed(self, now=None):
+        """Seconds trained so far, not counting pauses"""
+        state = self.state
+        return self.frozen(now or time.time()) - state['started'] - state['paused_seconds']
+    
+    def interval_elapsed(self, now=None):
+        """Seconds spent in the current interval, not counting pauses"""
+        return self.frozen(now or time.time()) - self.state['interval_started']
+    
+    def remaining(self, now=None):
+        """Seconds left in a timed interval (None for sets done by reps)"""
+        interval = self.current()
+        if interval is None or not interval['seconds']:
+            return None
+        return interval['seconds'] - self.interval_elapsed(now)
+    
+    def tick(self, now=None):
+        """Close every timed interval whose time ran out, each at the moment it ended"""
+        now = now or time.time()
+        while self.state['paused_at'] is None:
+            remaining = self.remaining(now)
+            if remaining is None or remaining > 0:
+                break
+            self.complete(now + remaining)
+    
+    def complete(self, now=None, reps=None, load=None, rpe=None):
+        """Finish the current interval, recording a work set, and move on"""
+        now = now or time.time()
+        interval = self.current()
+        if interval is None:
+            return
+        
+        if interval['kind'] == 'work' and interval['log']:
+            worked = min(self.interval_elapsed(now), interval['seconds']) if interval['seconds'] else 0
+            self.state['sets'].append({
+                'exercise': interval['exercise'],
+                'reps': interval['reps'] if reps is None else reps,
+                'duration': int(round(worked)),
+                'load': interval['load'] if load is None else load,
+                'rpe': rpe,
+                'rest': interval['rest']
+            })
+        self.advance(now)
+    
+    def complete_from_inputs(self):
+        """Finish the current interval with the reps, load and RPE in its inputs as they are at the click"""
+        index = self.state['index']
+        interval = self.current()
+        if interval is None or interval['seconds']:
+            # Timed sets have no inputs
+            self.complete()
+            return
+        self.complete(reps=st.session_state.get(f"live_reps_{index}"),
+                      load=st.session_state.get(f"live_load_{index}"),
+                      rpe=st.session_state.get(f"live_rpe_{index}"))
+    
+    def skip(self, now=None):
+        """Move on without recording the current interval"""
+        self.advance(now or time.time())
+    
+    def advance(self, now):
+        """Start the next interval; while paused it starts at the pause, so resuming shifts it like any other"""
+        self.state['index'] += 1
+        self.state['interval_started'] = self.frozen(now)
+    
+    def pause(self, now=None):
+        """Stop the clock"""
+        if self.state['paused_at'] is None:
+            self.state['paused_at'] = now or time.time()
+    
+    def resume(self, now=None):
+        """Restart the clock, shifting the current interval by the time spent paused"""
+        state = self.state
+        if state['paused_at'] is None:
+            return
+        paused = (now or time.time()) - state['paused_at']
+        state['paused_seconds'] += paused
+        state['interval_started'] += paused
+        state['paused_at'] = None
+    
+    def finish(self, on_finish, now=None):
+        """Log the session once through on_finish(plan, sets) and return its result"""
+        state = self.state
+        if state['logged']:
+            return None
+        
+        # Duration and calories follow the time actually trained
+        plan = state['plan']
+        minutes = max(1, int(round(self.elapsed(now) / 60)))
+        calories = int(round(plan.get('calories', 0) * minutes / plan['duration'])) if plan.get('duration') else 0
+        result = on_finish(dict(plan, duration=minutes, calories=calories), state['sets'])
+        
+        state['logged'] = True
+        st.session_state.live_session_summary = {
+            'workout': plan['workout'],
+            'minutes': minutes,
+            'calories': calories,
+            'sets': len(state['sets']),
+            'records': result or []
+        }
+        st.session_state.live_session = None
+        return result
+    
+    def discard(self):
+        """Drop the session without logging anything"""
+        st.session_state.live_session = None
+    
+    def timer_html(self, now):
+        """Interval and total clocks that tick in the browser, so the server is not rerun every second
+        
+        Only durations are sent, counted on from when the page loads, so the browser's clock
+        never has to agree with the server's.
+        """
+        state = self.state
+        interval = self.current()
+        paused = state['paused_at'] is not None
+        countdown = bool(interval and interval['seconds'])
+        shown = self.remaining(now) if countdown else (self.interval_elapsed(now) if interval else 0)
+        label = 'REST' if interval and interval['kind'] == 'rest' else ('TIME LEFT' if countdown else 'SET TIME')
+        color = '#FFD93D' if interval and interval['kind'] == 'rest' else '#00FF87'
+        
+        return f"""
+        <div style="display: flex; justify-content: center; gap: 3rem; font-family: sans-serif; color: white;">
+            <div style="text-align: center;">
+                <div style="color: #999999; font-size: 0.8rem;">{label}</div>
+                <div id="interval" style="color: {color}; font-size: 2.5rem; font-weight: bold;">--:--</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="color: #999999; font-size: 0.8rem;">{'PAUSED' if paused else 'TOTAL'}</div>
+                <div id="total" style="color: white; font-size: 2.5rem; font-weight: bold;">--:--</div>
+            </div>
+        </div>
+        <script>
+            const loaded = Date.now();
+            const shown = {shown};
+            const total = {self.elapsed(now)};
+            const paused = {'true' if paused else 'false'};
+            const countdown = {'true' if countdown else 'false'};
+            const format = (s) => {{
+                s = Math.max(0, Math.round(s));
+                return Math.floor(s / 60) + ':' + String(s % 60).padStart(2, '0');
+            }};
+            const draw = () => {{
+                const passed = paused ? 0 : (Date.now() - loaded) / 1000;
+                document.getElementById('interval').textContent = format(countdown ? shown - passed : shown + passed);
+                document.getElementById('total').textContent = format(total + passed);
+            }};
+            draw();
+            if (!paused) setInterval(draw, 250);
+        </script>
+        """
+    
+    def render(self, on_finish):
+        """Render the live session panel if one is running, or the summary of the one just logged"""
+        summary = st.session_state.pop('live_session_summary', None)
+        if summary:
+            st.success(f"✅ {summary['workout']} logged: {summary['minutes']} min, {summary['sets']} sets, ~{summary['calories']} cal")
+            for record in summary['records']:
+                label, unit, _ = PersonalRecords.METRICS[record['metric']]
+                st.success(f"🏆 New PR - {record['exercise']} {label}: {record['value']:g} {unit} (was {record['previous']:g})")
+        
+        if self.active():
+            self.render_live(on_finish)
+    
+    @st.fragment(run_every=TICK_SECONDS)
+    def render_live(self, on_finish):
+        """Session panel; its buttons and clock checks rerun this fragment only"""
+        if not self.active():
+            return
+        
+        now = time.time()
+        self.tick(now)
+        state = self.state
+        interval = self.current()
+        total = len(state['intervals'])
+        
+        st.markdown(f'<div class="section-header">⏱️ LIVE: {state["plan"]["workout"].upper()}</div>', unsafe_allow_html=True)
+        st.progress(min(state['index'] / total, 1.0) if total else 1.0,
+                    text=f"Interval {min(state['index'] + 1, total)} of {total} · {len(state['sets'])} sets logged")
+        components.html(self.timer_html(now), height=100)
+        
+        if interval is None:
+            st.success("🎉 All sets done! Finish to log your workout.")
+        elif interval['kind'] == 'rest':
+            upcoming = self.upcoming()
+            st.markdown(f"**😮‍💨 Rest** · next up: {upcoming['exercise']} (set {upcoming['set']}/{upcoming['sets']})" if upcoming else "**😮‍💨 Rest**")
+        else:
+            target = f"{interval['seconds']}s" if interval['seconds'] else f"{interval['reps']} reps"
+            st.markdown(f"**💪 {interval['exercise']}** · set {interval['set']}/{interval['sets']} · target {target}")
+            if not interval['seconds']:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.number_input("Reps", 0, 200, int(interval['reps']), key=f"live_reps_{state['index']}")
+                with col2:
+                    st.number_input("Load (kg)", 0.0, 500.0, float(interval['load']), 0.5, key=f"live_load_{state['index']}")
+                with col3:
+                    st.number_input("RPE", 0.0, 10.0, None, 0.5, key=f"live_rpe_{state['index']}")
+        
+        # Callbacks change the state before the fragment reruns, so the panel never lags a click behind
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            if interval is not None and interval['kind'] == 'rest':
+                st.button("⏭️ Skip Rest", use_container_width=True, type="primary", key="live_done", on_click=self.skip)
+            elif interval is not None:
+                st.button("✅ Done Early" if interval['seconds'] else "✅ Set Done", use_container_width=True, type="primary",
+                          key="live_done", on_click=self.complete_from_inputs)
+        with col2:
+            if interval is not None and interval['kind'] == 'work':
+                st.button("⏭️ Skip Set", use_container_width=True, key="live_skip", on_click=self.skip)
+        with col3:
+            if state['paused_at'] is None:
+                st.button("⏸️ Pause", use_container_width=True, key="live_pause", on_click=self.pause)
+            else:
+                st.button("▶️ Resume", use_container_width=True, key="live_resume", on_click=self.resume)
+        with col4:
+            if st.button("🏁 Finish", use_container_width=True, key="live_finish"):
+                self.finish(on_finish)
+                # The only full rerun of the session, so history and stats pick up the new workout
+                st.rerun()
+        
+        if st.button("✖ Discard Session", key="live_discard"):
+            self.discard()
+            st.rerun()
\ No newline at end of file